@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: RLE edge-mask decoder.
+
+Compares `flir_one.decoders.edge_rle.decode` against the original
+`struct.iter_unpack` loop, checks both produce identical masks (real
+slices plus odd-length, overflowing and short payloads), and reports the
+speedup on a realistic full-HD mask (Canny edges of a recorded visible
+frame) — the bundled edge slices overflow the image after a few dozen
+runs, so they are too cheap to be representative.
+
+Usage:
+    python benchmarks/bench_edge_rle.py [chunk_dir]
+"""
+
+import struct
+import sys
+import timeit
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flir_one.decoders import edge_rle, visible
+from flir_one.usb import io, slice_types
+from flir_one.utils import msx
+
+
+# ── Reference: original run-by-run decoder ─────────────────────────
+def _reference_decode(buf: bytes, w=edge_rle.W, h=edge_rle.H) -> np.ndarray:
+    pixels = w * h
+    rle_len, = struct.unpack_from("<I", buf, 0)
+    payload = bytes(buf[4:4 + rle_len])
+    if len(payload) & 1:
+        payload += b"\0"
+
+    out = np.empty(pixels, np.bool_)
+    pos, val = 0, False
+    for (run,) in struct.iter_unpack("<H", payload):
+        if pos >= pixels:
+            break
+        end = min(pos + run, pixels)
+        out[pos:end] = val
+        pos = end
+        val = not val
+    if pos < pixels:
+        out[pos:] = False
+    return out.reshape(h, w)
+
+
+def _rle(runs, odd_tail=None) -> bytes:
+    body = struct.pack(f"<{len(runs)}H", *runs)
+    if odd_tail is not None:
+        body += bytes([odd_tail])
+    return struct.pack("<I", len(body)) + body
+
+
+def _encode(mask: np.ndarray) -> bytes:
+    """RLE-encode a bool mask; runs > 65535 are split with 0-length runs."""
+    flat  = mask.ravel().astype(np.int8)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], flat, [1 - flat[-1]]))))
+    runs  = np.diff(np.concatenate(([0], edges))).tolist()
+    out = []
+    for r in runs:
+        while r > 0xFFFF:
+            out += [0xFFFF, 0]
+            r -= 0xFFFF
+        out.append(r)
+    return _rle(out)
+
+
+def _edge_slice(chunk_dir: Path) -> bytes:
+    """Build an edge slice from the first recorded visible frame."""
+    for raw in io.load_chunks(chunk_dir):
+        if slice_types.classify(raw) != "visible":
+            continue
+        res = visible.decode(raw)
+        if res is not None:
+            grey = cv2.cvtColor(res[0], cv2.COLOR_BGR2GRAY)
+            grey = cv2.resize(grey, (edge_rle.W, edge_rle.H))
+            return _encode(cv2.Canny(grey, 50, 150) > 0)
+    raise RuntimeError("no visible frame found")
+
+
+def main() -> int:
+    chunk_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "test_chunks")
+    slices = [bytes(s) for s in io.load_chunks(chunk_dir)
+              if slice_types.classify(s) == "edge_rle"]
+    if not slices:
+        print(f"no edge slices found in {chunk_dir}")
+        return 1
+
+    rng = np.random.default_rng(0)
+    cases = slices + [
+        _rle([5, 7, 0, 3]),                                  # zero-length run
+        _rle([10, 20], odd_tail=9),                          # odd payload
+        _rle([60000] * 40),                                  # overflows image
+        _rle(rng.integers(0, 2000, 3000).tolist()),          # random runs
+        _rle([]) + b"\0\0",                                  # empty payload
+        _edge_slice(chunk_dir),                              # realistic mask
+    ]
+    for raw in cases:
+        if not np.array_equal(edge_rle.decode(raw), _reference_decode(raw)):
+            print("MISMATCH between vectorized and reference decoder")
+            return 1
+    print(f"outputs identical on {len(cases)} slices")
+
+    for raw in cases:
+        full = edge_rle.decode(raw)
+        if not np.array_equal(edge_rle.decode(raw, shape=(120, 160)),
+                              msx._or_block(full, 9, 9) > 0):
+            print("MISMATCH between direct 120×160 decode and OR-downsample")
+            return 1
+    print("direct 120×160 decode matches full decode + OR-downsample")
+
+    full_out = np.ones((edge_rle.H, edge_rle.W), np.bool_)
+    low_out  = np.ones((120, 160), np.bool_)
+    for raw in cases:
+        if not (np.array_equal(edge_rle.decode(raw, out=full_out), edge_rle.decode(raw)) and
+                np.array_equal(edge_rle.decode(raw, shape=(120, 160), out=low_out),
+                               edge_rle.decode(raw, shape=(120, 160)))):
+            print("MISMATCH between out= and allocating decode")
+            return 1
+    print("out= decodes match")
+
+    base = cases[-1]
+    print(f"benchmark slice: {(len(base) - 4) // 2} runs")
+    n = 20
+    t_ref = min(timeit.repeat(lambda: _reference_decode(base), number=n, repeat=3)) / n
+    t_new = min(timeit.repeat(lambda: edge_rle.decode(base), number=n, repeat=3)) / n
+    print(f"reference : {t_ref * 1e3:8.2f} ms/slice")
+    print(f"vectorized: {t_new * 1e3:8.2f} ms/slice")
+    print(f"speedup   : {t_ref / t_new:8.1f}×")
+    t_out = min(timeit.repeat(lambda: edge_rle.decode(base, out=full_out),
+                              number=n, repeat=3)) / n
+    print(f"into out= : {t_out * 1e3:8.2f} ms/slice")
+
+    t_full = min(timeit.repeat(lambda: msx._or_block(edge_rle.decode(base), 9, 9),
+                               number=n, repeat=3)) / n
+    t_low  = min(timeit.repeat(lambda: edge_rle.decode(base, shape=(120, 160)),
+                               number=n, repeat=3)) / n
+    print(f"full decode + 9×9 OR : {t_full * 1e3:8.2f} ms/slice")
+    print(f"direct 120×160 decode: {t_low * 1e3:8.2f} ms/slice")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: thermal → visible fusion.
+
+Checks that an identity `Registration` (cached `cv2.remap`) matches the
+original `cv2.resize` upscale to within remap's 1/32-pixel interpolation
+precision (≤ 4 levels at a full-range edge), that a shifted model
+leaves the visible image untouched outside the thermal field of view,
+and times fusion at full visible resolution against blending at a
+reduced `output_size`, both for a thermal image wider than the visible
+frame (scale > 1) and for one covering only part of it (scale < 1, only
+the covered rectangle is remapped and blended).
+
+Usage:
+    python benchmarks/bench_fuse.py [chunk_dir]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flir_one import Camera
+from flir_one.utils import fuse
+from flir_one.utils.registration import Registration, remap_maps, warp
+
+
+def main() -> int:
+    chunk_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "test_chunks")
+    pairs = [(f.visible, f.thermal) for f in Camera(offline_dir=chunk_dir).stream()
+             if f.visible is not None and f.thermal is not None]
+    if not pairs:
+        print(f"no frames with both images found in {chunk_dir}")
+        return 1
+    vis, raw = pairs[0]
+    vis_h, vis_w = vis.shape[:2]
+
+    colour = fuse._colorize_thermal(raw, "inferno")
+    ref    = cv2.resize(colour, (vis_w, vis_h), interpolation=cv2.INTER_LINEAR)
+    new, roi = warp(colour, Registration(), (vis_w, vis_h))
+    diff = np.abs(ref.astype(int) - new)
+    err  = int(diff.max())
+    if roi != (0, 0, vis_w, vis_h) or err > 4:
+        print(f"identity registration differs from resize by {err}")
+        return 1
+    print(f"identity registration vs cv2.resize: max {err}, "
+          f"mean {diff.mean():.3f} levels")
+
+    shifted = Registration(scale=0.8, offset=(0.05, 0.0))
+    fused   = fuse.fuse_visible_and_thermal(vis, raw, registration=shifted)
+    x0, y0, x1, y1 = remap_maps(shifted, (raw.shape[1], raw.shape[0]),
+                                (vis_w, vis_h))[2]
+    outside = np.ones((vis_h, vis_w), np.bool_)
+    outside[y0:y1, x0:x1] = False
+    if not outside.any() or not np.array_equal(fused[outside], vis[outside]):
+        print("visible image altered outside the thermal field of view")
+        return 1
+    print(f"outside FOV untouched ({outside.mean() * 100:.0f} % of pixels)")
+
+    reg = Registration(scale=1.1, offset=(0.01, -0.02)).at(0.5)
+    n = 50
+    half, quarter = (vis_w // 2, vis_h // 2), (vis_w // 4, vis_h // 4)
+    cases = [
+        ("resize, full res              ", dict()),
+        ("scale 1.1, full res           ", dict(registration=reg)),
+        ("scale 1.1, 1/2 res            ", dict(registration=reg, output_size=half)),
+        ("scale 1.1, 1/4 res            ", dict(registration=reg, output_size=quarter)),
+        ("scale 0.8 + offset, full res  ", dict(registration=shifted)),
+        ("scale 0.8 + offset, 1/2 res   ", dict(registration=shifted, output_size=half)),
+    ]
+    print(f"visible frame: {vis_w}×{vis_h}")
+    for name, kw in cases:
+        t = min(timeit.repeat(lambda: fuse.fuse_visible_and_thermal(vis, raw, **kw),
+                              number=n, repeat=3)) / n
+        print(f"{name}: {t * 1e3:7.2f} ms/frame")
+    t_maps = min(timeit.repeat(lambda: remap_maps.__wrapped__(
+        reg, (raw.shape[1], raw.shape[0]), (vis_w, vis_h)), number=5, repeat=3)) / 5
+    print(f"map build (once per model): {t_maps * 1e3:7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
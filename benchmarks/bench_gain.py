@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: thermal auto-gain.
+
+Compares `flir_one.utils.gain.auto_gain` (histogram percentiles + uint8
+LUT) against the original float32 `np.percentile` stretch from
+`display._build_thermal`, checks both give identical 8-bit images and
+bounds (recorded frames plus synthetic 14-bit scenes, a flat scene and
+a few-value scene), and reports the speedup.
+
+Usage:
+    python benchmarks/bench_gain.py [chunk_dir]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flir_one import Camera
+from flir_one.utils import gain
+
+
+# ── Reference: original per-pixel stretch ──────────────────────────
+def _reference(raw: np.ndarray, cold_pct=2.0, hot_pct=99.5):
+    frame = raw.astype(np.float32)
+    v_min = np.percentile(frame, cold_pct)
+    v_max = np.percentile(frame, hot_pct)
+    if v_max <= v_min:
+        v_max = v_min + 1.0
+    grey = ((frame - v_min) * 255.0 / (v_max - v_min)).clip(0, 255).astype(np.uint8)
+    return grey, v_min, v_max
+
+
+def main() -> int:
+    chunk_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "test_chunks")
+    cam    = Camera(offline_dir=chunk_dir)
+    frames = [f.thermal for f in cam.stream() if f.thermal is not None]
+    if not frames:
+        print(f"no thermal frames found in {chunk_dir}")
+        return 1
+
+    rng = np.random.default_rng(0)
+    synthetic = [rng.integers(0, gain.LEVELS, (60, 80)).astype(np.uint16)
+                 for _ in range(200)]
+    synthetic += [
+        rng.normal(8000, 300, (120, 160)).clip(0, gain.LEVELS - 1).astype(np.uint16)
+        for _ in range(50)]
+    synthetic += [
+        np.full((60, 80), 7321, np.uint16),                  # flat scene
+        rng.choice([100, 101, 9000], (60, 80)).astype(np.uint16),
+    ]
+    cases = frames + synthetic
+
+    pcts = [(2.0, 99.5), (0.0, 100.0), (1.0, 99.0), (5.0, 95.0), (33.3, 66.7)]
+    for raw in cases:
+        for cold, hot in pcts:
+            ref_grey, ref_lo, ref_hi = _reference(raw, cold, hot)
+            grey, lo, hi = gain.auto_gain(raw, cold, hot)
+            if not (np.array_equal(grey, ref_grey) and lo == ref_lo and hi == ref_hi):
+                print(f"MISMATCH at percentiles {cold}/{hot}")
+                return 1
+    print(f"outputs identical on {len(cases)} frames × {len(pcts)} percentile pairs")
+
+    base = frames[0]
+    print(f"benchmark frame: {base.shape[1]}×{base.shape[0]} uint16")
+    n = 2000
+    t_ref = min(timeit.repeat(lambda: _reference(base), number=n, repeat=3)) / n
+    t_new = min(timeit.repeat(lambda: gain.auto_gain(base), number=n, repeat=3)) / n
+    print(f"np.percentile: {t_ref * 1e6:8.1f} µs/frame")
+    print(f"histogram LUT: {t_new * 1e6:8.1f} µs/frame")
+    print(f"speedup      : {t_ref / t_new:8.1f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: VoSPI packet decoder.
+
+Compares `flir_one.decoders.packets.decode` against the original
+per-row Python implementation, checks both produce identical frames
+(including slices with dropped rows), and reports the speedup. Also
+checks and times the `PixelFormat` / `out=` variants.
+
+Usage:
+    python benchmarks/bench_packets.py [chunk_dir]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flir_one.decoders import packets
+from flir_one.usb import io, slice_types
+
+
+# ── Reference: original row-by-row decoder ─────────────────────────
+def _reference_decode(raw: bytes) -> Optional[np.ndarray]:
+    if len(raw) != packets.FRAME_BYTES:
+        return None
+
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    rows: List[Optional[np.ndarray]] = [None] * packets.IMAGE_ROWS
+    for packet in buf.reshape(-1, packets.PACKET_LEN):
+        row_id = ((packet[1] & 0x0F) << 8) | packet[0]
+        if row_id >= packets.IMAGE_ROWS:
+            continue
+        rows[row_id] = np.frombuffer(packet[4:164], dtype="<u2") & 0x3FFF
+
+    missing = [i for i, r in enumerate(rows) if r is None]
+    if len(missing) > 2:
+        return None
+    for idx in missing:
+        prev = next((rows[i] for i in range(idx - 1, -1, -1) if rows[i] is not None), None)
+        nxt  = next((rows[i] for i in range(idx + 1, packets.IMAGE_ROWS) if rows[i] is not None), None)
+        rows[idx] = prev if prev is not None else nxt
+    return np.vstack(rows).astype(np.uint16, copy=False)
+
+
+def _drop_rows(raw: bytes, rows) -> bytes:
+    """Mark the packets of `rows` as discard packets (row-ID 0xFFF)."""
+    buf = bytearray(raw)
+    for r in rows:
+        off = r * packets.PACKET_LEN
+        buf[off:off + 2] = b"\xFF\x0F"
+    return bytes(buf)
+
+
+def _byteswap_payload(raw: bytes) -> bytes:
+    """Return `raw` with every payload word stored big-endian."""
+    pk = np.frombuffer(raw, np.uint8).reshape(-1, packets.PACKET_LEN).copy()
+    pk[:, 4:] = pk[:, 4:].reshape(len(pk), -1, 2)[:, :, ::-1].reshape(len(pk), -1)
+    return pk.tobytes()
+
+
+def _same(a, b) -> bool:
+    if a is None or b is None:
+        return a is b
+    return a.dtype == b.dtype and np.array_equal(a, b)
+
+
+def main() -> int:
+    chunk_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "test_chunks")
+    slices = [bytes(s) for s in io.load_chunks(chunk_dir)
+              if slice_types.classify(s) == "packets"]
+    if not slices:
+        print(f"no packet slices found in {chunk_dir}")
+        return 1
+
+    # include damaged slices: leading, middle, trailing and too many gaps
+    base = next(s for s in slices if len(s) == packets.FRAME_BYTES)
+    cases = slices + [_drop_rows(base, r) for r in
+                      ([0], [0, 1], [30], [29, 31], [59], [58, 59], [1, 2, 3])]
+
+    for raw in cases:
+        if not _same(packets.decode(raw), _reference_decode(raw)):
+            print("MISMATCH between vectorized and reference decoder")
+            return 1
+    print(f"outputs identical on {len(cases)} slices")
+
+    big = packets.PixelFormat(byte_order=">")
+    raw16 = packets.PixelFormat(mask=False)
+    out = np.empty((packets.IMAGE_ROWS, packets.ROW_WORDS), np.uint16)
+    for raw in cases:
+        ref = packets.decode(raw)
+        if len(raw) != packets.FRAME_BYTES:
+            continue
+        if not (_same(packets.decode(_byteswap_payload(raw), big), ref) and
+                (ref is None or _same(packets.decode(raw, raw16) & 0x3FFF, ref)) and
+                (ref is None or _same(packets.decode(raw, out=out), ref))):
+            print("MISMATCH between pixel-format variants")
+            return 1
+    print("pixel-format variants consistent")
+
+    n = 2000
+    t_ref = min(timeit.repeat(lambda: _reference_decode(base), number=n, repeat=5)) / n
+    t_new = min(timeit.repeat(lambda: packets.decode(base), number=n, repeat=5)) / n
+    t_out = min(timeit.repeat(lambda: packets.decode(base, raw16, out), number=n, repeat=5)) / n
+    print(f"reference        : {t_ref * 1e6:8.1f} µs/slice")
+    print(f"vectorized       : {t_new * 1e6:8.1f} µs/slice")
+    print(f"unmasked + out=  : {t_out * 1e6:8.1f} µs/slice")
+    print(f"speedup          : {t_ref / t_new:8.1f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: thermal colorization.
+
+Compares the cached raw→BGR LUT (`palettes.colorize_raw`) against the
+original stretch → `cv2.applyColorMap` → cold-cutoff mask of
+`display._build_thermal` and `fuse._colorize_thermal`. Checks the thermal
+view is identical for every palette, that the fused view's min/max
+stretch differs by at most one palette step (truncation instead of
+`cv2.normalize` rounding), and reports timings for cache hits, misses and
+the uncached path used for per-frame bounds (no `AutoGain`).
+
+Usage:
+    python benchmarks/bench_palettes.py [chunk_dir]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flir_one import Camera
+from flir_one.utils import fuse, gain, palettes
+
+_CMAPS = {
+    "inferno": cv2.COLORMAP_INFERNO,
+    "turbo":   cv2.COLORMAP_TURBO,
+    "hot":     cv2.COLORMAP_HOT,
+    "jet":     cv2.COLORMAP_JET,
+    "rainbow": cv2.COLORMAP_RAINBOW,
+}
+
+
+# ── Reference: original per-frame colorization ─────────────────────
+def _reference_thermal(raw: np.ndarray, cmap=cv2.COLORMAP_INFERNO) -> np.ndarray:
+    grey, _, _ = gain.auto_gain(raw)
+    colour = cv2.applyColorMap(grey, cmap)
+    colour[grey <= 5] = (0, 0, 0)
+    return colour
+
+
+def _reference_fuse(raw: np.ndarray, cmap=cv2.COLORMAP_INFERNO) -> np.ndarray:
+    norm = cv2.normalize(raw, None, 0, 255, cv2.NORM_MINMAX)
+    return cv2.applyColorMap(norm.astype(np.uint8), cmap)
+
+
+def main() -> int:
+    chunk_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "test_chunks")
+    cam    = Camera(offline_dir=chunk_dir)
+    frames = [f.thermal for f in cam.stream() if f.thermal is not None]
+    if not frames:
+        print(f"no thermal frames found in {chunk_dir}")
+        return 1
+
+    rng = np.random.default_rng(0)
+    cases = frames + [
+        rng.normal(8000, 400, (60, 80)).clip(0, gain.LEVELS - 1).astype(np.uint16)
+        for _ in range(50)] + [np.full((60, 80), 5000, np.uint16)]
+
+    for raw in cases:
+        lo, hi = gain.bounds(raw)
+        for name, cmap in _CMAPS.items():
+            ref = _reference_thermal(raw, cmap)
+            if not (np.array_equal(palettes.colorize_raw(raw, name, lo, hi, 5), ref)
+                    and np.array_equal(palettes.colorize_raw(
+                        raw, name, lo, hi, 5, cache=False), ref)):
+                print(f"MISMATCH in thermal view ({name})")
+                return 1
+    print(f"thermal view identical on {len(cases)} frames × {len(_CMAPS)} palettes")
+
+    table = palettes.palette_table("inferno").astype(int)
+    worst = 0
+    for raw in cases:
+        new = fuse._colorize_thermal(raw, "inferno").astype(int)
+        ref = _reference_fuse(raw).astype(int)
+        # each differing pixel must be one palette step away
+        diff = np.flatnonzero((new != ref).any(-1))
+        for i in diff:
+            steps = np.flatnonzero((table == ref.reshape(-1, 3)[i]).all(1)) - \
+                    np.flatnonzero((table == new.reshape(-1, 3)[i]).all(1))[:, None]
+            worst = max(worst, int(np.abs(steps).min()))
+    if worst > 1:
+        print(f"fused view off by {worst} palette steps")
+        return 1
+    print(f"fused view within {worst} palette step of cv2.normalize")
+
+    base = frames[0]
+    lo, hi = gain.bounds(base)
+    n = 2000
+    t_ref = min(timeit.repeat(lambda: _reference_thermal(base), number=n, repeat=3)) / n
+    t_hit = min(timeit.repeat(lambda: palettes.colorize_raw(
+        base, "inferno", *gain.bounds(base), 5), number=n, repeat=3)) / n
+    t_none = min(timeit.repeat(lambda: palettes.colorize_raw(
+        base, "inferno", *gain.bounds(base), 5, cache=False), number=n, repeat=3)) / n
+    build = palettes._colour_lut.__wrapped__
+    t_miss = min(timeit.repeat(lambda: build("inferno", float(lo), float(hi), 5),
+                               number=n, repeat=3)) / n
+    print(f"stretch + applyColorMap + mask: {t_ref * 1e6:8.1f} µs/frame")
+    print(f"bounds + cached LUT gather    : {t_hit * 1e6:8.1f} µs/frame")
+    print(f"bounds + uncached LUT (no AGC): {t_none * 1e6:8.1f} µs/frame")
+    print(f"LUT build on cache miss       : {t_miss * 1e6:8.1f} µs")
+    print(f"speedup (hit)                 : {t_ref / t_hit:8.1f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
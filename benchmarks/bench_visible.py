@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: streaming JPEG reassembler.
+
+Compares `flir_one.decoders.visible.Reassembler` against the original
+grow-and-rescan implementation, checks both return identical JPEG bytes
+and telemetry (including EOI markers split across slices and JPEGs cut
+into many small slices), and reports the speedup.
+
+Usage:
+    python benchmarks/bench_visible.py [chunk_dir]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flir_one.decoders import visible
+from flir_one.usb import io, slice_types
+
+
+# ── Reference: original rescanning reassembler ─────────────────────
+class _ReferenceReassembler:
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._collecting = False
+
+    def push(self, raw: bytes) -> Optional[Tuple[bytes, Optional[dict]]]:
+        if raw[:2] == b"\xFF\xD8":
+            self._buf.clear()
+            self._collecting = True
+        if not self._collecting:
+            return None
+        self._buf.extend(raw)
+        eoi = self._buf.find(b"\xFF\xD9")
+        if eoi == -1:
+            return None
+        jpeg = bytes(self._buf[:eoi + 2])
+        tail = bytes(self._buf[eoi + 2:])
+        self._buf.clear()
+        self._collecting = False
+        return jpeg, visible._extract_telemetry(tail)
+
+
+def _jpegs(slices: List[bytes]) -> List[bytes]:
+    """Group consecutive visible slices into one blob per JPEG."""
+    out: List[bytes] = []
+    for s in slices:
+        if s[:2] == b"\xFF\xD8" or not out:
+            out.append(s)
+        else:
+            out[-1] += s
+    return out
+
+
+def _split(blob: bytes, size: int) -> List[bytes]:
+    return [blob[i:i + size] for i in range(0, len(blob), size)]
+
+
+def _run(reasm, slices) -> list:
+    out = []
+    for s in slices:
+        res = reasm.push(s)
+        if res is not None:
+            out.append((bytes(res[0]), res[1]))
+    return out
+
+
+def main() -> int:
+    chunk_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "test_chunks")
+    slice_types.reset()
+    slices = [bytes(s) for s in io.load_chunks(chunk_dir)
+              if slice_types.classify(s) == "visible"]
+    if not slices:
+        print(f"no visible slices found in {chunk_dir}")
+        return 1
+
+    blobs = _jpegs(slices)
+    cases = {"recorded": slices}
+    for size in (4096, 1000, 257):                 # odd sizes split FF|D9
+        cases[f"{size} B slices"] = [p for b in blobs for p in _split(b, size)]
+    eoi = blobs[0].find(b"\xFF\xD9")               # marker exactly on a boundary
+    cases["split EOI"] = [blobs[0][:eoi + 1], blobs[0][eoi + 1:]]
+
+    for name, case in cases.items():
+        if _run(visible.Reassembler(), case) != _run(_ReferenceReassembler(), case):
+            print(f"MISMATCH between reassemblers ({name})")
+            return 1
+    print(f"outputs identical on {len(cases)} slicings of {len(blobs)} JPEGs")
+
+    n = 20
+    for name in ("recorded", "1000 B slices"):
+        case = cases[name]
+        t_ref = min(timeit.repeat(lambda: _run(_ReferenceReassembler(), case),
+                                  number=n, repeat=5)) / n / len(blobs)
+        t_new = min(timeit.repeat(lambda: _run(visible.Reassembler(), case),
+                                  number=n, repeat=5)) / n / len(blobs)
+        print(f"{name:<14}: reference {t_ref * 1e6:8.1f} µs/JPEG, "
+              f"linear {t_new * 1e6:8.1f} µs/JPEG, speedup {t_ref / t_new:5.1f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
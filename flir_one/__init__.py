@@ -26,5 +26,6 @@ __author__ = "FLIR One Python Contributors"
 __license__ = "MIT"
 
 from .camera import Camera, CameraFrame
+from .group import CameraGroup
 
-__all__ = ["Camera", "CameraFrame", "__version__"]
+__all__ = ["Camera", "CameraFrame", "CameraGroup", "__version__"]
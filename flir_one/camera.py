@@ -23,17 +23,58 @@ Example
 """
 
 from __future__ import annotations
+import collections, itertools, os, threading
 from dataclasses import dataclass
-from typing import Iterator, Optional
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from functools import partial
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 import numpy as np
 
 from .usb import io as usb_io
-from .usb import slice_types, assembler
+from .usb import slice_types, assembler, recording
+from .usb.capture import CaptureThread
+from .usb.index import RecordingIndex
+from .usb.devices import DeviceInfo
+from .pool import FramePool
 from .decoders import packets, visible, telemetry, sync, agc, edge_rle
 from .utils.fps import FPSMeter
 
-__all__ = ["Camera", "CameraFrame"]
+__all__ = ["Camera", "CameraFrame", "CHANNELS", "SEGMENT_BYTES"]
+
+# decoded data per `stream_parallel` work item (sets the default segment size)
+SEGMENT_BYTES = 64 << 20
+
+# public CameraFrame field → slice label that carries it
+CHANNELS = {
+    "thermal":   "packets",
+    "visible":   "visible",
+    "telemetry": "telemetry",
+    "edge_mask": "edge_rle",
+}
+
+
+class _Lazy:
+    """
+    Dataclass field that may hold a zero-argument loader: it is called on
+    first access and its result cached in the `_<name>` instance attribute.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._attr = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return None                      # field default
+        value = getattr(obj, self._attr)
+        if callable(value):                  # deferred decode
+            value = value()
+            setattr(obj, self._attr, value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        setattr(obj, self._attr, value)
 
 
 @dataclass
@@ -48,21 +89,59 @@ class CameraFrame:
     thermal : Optional[np.ndarray]
         Thermal image data (60×80 uint16)
     visible : Optional[np.ndarray]
-        Visible camera image (BGR, varies by camera)
+        Visible camera image (BGR, or grayscale with `visible_gray`)
     telemetry : Optional[telemetry.Telemetry]
         Camera telemetry data
     edge_mask : Optional[np.ndarray]
         Edge mask for MSX overlay
     timestamp : Optional[int]
         Frame timestamp
+
+    Notes
+    -----
+    `visible` and `edge_mask` may be given as zero-argument callables
+    holding the raw JPEG / RLE payload. They are decoded on first
+    attribute access and the result is cached, so consumers that never
+    touch them pay nothing for decoding.
+
+    Frames from `Camera.stream(reuse_buffers=True)` are backed by pooled
+    arrays; call `release()` once done to recycle them.
     """
+
     idx: int
     thermal: Optional[np.ndarray] = None
-    visible: Optional[np.ndarray] = None
+    visible: Optional[np.ndarray] = _Lazy()
     telemetry: Optional[telemetry.Telemetry] = None
-    edge_mask: Optional[np.ndarray] = None
+    edge_mask: Optional[np.ndarray] = _Lazy()
     timestamp: Optional[int] = None
 
+    _release = None             # pool callback, set by Camera.stream
+
+    def resolve(self) -> "CameraFrame":
+        """Run any pending decodes now and return self."""
+        self.visible, self.edge_mask      # lazy fields decode and cache
+        return self
+
+    def release(self) -> None:
+        """
+        Return pooled buffers to the camera's `FramePool`.
+
+        The frame's thermal image and edge mask must not be used
+        afterwards. No-op for frames that do not come from a pool.
+        """
+        if self._release is not None:
+            release, self._release = self._release, None
+            self.thermal = None
+            self._edge_mask = None
+            release()
+
+    def __getstate__(self) -> dict:
+        # loaders (partials, future results) may not pickle: send pixels
+        self.resolve()
+        state = self.__dict__.copy()
+        state.pop("_release", None)
+        return state
+
 
 class Camera:
     """
@@ -71,18 +150,55 @@ class Camera:
     Parameters
     ----------
     offline_dir : Optional[str | Path]
-        Directory containing saved chunks for offline playback.
-        If None, streams from live camera.
+        Binary recording (`*.flrec`) or directory of saved chunks for
+        offline playback. If None, streams from live camera.
     save_chunks : bool
         If True, save raw USB chunks to disk (live mode only)
     chunk_save_dir : Optional[str | Path]
         Directory to save chunks (default: "./chunks")
+    save_format : str
+        "binary" (default) for a single `.flrec` recording, or "hex" for
+        one text file per slice
     repeat : int
         Number of times to repeat offline chunks (default: 1, -1 for infinite)
     vid : int
         USB Vendor ID (default: 0x09CB)
     pid : int
         USB Product ID (default: 0x1996)
+    device : Optional[DeviceInfo | str]
+        Camera to open when several are attached: a `DeviceInfo` from
+        `usb.io.list_devices()`, a serial number or a `"bus-port.port"`
+        location (live mode only, default: the first one found)
+    transfers : int
+        Asynchronous USB transfers kept in flight (live mode only,
+        default: 0 = one synchronous read at a time)
+    capture_thread : bool
+        If True, read USB on a background thread that buffers slices in a
+        preallocated ring, so a slow consumer does not stall the device
+        (live mode only). Counters are available on `camera.capture`.
+    ring_slots : int
+        Number of 32 KiB slots in the capture ring (default: 64)
+    pixel_format : Optional[packets.PixelFormat]
+        Thermal payload encoding (default: little-endian, 14-bit, masked)
+    edge_mask_shape : Optional[Tuple[int, int]]
+        Decode edge masks directly at this (rows, cols) size, e.g.
+        (120, 160) for MSX, instead of the full 1080×1440 mask
+    lazy : bool
+        If True (default), visible JPEGs and edge masks are only decoded
+        when `CameraFrame.visible` / `CameraFrame.edge_mask` is first read
+    visible_scale : int
+        Decode visible JPEGs downscaled by 1 (full size), 2, 4 or 8 in
+        the DCT domain, e.g. 4 gives 360×270 for fusion or previews
+    visible_gray : bool
+        If True, decode visible JPEGs as luminance only (H×W uint8),
+        e.g. for MSX / edge analytics that never need colour
+    decode_threads : int
+        If > 0, complete JPEGs are decoded on a pool of this many threads
+        while the stream keeps going; `CameraFrame.visible` waits for its
+        own decode on first access (default: 0 = decode in the stream loop)
+    max_in_flight : int
+        Maximum number of JPEG decodes queued on the pool; the stream
+        blocks on the oldest one when the limit is reached (default: 4)
     """
 
     def __init__(
@@ -90,24 +206,95 @@ class Camera:
         offline_dir: Optional[str | Path] = None,
         save_chunks: bool = False,
         chunk_save_dir: Optional[str | Path] = None,
+        save_format: str = "binary",
         repeat: int = 1,
         vid: int = 0x09CB,
         pid: int = 0x1996,
+        device: Optional[DeviceInfo | str] = None,
+        transfers: int = 0,
+        capture_thread: bool = False,
+        ring_slots: int = 64,
+        pixel_format: Optional[packets.PixelFormat] = None,
+        edge_mask_shape: Optional[Tuple[int, int]] = None,
+        lazy: bool = True,
+        visible_scale: int = 1,
+        visible_gray: bool = False,
+        decode_threads: int = 0,
+        max_in_flight: int = 4,
     ):
         self.offline_dir = Path(offline_dir) if offline_dir else None
         self.save_chunks = save_chunks
         self.chunk_save_dir = Path(chunk_save_dir or "./chunks")
+        self.save_format = save_format
         self.repeat = repeat
         self.vid = vid
         self.pid = pid
+        self.device = device
+        self.transfers = transfers
+        self.capture_thread = capture_thread
+        self.ring_slots = ring_slots
+        self.capture: Optional[CaptureThread] = None
+        self.pixel_format = pixel_format or packets.DEFAULT_FORMAT
+        self.edge_mask_shape = edge_mask_shape
+        self.lazy = lazy
+        if visible_scale not in visible.SCALES:
+            raise ValueError(f"visible_scale must be one of {visible.SCALES}")
+        self.visible_scale = visible_scale
+        self.visible_gray = visible_gray
+        self._decode_jpeg = partial(visible.decode_jpeg, scale=visible_scale,
+                                    gray=visible_gray)
+        self.decode_threads = decode_threads
+        self.max_in_flight = max(1, max_in_flight)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.frame_pool: Optional[FramePool] = None
+        self._in_flight: Deque[Future] = collections.deque()
 
+        # per-camera stream state: several cameras / replays may run
+        # side by side in one process
+        self._classifier = slice_types.Classifier()
+        self._reassembler = visible.Reassembler()
         self._assembler = assembler.FrameAssembler()
         self._fps_meter = FPSMeter()
+        self._index: Optional[RecordingIndex] = None
+        self._start_offset: Optional[int] = None      # set by seek()
+        self._live_stop: Optional[threading.Event] = None
+        if decode_threads > 0:
+            vis_decode = self._submit_visible
+        else:
+            vis_decode = (self._defer_visible if lazy else
+                          partial(visible.decode, scale=visible_scale,
+                                  gray=visible_gray,
+                                  reassembler=self._reassembler))
+        edge_decode = partial(edge_rle.decode, shape=edge_mask_shape)
+        self._decoders = {
+            "packets": partial(packets.decode, fmt=self.pixel_format),
+            "visible": vis_decode,
+            "telemetry": telemetry.decode,
+            "sync": sync.decode,
+            "agc": agc.decode,
+            "edge_rle": partial(partial, edge_decode) if lazy else edge_decode,
+        }
 
-    def stream(self) -> Iterator[CameraFrame]:
+    def stream(self,
+               channels: Optional[Iterable[str]] = None,
+               reuse_buffers: bool = False) -> Iterator[CameraFrame]:
         """
         Stream frames from the camera.
 
+        Parameters
+        ----------
+        channels : Optional[Iterable[str]]
+            Subset of `CHANNELS` to decode, e.g. {"thermal", "telemetry"}.
+            Slices of other channels are still classified (to keep slice
+            and frame boundaries intact) but never decoded, and the
+            matching `CameraFrame` fields stay None. Default: all.
+        reuse_buffers : bool
+            If True, thermal and edge-mask arrays are decoded into
+            recycled buffers from `camera.frame_pool`. Call
+            `frame.release()` when done with each frame; unreleased
+            frames just cost a fresh allocation. Visible images are still
+            allocated by OpenCV.
+
         Yields
         ------
         CameraFrame
@@ -120,53 +307,334 @@ class Camera:
         >>>     if frame.thermal is not None:
         >>>         # Process thermal data
         >>>         pass
+        >>>
+        >>> # Headless thermal-only capture: no JPEG decoding at all
+        >>> for frame in camera.stream(channels={"thermal", "telemetry"}):
+        >>>     ...
+
+        Raises
+        ------
+        ValueError
+            If `channels` names an unknown channel
         """
+        decoders = self._select_decoders(channels)
+        slot = None
+        if reuse_buffers:
+            # buffer sets hold only the arrays of the selected channels
+            thermal = "packets" in decoders
+            shape = None
+            if "edge_rle" in decoders:
+                shape = tuple(self.edge_mask_shape or (edge_rle.H, edge_rle.W))
+            pool = self.frame_pool
+            if pool is None or (pool.thermal, pool.edge_mask_shape) != (thermal, shape):
+                self.frame_pool = FramePool(edge_mask_shape=shape, thermal=thermal)
+            slot = [self.frame_pool.acquire()]      # frame being assembled
+            decoders = self._pooled_decoders(decoders, slot)
+
         # Get USB slice iterator
         if self.offline_dir:
-            slice_iter = usb_io.load_chunks(self.offline_dir, self.repeat)
+            slice_iter = usb_io.load_chunks(self.offline_dir, self.repeat,
+                                            offset=self._start_offset or 0)
+            if self._start_offset is not None:
+                self._classifier.reset()
+                self._reassembler.reset()
+                self._start_offset = None
         else:
             save_dir = self.chunk_save_dir if self.save_chunks else None
+            self._live_stop = threading.Event()
             slice_iter = usb_io.live_chunks(
                 save_dir=save_dir,
                 vid=self.vid,
-                pid=self.pid
+                pid=self.pid,
+                transfers=self.transfers,
+                save_format=self.save_format,
+                device=self.device,
+                stop=self._live_stop,
             )
+            if self.capture_thread:
+                self.capture = CaptureThread(slice_iter, slots=self.ring_slots,
+                                             stop=self._live_stop)
+                slice_iter = iter(self.capture)
+
+        if self.decode_threads > 0:
+            self._pool = ThreadPoolExecutor(self.decode_threads,
+                                            thread_name_prefix="flir-jpeg")
 
         # Process slices
+        try:
+            yield from self._frames(slice_iter, decoders, slot)
+        finally:
+            if slot is not None:
+                self.frame_pool.release(slot[0])
+            if self.capture is not None:
+                self.capture.stop()
+            if self._pool is not None:
+                # queued decodes still complete for frames already yielded
+                self._pool.shutdown(wait=False)
+                self._pool = None
+                self._in_flight.clear()
+
+    def _frames(self, slice_iter: Iterable, decoders: dict,
+                slot: Optional[list] = None) -> Iterator[CameraFrame]:
+        """Classify, decode and assemble slices into frames."""
         for raw_slice in slice_iter:
-            label = slice_types.classify(raw_slice)
+            label = self._classifier.classify(raw_slice)
 
-            if label == "keep_alive" or label == "unknown":
-                continue
+            decoder = decoders.get(label)
+            if decoder is None:
+                continue             # keep-alive, unknown or unwanted
 
             # Decode the slice
-            decoded = self._decode_slice(label, raw_slice)
+            decoded = decoder(raw_slice)
 
             # Assemble into frame
             frame = self._assembler.push(label, decoded)
 
             if frame is not None:
-                yield self._convert_frame(frame)
+                out = self._convert_frame(frame)
+                if slot is not None:
+                    out._release = partial(self.frame_pool.release, slot[0])
+                    slot[0] = self.frame_pool.acquire()
+                yield out
 
-    def _decode_slice(self, label: str, raw: bytes):
-        """Decode a raw USB slice based on its type."""
-        decoders = {
-            "packets": packets.decode,
-            "visible": visible.decode,
-            "telemetry": telemetry.decode,
-            "sync": sync.decode,
-            "agc": agc.decode,
-            "edge_rle": edge_rle.decode,
-        }
+    def stop(self) -> None:
+        """
+        Interrupt a live `stream()`, e.g. from another thread.
+
+        The stream ends within one USB read timeout and releases the
+        device. No-op for offline playback.
+        """
+        if self._live_stop is not None:
+            self._live_stop.set()
+
+    def _recording_index(self) -> RecordingIndex:
+        """Return (building on first use) the index of the offline recording."""
+        if self.offline_dir is None or not recording.is_recording(self.offline_dir):
+            raise ValueError("seeking requires offline playback of a "
+                             f"{recording.SUFFIX} recording file")
+        if self._index is None:
+            self._index = RecordingIndex.open(self.offline_dir)
+        return self._index
 
-        decoder = decoders.get(label)
-        if decoder:
-            return decoder(raw)
-        return None
+    def seek(self, frame_idx: int) -> None:
+        """
+        Position the next `stream()` call at a given frame.
+
+        The recording is mapped from that frame's first record onward;
+        nothing before it is read or decoded. The sidecar index is built
+        on first use. With `repeat` > 1, later passes restart from the
+        beginning.
+
+        Parameters
+        ----------
+        frame_idx : int
+            Frame number as reported in `CameraFrame.idx` (1-based)
+
+        Raises
+        ------
+        ValueError
+            If the camera is not replaying a `.flrec` recording
+        IndexError
+            If the frame does not exist
+        """
+        self._start_offset = self._recording_index().frame_offset(frame_idx)
+        self._assembler = assembler.FrameAssembler(start_idx=frame_idx)
+
+    def seek_time(self, seconds: float) -> int:
+        """
+        Position the next `stream()` call at a capture time.
+
+        Parameters
+        ----------
+        seconds : float
+            Offset from the first recorded slice, in seconds
+
+        Returns
+        -------
+        int
+            Index of the first frame captured at or after that time
+        """
+        frame_idx = self._recording_index().frame_at_time(seconds)
+        self.seek(frame_idx)
+        return frame_idx
+
+    def stream_parallel(
+        self,
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        segment_frames: Optional[int] = None,
+        channels: Optional[Iterable[str]] = None,
+    ) -> Iterator[CameraFrame]:
+        """
+        Decode an offline recording on several processes.
+
+        The recording is split at sync boundaries into segments of
+        `segment_frames` frames using the sidecar index (see `seek`). Each
+        worker maps only the byte span of its segment and decodes it with
+        fresh stream state, which reproduces sequential decoding exactly.
+        `repeat` is ignored.
+
+        Parameters
+        ----------
+        workers : Optional[int]
+            Worker processes (default: `os.cpu_count()`)
+        ordered : bool
+            If True (default), frames are yielded in recording order;
+            otherwise each segment is yielded as soon as it is done
+        segment_frames : Optional[int]
+            Frames per work item. Decoded segments are pickled back to
+            this process, so the default fits about `SEGMENT_BYTES` of
+            decoded `channels` into one segment (e.g. 10 full-size
+            frames with all channels, ~6300 thermal-only ones)
+        channels : Optional[Iterable[str]]
+            As in `stream`
+
+        Yields
+        ------
+        CameraFrame
+            Fully decoded frames
+
+        Raises
+        ------
+        ValueError
+            If the camera is not replaying a `.flrec` recording
+
+        Examples
+        --------
+        >>> camera = Camera(offline_dir="day.flrec")
+        >>> for frame in camera.stream_parallel(ordered=False):
+        >>>     analyse(frame)
+        """
+        index = self._recording_index()
+        if not len(index):
+            return
+        channels = None if channels is None else sorted(channels)
+        config = dict(
+            pixel_format=self.pixel_format,
+            edge_mask_shape=self.edge_mask_shape,
+            visible_scale=self.visible_scale,
+            visible_gray=self.visible_gray,
+        )
+        count = segment_frames or max(1, SEGMENT_BYTES // self._frame_bytes(channels))
+        first = int(index.frames["idx"][0])
+        todo  = ((self.offline_dir, index.frame_span(start, count), start, count)
+                 for start in range(first, first + len(index), count))
+
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(workers) as pool:
+            pending: Deque[Future] = collections.deque()
+            for segment in itertools.islice(todo, 2 * workers):
+                pending.append(pool.submit(_decode_segment, config, *segment,
+                                           channels))
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                frames = future.result()
+                for segment in itertools.islice(todo, 1):   # keep pool busy
+                    pending.append(pool.submit(_decode_segment, config, *segment,
+                                               channels))
+                yield from frames
+
+    def _frame_bytes(self, channels: Optional[Iterable[str]]) -> int:
+        """Approximate size of one resolved frame with `channels` decoded."""
+        channels = CHANNELS.keys() if channels is None else set(channels)
+        size = 1024                                   # telemetry, bookkeeping
+        if "thermal" in channels:
+            size += packets.IMAGE_ROWS * packets.ROW_WORDS * 2
+        if "visible" in channels:
+            s = self.visible_scale
+            size += (edge_rle.PIXELS // (s * s)) * (1 if self.visible_gray else 3)
+        if "edge_mask" in channels:
+            h, w = self.edge_mask_shape or (edge_rle.H, edge_rle.W)
+            size += h * w
+        return size
+
+    def _pooled_decoders(self, decoders: dict, slot: list) -> dict:
+        """Redirect array-producing decoders into `slot[0]`'s buffers."""
+        decoders = dict(decoders)
+        fmt = self.pixel_format
+        edge_decode = partial(edge_rle.decode, shape=self.edge_mask_shape)
+
+        if "packets" in decoders:
+            decoders["packets"] = lambda raw: packets.decode(raw, fmt, slot[0].thermal)
+        if "edge_rle" in decoders:
+            if self.lazy:       # bind the buffer of the frame being assembled
+                decoders["edge_rle"] = lambda raw: partial(
+                    edge_decode, raw, out=slot[0].edge_mask)
+            else:
+                decoders["edge_rle"] = lambda raw: edge_decode(
+                    raw, out=slot[0].edge_mask)
+        return decoders
+
+    def _select_decoders(self, channels: Optional[Iterable[str]]) -> dict:
+        """Return the label → decoder table for the requested channels."""
+        if channels is None:
+            return self._decoders
+
+        channels = set(channels)
+        unknown = channels - CHANNELS.keys()
+        if unknown:
+            raise ValueError(f"unknown channel(s) {sorted(unknown)}, "
+                             f"expected a subset of {sorted(CHANNELS)}")
+
+        # sync always flows: it is what delimits frames
+        decoders = {"sync": self._decoders["sync"]}
+        for name in channels:
+            label = CHANNELS[name]
+            decoders[label] = self._decoders[label]
+
+        # telemetry may only arrive as the JPEG trailer: keep reassembling
+        # JPEGs for it, but never decode the image
+        if "telemetry" in channels and "visible" not in channels:
+            decoders["visible"] = self._visible_telemetry
+        # …and without the telemetry channel, drop the trailer too
+        elif "visible" in channels and "telemetry" not in channels:
+            vis_decode = decoders["visible"]
+            decoders["visible"] = lambda raw: _image_only(vis_decode(raw))
+        return decoders
+
+    def _visible_telemetry(self, raw: bytes):
+        """Collect a JPEG for its telemetry trailer only, without copying it."""
+        res = self._reassembler.push(raw)
+        if res is None:
+            return None
+        view, tel = res
+        view.release()
+        return (None, tel)
+
+    def _defer_visible(self, raw: bytes):
+        """Reassemble a JPEG but leave decoding to first access."""
+        res = visible.reassemble(raw, self._reassembler)
+        if res is None:
+            return None
+        jpeg, tel = res
+        return (partial(self._decode_jpeg, jpeg), tel)
+
+    def _submit_visible(self, raw: bytes):
+        """Reassemble a JPEG and queue its decode on the thread pool."""
+        res = visible.reassemble(raw, self._reassembler)
+        if res is None:
+            return None
+        jpeg, tel = res
+
+        # bound the queue: drop finished futures, then wait for the oldest
+        while self._in_flight and self._in_flight[0].done():
+            self._in_flight.popleft()
+        if len(self._in_flight) >= self.max_in_flight:
+            wait((self._in_flight.popleft(),))
+
+        future = self._pool.submit(self._decode_jpeg, jpeg)
+        self._in_flight.append(future)
+        return (future.result, tel)
 
     def _convert_frame(self, frame: assembler.Frame) -> CameraFrame:
         """Convert internal Frame to public CameraFrame."""
-        # Handle visible: might be (img, tel) tuple or just img
+        # Handle visible: might be (img, tel) tuple or just img;
+        # img / edge_mask may still be pending decoders (lazy mode)
         vis_img = None
         if frame.visible_img is not None:
             if isinstance(frame.visible_img, tuple):
@@ -193,3 +661,25 @@ class Camera:
             Current FPS (frames per second)
         """
         return self._fps_meter.update()
+
+
+def _image_only(res):
+    """Strip the trailer telemetry from a visible decoder result."""
+    return None if res is None else (res[0], None)
+
+
+def _decode_segment(config: dict, path: Path, span: Tuple[int, int],
+                    start: int, count: int,
+                    channels: Optional[Iterable[str]]) -> list:
+    """
+    Worker for `Camera.stream_parallel`: decode `count` frames from frame
+    `start`, reading only the records in the byte `span` of `path`.
+    """
+    camera = Camera(**config)
+    camera._assembler = assembler.FrameAssembler(start_idx=start)
+    rec = recording.MappedRecording(path, *span)
+    try:
+        frames = camera._frames(iter(rec), camera._select_decoders(channels))
+        return [frame.resolve() for frame in itertools.islice(frames, count)]
+    finally:
+        rec.close()
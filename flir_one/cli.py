@@ -17,6 +17,8 @@ import numpy as np
 from .camera import Camera
 from .utils.display import prepare_displays
 from .utils.fps import FPSMeter
+from .utils.gain import AutoGain
+from .utils.palettes import available as available_palettes
 
 __all__ = ["main"]
 
@@ -68,7 +70,7 @@ Examples:
         "chunk_path",
         nargs="?",
         default=None,
-        help="Directory containing saved chunks (offline mode)"
+        help="Recording file or directory of saved chunks (offline mode)"
     )
     parser.add_argument(
         "--live",
@@ -85,6 +87,41 @@ Examples:
         default="./chunks",
         help="Directory to save/load chunks (default: ./chunks)"
     )
+    parser.add_argument(
+        "--save-format",
+        default="binary",
+        choices=["binary", "hex"],
+        help="Chunk save format: single .flrec recording or hex text files"
+    )
+    parser.add_argument(
+        "--transfers",
+        type=int,
+        default=0,
+        help="Async USB transfers kept in flight (live mode, 0 = sync reads)"
+    )
+    parser.add_argument(
+        "--capture-thread",
+        action="store_true",
+        help="Read USB on a background thread with a ring buffer (live mode)"
+    )
+    parser.add_argument(
+        "--visible-scale",
+        type=int,
+        default=1,
+        choices=[1, 2, 4, 8],
+        help="Decode visible JPEGs downscaled by this factor"
+    )
+    parser.add_argument(
+        "--visible-gray",
+        action="store_true",
+        help="Decode visible JPEGs as grayscale (luminance only)"
+    )
+    parser.add_argument(
+        "--decode-threads",
+        type=int,
+        default=0,
+        help="Decode visible JPEGs on N background threads (0 = inline)"
+    )
     parser.add_argument(
         "--repeat",
         type=int,
@@ -94,7 +131,7 @@ Examples:
     parser.add_argument(
         "--palette",
         default="inferno",
-        choices=["inferno", "turbo", "hot", "jet"],
+        choices=available_palettes(),
         help="Thermal color palette"
     )
     parser.add_argument(
@@ -103,6 +140,18 @@ Examples:
         default=0.4,
         help="Thermal blend alpha for fused view (0.0-1.0)"
     )
+    parser.add_argument(
+        "--agc-smoothing",
+        type=float,
+        default=None,
+        help="Smooth thermal gain over time: EMA weight per frame (0-1]"
+    )
+    parser.add_argument(
+        "--agc-every",
+        type=int,
+        default=1,
+        help="Recompute thermal gain every N frames"
+    )
     parser.add_argument(
         "--no-telemetry",
         action="store_true",
@@ -114,13 +163,21 @@ Examples:
     # Validate arguments
     if not args.live and not args.chunk_path:
         parser.error("Either specify --live or provide a chunk_path")
+    if args.agc_smoothing is not None and not 0.0 < args.agc_smoothing <= 1.0:
+        parser.error("--agc-smoothing must be in (0, 1]")
 
     # Create camera
     print("[FLIR] Initializing camera...")
     if args.live:
         camera = Camera(
             save_chunks=args.save_chunks,
-            chunk_save_dir=args.chunk_dir
+            chunk_save_dir=args.chunk_dir,
+            save_format=args.save_format,
+            transfers=args.transfers,
+            capture_thread=args.capture_thread,
+            visible_scale=args.visible_scale,
+            visible_gray=args.visible_gray,
+            decode_threads=args.decode_threads,
         )
         print("[FLIR] Streaming from live camera")
         if args.save_chunks:
@@ -128,14 +185,17 @@ Examples:
     else:
         chunk_path = Path(args.chunk_path)
         if not chunk_path.exists():
-            print(f"[ERROR] Chunk directory not found: {chunk_path}", file=sys.stderr)
+            print(f"[ERROR] Chunk path not found: {chunk_path}", file=sys.stderr)
             sys.exit(1)
 
         camera = Camera(
             offline_dir=chunk_path,
-            repeat=args.repeat
+            repeat=args.repeat,
+            visible_scale=args.visible_scale,
+            visible_gray=args.visible_gray,
+            decode_threads=args.decode_threads,
         )
-        print(f"[FLIR] Playing back chunks from {chunk_path}/")
+        print(f"[FLIR] Playing back chunks from {chunk_path}")
 
     # FPS meters for each display
     fps_meters = {
@@ -144,6 +204,13 @@ Examples:
         "fused": FPSMeter()
     }
 
+    # Shared AGC for thermal and fused views (default: per-frame stretch)
+    agc = None
+    if args.agc_smoothing is not None or args.agc_every > 1:
+        agc = AutoGain(smoothing=1.0 if args.agc_smoothing is None
+                       else args.agc_smoothing,
+                       every=args.agc_every)
+
     # Telemetry overlay configuration
     telemetry_cfg = {
         "visible": {"single_line": False},
@@ -155,7 +222,8 @@ Examples:
     print("[FLIR] Streaming...")
 
     try:
-        for frame in camera.stream():
+        # no view draws the MSX edge mask: never decode it
+        for frame in camera.stream(channels={"thermal", "visible", "telemetry"}):
             # Build display outputs
             fps_dict = {k: v.update() for k, v in fps_meters.items()}
 
@@ -177,7 +245,7 @@ Examples:
                 packet_img=frame.thermal,
                 agc_img=None,
                 telemetry=frame.telemetry,
-                edge_mask=frame.edge_mask,
+                edge_mask=None,
                 visible_img=frame.visible,
             )
 
@@ -188,6 +256,7 @@ Examples:
                 fps=fps_dict,
                 telemetry_data=telemetry_data,
                 telemetry_show=telemetry_cfg,
+                agc=agc,
             )
 
             # Show available displays
@@ -215,6 +284,9 @@ Examples:
         traceback.print_exc()
         sys.exit(1)
     finally:
+        if camera.capture is not None:
+            print(f"[FLIR] Capture ring: {camera.capture.captured} slices, "
+                  f"{camera.capture.overruns} overruns")
         cv2.destroyAllWindows()
         print("[FLIR] Shutdown complete")
 
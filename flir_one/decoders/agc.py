@@ -13,6 +13,7 @@ padded border pixels.
 """
 
 from __future__ import annotations
+from typing import Optional
 import numpy as np
 
 __all__ = ["decode"]
@@ -21,7 +22,7 @@ _ACTIVE_W, _ACTIVE_H = 160, 120          # real Lepton-3 dimensions
 _PADDED_W, _PADDED_H = 256, 128          # 32,768 B → 256×128
 
 
-def _crop(img: np.ndarray) -> np.ndarray:
+def _crop(img: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Extract center crop from padded image.
 
@@ -29,6 +30,8 @@ def _crop(img: np.ndarray) -> np.ndarray:
     ----------
     img : np.ndarray
         Padded (128, 256) image
+    out : Optional[np.ndarray]
+        (120, 160) uint8 array to copy into (default: a new array)
 
     Returns
     -------
@@ -37,30 +40,41 @@ def _crop(img: np.ndarray) -> np.ndarray:
     """
     y0 = (img.shape[0] - _ACTIVE_H) // 2
     x0 = (img.shape[1] - _ACTIVE_W) // 2
-    return img[y0 : y0 + _ACTIVE_H, x0 : x0 + _ACTIVE_W].copy()
+    crop = img[y0 : y0 + _ACTIVE_H, x0 : x0 + _ACTIVE_W]
+    if out is None:
+        return crop.copy()
+    np.copyto(out, crop)
+    return out
 
 
-def decode(raw: bytes) -> np.ndarray:
+def decode(raw: bytes, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Convert a 32,768-byte AGC slice into a (120, 160) uint8 image.
 
     Parameters
     ----------
     raw : bytes
-        Raw AGC slice data (32,768 bytes)
+        Raw AGC slice data (32,768 bytes, any buffer-protocol object)
+    out : Optional[np.ndarray]
+        (120, 160) uint8 array to decode into; a new array is allocated
+        when omitted
 
     Returns
     -------
     np.ndarray
-        (120, 160) uint8 thermal image
+        (120, 160) uint8 thermal image (`out` if given)
 
     Raises
     ------
     ValueError
-        If slice is not exactly 32,768 bytes
+        If slice is not exactly 32,768 bytes, or `out` has the wrong
+        shape or dtype
     """
     if len(raw) != _PADDED_W * _PADDED_H:
         raise ValueError("AGC slice must be exactly 32,768 bytes")
+    if out is not None and (out.shape != (_ACTIVE_H, _ACTIVE_W)
+                            or out.dtype != np.uint8):
+        raise ValueError("out must be a (120, 160) uint8 array")
 
     padded = np.frombuffer(raw, dtype=np.uint8).reshape(_PADDED_H, _PADDED_W)
-    return _crop(padded)
+    return _crop(padded, out)
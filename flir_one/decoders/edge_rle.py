@@ -9,10 +9,13 @@ Format
 ------
 - 4-byte little-endian length header
 - 16-bit run lengths (alternating 0/1 values)
-- Output: 1080×1440 boolean array
+- Output: 1080×1440 boolean array, or an OR-downsampled mask (e.g.
+  120×160 for MSX) computed directly from the runs
 """
 
 import struct
+from typing import Optional, Tuple
+
 import numpy as np
 
 __all__ = ["decode"]
@@ -21,52 +24,151 @@ W, H = 1440, 1080
 PIXELS = W * H
 
 
-def decode(buf: bytes, w=W, h=H) -> np.ndarray:
+def _runs(buf: bytes) -> np.ndarray:
+    """
+    Return the run lengths of an RLE payload as int64.
+
+    An odd trailing byte is treated as a run whose high byte is zero.
+    """
+    rle_len, = struct.unpack_from("<I", buf, 0)
+    n_bytes = min(rle_len, len(buf) - 4)
+    runs = np.frombuffer(buf, "<u2", count=n_bytes // 2, offset=4).astype(np.int64)
+    if n_bytes & 1:
+        runs = np.append(runs, buf[4 + n_bytes - 1])
+    return runs
+
+
+def _clip(runs: np.ndarray, pixels: int):
+    """
+    Drop runs beyond the image and clip the one that crosses its end.
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        Clipped runs and the number of pixels they cover
+    """
+    ends = np.cumsum(runs)
+    k = int(np.searchsorted(ends, pixels, side="left"))
+    if k < len(runs):
+        runs = runs[:k + 1]
+        runs[k] -= ends[k] - pixels
+        return runs, pixels
+    return runs, int(ends[-1]) if len(ends) else 0
+
+
+def _downsample(runs: np.ndarray, w: int, h: int,
+                shape: Tuple[int, int],
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    OR-downsample the mask described by `runs` straight to `shape`.
+
+    Every 1-run is split at row boundaries into per-row column segments
+    (at most runs + h segments in total). Each segment marks a span of
+    output blocks in a per-block-row difference array, whose cumulative
+    sum is non-zero exactly where some pixel of the block is set.
+    """
+    th, tw = shape
+    if h % th or w % tw:
+        raise ValueError(f"mask {h}×{w} not divisible into {th}×{tw} blocks")
+    fy, fx = h // th, w // tw
+
+    ends   = np.cumsum(runs)
+    starts = ends - runs
+    s, e   = starts[1::2], ends[1::2]        # odd runs are the 1-runs
+    keep   = e > s
+    s, e   = s[keep], e[keep]
+
+    r0, r1 = s // w, (e - 1) // w
+    n_rows = r1 - r0 + 1
+    seg    = np.repeat(np.arange(len(s)), n_rows)
+    first  = np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+    rows   = r0[seg] + (np.arange(len(seg)) - first)
+
+    c0 = np.where(rows == r0[seg], s[seg] % w, 0)
+    c1 = np.where(rows == r1[seg], (e[seg] - 1) % w, w - 1)   # inclusive
+
+    stride = tw + 1
+    base   = (rows // fy) * stride
+    diff   = (np.bincount(base + c0 // fx,     minlength=th * stride) -
+              np.bincount(base + c1 // fx + 1, minlength=th * stride))
+    return np.greater(np.cumsum(diff.reshape(th, stride), axis=1)[:, :tw], 0,
+                      out=out)
+
+
+def _fill(runs: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Paint the 1-runs into a caller-owned boolean mask.
+
+    Only the set pixels are indexed (edge masks are sparse), so no
+    temporary of the full image size is created.
+    """
+    ends = np.cumsum(runs)
+    s, e = (ends - runs)[1::2], ends[1::2]   # odd runs are the 1-runs
+    lens = e - s
+    idx  = np.arange(lens.sum()) + np.repeat(s - (np.cumsum(lens) - lens), lens)
+
+    flat = out.reshape(-1)
+    flat.fill(False)
+    flat[idx] = True
+    return out
+
+
+def decode(buf: bytes, w=W, h=H,
+           shape: Optional[Tuple[int, int]] = None,
+           out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Decode RLE-compressed edge mask.
 
+    Runs alternate between 0 and 1, starting with 0. Runs past the end
+    of the image are ignored and any remainder is zero-padded.
+
     Parameters
     ----------
     buf : bytes
-        Raw RLE-compressed edge mask data
+        Raw RLE-compressed edge mask data (any buffer-protocol object)
     w : int
         Width of output mask (default: 1440)
     h : int
         Height of output mask (default: 1080)
+    shape : Optional[Tuple[int, int]]
+        If given, e.g. (120, 160), return the mask logical-OR
+        down-sampled to this (rows, cols) size, built directly from the
+        runs without materialising the full-resolution mask
+    out : Optional[np.ndarray]
+        Contiguous boolean array of the output shape to decode into,
+        e.g. from a buffer pool; a new array is allocated when omitted
 
     Returns
     -------
     np.ndarray
-        (h, w) boolean array representing edge mask
+        (h, w) — or `shape` — boolean array representing edge mask
+        (`out` if given)
 
     Raises
     ------
     ValueError
-        If buffer is too short to contain valid RLE data
+        If buffer is too short to contain valid RLE data, `shape` does
+        not evenly divide (h, w), or `out` has the wrong shape or dtype
     """
     if len(buf) < 6:
         raise ValueError("edge slice too short")
 
-    rle_len, = struct.unpack_from("<I", buf, 0)
-    payload  = buf[4:4+rle_len]
-
-    # ensure even length so iter_unpack("<H") never fails
-    if len(payload) & 1:
-        payload += b"\0"
-
-    it = struct.iter_unpack("<H", payload)
-    out = np.empty(PIXELS, np.bool_)
-    pos, val = 0, False
-
-    for (run,) in it:
-        if pos >= PIXELS:
-            break                        # ignore overflow padding
-        end = min(pos+run, PIXELS)
-        out[pos:end] = val
-        pos  = end
-        val  = not val
-
-    if pos < PIXELS:                     # pad remainder with zeros
-        out[pos:] = False
+    target = (h, w) if shape is None else tuple(shape)
+    if out is not None and (out.shape != target or out.dtype != np.bool_
+                            or not out.flags.c_contiguous):
+        raise ValueError(f"out must be a contiguous {target} bool array")
+
+    pixels = w * h
+    runs, covered = _clip(_runs(buf), pixels)
+
+    if shape is not None:
+        return _downsample(runs, w, h, shape, out)
+    if out is not None:
+        return _fill(runs, out)
+
+    # alternate 0/1 values, plus a trailing 0-run for the padding
+    vals = np.zeros(len(runs) + 1, np.bool_)
+    vals[1:len(runs):2] = True
+    out = np.repeat(vals, np.append(runs, pixels - covered))
 
     return out.reshape(h, w)
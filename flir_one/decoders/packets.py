@@ -8,7 +8,7 @@ Format
 ------
 Each 164-byte packet carries:
     ┌── 2 B ID ──┬── 2 B CRC ──┬──────── 160 B payload ────────┐
-    │  12-bit row│            │   80 × uint16 (big-endian)     │
+    │  12-bit row│            │  80 × uint16 (little-endian)   │
     └────────────┴────────────┴────────────────────────────────┘
 
 A complete USB slice is 63 packets (60 image rows + 3 telemetry rows)
@@ -18,10 +18,22 @@ Features
 --------
 - Masks out segment bits before using the 12-bit row number
 - Skips the three telemetry packets (row-IDs 60-62)
-- Views payload as big-endian uint16 (full radiometric depth)
+- Views payload as little-endian uint16 and keeps the low 14 bits
 - Fills ≤2 missing rows by copying the nearest neighbor
 - Outputs a (60 × 80) uint16 image
 
+The whole slice is decoded with array operations: row IDs are computed
+for all 63 packets at once and valid payloads are scattered into the
+output in a single indexing step (see `benchmarks/bench_packets.py`).
+
+Pixel Format
+------------
+`PixelFormat` selects byte order, bit depth and whether the unused high
+bits are masked. The common case (all 60 rows present and in order)
+writes straight from the payload view into the output in one pass: a
+single `bitwise_and` when masking, a plain (byte-swapping if needed) copy
+otherwise. Pass `out=` to decode into a caller-owned buffer.
+
 Notes
 -----
 If more than two rows are missing, the function returns None,
@@ -29,7 +41,8 @@ allowing the caller to drop the corrupted frame.
 """
 
 from __future__ import annotations
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 
 # ─────────────────────────────── Constants ─────────────────────────
@@ -40,82 +53,138 @@ TELEMETRY_ROWS   = 3                # 60-62 contain telemetry
 ROWS_PER_SLICE   = IMAGE_ROWS + TELEMETRY_ROWS
 FRAME_BYTES      = ROWS_PER_SLICE * PACKET_LEN   # 10,332 B
 
-__all__ = ["decode"]
+__all__ = ["PixelFormat", "DEFAULT_FORMAT", "decode"]
 
 
-# ─────────────────────────────── Helpers ───────────────────────────
-def _extract_rows(buf: np.ndarray) -> List[Optional[np.ndarray]]:
+@dataclass(frozen=True)
+class PixelFormat:
     """
-    Extract image rows from VoSPI packets.
+    Payload pixel encoding.
 
-    Returns
-    -------
-    List[Optional[np.ndarray]]
-        List of 60 rows, each uint16[80] or None if missing
+    Attributes
+    ----------
+    byte_order : str
+        "<" little-endian (Lepton over USB, default) or ">" big-endian
+    bit_depth : int
+        Significant bits per pixel (default: 14)
+    mask : bool
+        If True, clear bits above `bit_depth` (default: True)
     """
-    rows: List[Optional[np.ndarray]] = [None] * IMAGE_ROWS
+    byte_order : str  = "<"
+    bit_depth  : int  = 14
+    mask       : bool = True
 
-    for packet in buf.reshape(-1, PACKET_LEN):
-        # 12-bit row number; high nibble holds segment/discard flags
-        row_id = ((packet[1] & 0x0F) << 8) | packet[0]
+    def __post_init__(self) -> None:
+        if self.byte_order not in ("<", ">"):
+            raise ValueError(f"byte_order must be '<' or '>', not {self.byte_order!r}")
+        if not 1 <= self.bit_depth <= 16:
+            raise ValueError("bit_depth must be within 1..16")
 
-        # Discard telemetry (60-62) and any stray packets
-        if row_id >= IMAGE_ROWS:
-            continue
+    @property
+    def dtype(self) -> np.dtype:
+        """Payload word dtype."""
+        return np.dtype(self.byte_order + "u2")
 
-        payload = packet[4 : 4 + ROW_WORDS * 2]        # 160 B
-        rows[row_id] = np.frombuffer(payload, dtype="<u2") & 0x3FFF
+    @property
+    def mask_value(self) -> Optional[int]:
+        """Bit mask to apply, or None when no masking is needed."""
+        if not self.mask or self.bit_depth == 16:
+            return None
+        return (1 << self.bit_depth) - 1
 
-    return rows
 
+DEFAULT_FORMAT = PixelFormat()
 
-def _assemble_frame(rows: List[Optional[np.ndarray]]) -> Optional[np.ndarray]:
-    """
-    Assemble rows into a frame, filling ≤2 missing rows.
 
-    Parameters
-    ----------
-    rows : List[Optional[np.ndarray]]
-        List of extracted rows
+# ─────────────────────────────── Helpers ───────────────────────────
+_ROW_RANGE = np.arange(IMAGE_ROWS)
+_IN_ORDER  = np.arange(ROWS_PER_SLICE, dtype=np.uint16).tobytes()
 
-    Returns
-    -------
-    Optional[np.ndarray]
-        (60, 80) uint16 array, or None if too many rows are missing
+
+def _row_ids(raw) -> np.ndarray:
     """
-    missing = [i for i, r in enumerate(rows) if r is None]
-    if len(missing) > 2:
-        return None
+    Return the 12-bit row number of every packet.
 
-    for idx in missing:
-        # prefer the preceding valid line, else the following one
-        prev = next((rows[i] for i in range(idx - 1, -1, -1) if rows[i] is not None), None)
-        nxt  = next((rows[i] for i in range(idx + 1, IMAGE_ROWS) if rows[i] is not None), None)
-        rows[idx] = prev if prev is not None else nxt
+    The ID word is little-endian; its top nibble holds segment/discard
+    flags.
+    """
+    ids = np.ndarray((ROWS_PER_SLICE,), "<u2", buffer=raw,
+                     strides=(PACKET_LEN,))
+    return ids & 0x0FFF
 
-    return np.vstack(rows).astype(np.uint16, copy=False)   # (60, 80) uint16
+
+def _fill_source(present: np.ndarray) -> np.ndarray:
+    """
+    Map every row to the row it should be copied from.
+
+    Missing rows take the nearest preceding valid row, or the nearest
+    following one if no valid row precedes them.
+    """
+    prev = np.maximum.accumulate(np.where(present, _ROW_RANGE, -1))
+    nxt  = np.minimum.accumulate(
+        np.where(present, _ROW_RANGE, IMAGE_ROWS)[::-1])[::-1]
+    return np.where(prev >= 0, prev, nxt)
 
 
 # ─────────────────────────────── Public API ────────────────────────
-def decode(raw: bytes) -> Optional[np.ndarray]:
+def decode(raw: bytes,
+           fmt: PixelFormat = DEFAULT_FORMAT,
+           out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
     """
     Convert one 10,332-byte USB slice into a (60 × 80) uint16 thermal image.
 
     Parameters
     ----------
     raw : bytes
-        Raw USB slice data (10,332 bytes)
+        Raw USB slice data (10,332 bytes, any buffer-protocol object)
+    fmt : PixelFormat
+        Payload encoding (default: little-endian, 14-bit, masked)
+    out : Optional[np.ndarray]
+        Writable (60, 80) uint16 array to decode into; a new array is
+        allocated when omitted
 
     Returns
     -------
     Optional[np.ndarray]
-        (60, 80) uint16 thermal image, or None on length mismatch
-        or too many missing rows
+        (60, 80) uint16 thermal image (`out` if given), or None on
+        length mismatch or too many missing rows
     """
     if len(raw) != FRAME_BYTES:
         return None
 
-    buf   = np.frombuffer(raw, dtype=np.uint8)
-    rows  = _extract_rows(buf)
-    frame = _assemble_frame(rows)
-    return frame
+    if out is None:
+        out = np.empty((IMAGE_ROWS, ROW_WORDS), np.uint16)
+    elif out.shape != (IMAGE_ROWS, ROW_WORDS) or out.dtype != np.uint16:
+        raise ValueError("out must be a (60, 80) uint16 array")
+
+    # strided (63, 80) word view of the payloads – nothing copied yet
+    payload = np.ndarray((ROWS_PER_SLICE, ROW_WORDS), fmt.dtype, buffer=raw,
+                         offset=4, strides=(PACKET_LEN, 2))
+    mask    = fmt.mask_value
+    ids     = _row_ids(raw)
+
+    if ids.tobytes() == _IN_ORDER:
+        # fast path: rows 0-62 in order → one pass straight into `out`
+        if mask is None:
+            np.copyto(out, payload[:IMAGE_ROWS])
+        else:
+            np.bitwise_and(payload[:IMAGE_ROWS], mask, out=out)
+        return out
+
+    # general path: scatter valid rows, then copy neighbours into gaps
+    valid = ids < IMAGE_ROWS                 # drop telemetry (60-62) & strays
+    ids   = ids[valid].astype(np.intp)
+
+    present = np.zeros(IMAGE_ROWS, np.bool_)
+    present[ids] = True
+    if IMAGE_ROWS - np.count_nonzero(present) > 2:
+        return None
+
+    rows = payload[valid]
+    out[ids] = rows if mask is None else rows & mask
+
+    if not present.all():
+        src  = _fill_source(present)
+        gaps = ~present
+        out[gaps] = out[src[gaps]]
+    return out
@@ -23,7 +23,7 @@ def decode(buf: bytes) -> Sync:
     Parameters
     ----------
     buf : bytes
-        28-byte sync marker starting with EFBE
+        28-byte sync marker starting with EFBE (any buffer-protocol object)
 
     Returns
     -------
@@ -38,5 +38,5 @@ def decode(buf: bytes) -> Sync:
     if len(buf) != 28 or buf[:2] != b"\xEF\xBE":
         raise ValueError("not sync")
     # pad to 32 B so Struct can unpack cleanly
-    padded = buf + b"\0" * 4
+    padded = bytes(buf) + b"\0" * 4
     return Sync._make(_FMT.unpack(padded))
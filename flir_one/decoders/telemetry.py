@@ -103,14 +103,14 @@ def decode(buf: bytes) -> T.Optional[Telemetry]:
     Parameters
     ----------
     buf : bytes
-        Raw telemetry slice data
+        Raw telemetry slice data (any buffer-protocol object)
 
     Returns
     -------
     Optional[Telemetry]
         Parsed telemetry data, or None if no valid telemetry found
     """
-    s = _strip_ctl(buf.lstrip(b"\x00").rstrip(b"\x00"))
+    s = _strip_ctl(bytes(buf).lstrip(b"\x00").rstrip(b"\x00"))
     if "{" not in s:
         return None
 
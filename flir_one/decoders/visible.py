@@ -14,88 +14,256 @@ Each USB slice is up to 32,768 bytes:
 Streaming Behavior
 ------------------
 The decoder maintains state across multiple calls:
-- Accumulates bytes until an End-of-Image marker is seen
+- Accumulates bytes until an End-of-Image marker is seen, scanning only
+  the newly arrived bytes (linear in the JPEG size)
 - When a full JPEG is available, returns (image, telemetry)
 - On intermediate fragments, returns None
+
+`reassemble` performs only the byte collection and returns the JPEG
+bytes, so callers can defer `decode_jpeg` until the image is needed.
+
+Reduced Decoding
+----------------
+`scale` of 2, 4 or 8 decodes through `cv2.IMREAD_REDUCED_COLOR_*`, which
+downscales in the DCT domain: a 1440×1080 frame comes out as 720×540,
+360×270 or 180×135 without ever building the full-size image.
+
+`gray=True` decodes luminance only (`cv2.IMREAD_[REDUCED_]GRAYSCALE*`),
+skipping chroma upsampling and colour conversion; the result is a
+single-channel uint8 image at a third of the memory.
 """
 from __future__ import annotations
 from typing import Optional, Tuple
 import cv2, numpy as np, json
 
-__all__ = ["decode"]
+__all__ = ["decode", "reassemble", "decode_jpeg", "reset", "Reassembler", "SCALES"]
+
+# ── imdecode flags per (downscale factor, grayscale) ───────────────
+_READ_FLAGS = {
+    (1, False): cv2.IMREAD_COLOR,
+    (2, False): cv2.IMREAD_REDUCED_COLOR_2,
+    (4, False): cv2.IMREAD_REDUCED_COLOR_4,
+    (8, False): cv2.IMREAD_REDUCED_COLOR_8,
+    (1, True):  cv2.IMREAD_GRAYSCALE,
+    (2, True):  cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    (4, True):  cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    (8, True):  cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+SCALES = (1, 2, 4, 8)
 
-# ── Module-level streaming buffer ──────────────────────────────────
-_buf        = bytearray()
-_collecting = False
+_SOI = b"\xFF\xD8"
+_EOI = b"\xFF\xD9"
+_INITIAL_CAPACITY = 256 * 1024          # typical JPEG: 3 slices, ~80 KiB
 
 
-def _extract_telemetry(tail: bytes) -> Optional[dict]:
+def _extract_telemetry(buf, start: int = 0, end: Optional[int] = None) -> Optional[dict]:
     """
     Extract JSON telemetry from bytes following JPEG data.
 
     Parameters
     ----------
-    tail : bytes
-        Bytes after the JPEG EOI marker
+    buf : bytes | bytearray
+        Buffer holding the bytes after the JPEG EOI marker
+    start, end : int
+        Range of `buf` to search (default: all of it)
 
     Returns
     -------
     Optional[dict]
         Parsed JSON telemetry, or None if not found
     """
-    i = tail.find(b'{')
-    j = tail.find(b'}', i + 1) if i != -1 else -1
+    if end is None:
+        end = len(buf)
+    i = buf.find(b'{', start, end)
+    j = buf.find(b'}', i + 1, end) if i != -1 else -1
     if i != -1 and j != -1:
         try:
-            return json.loads(tail[i:j + 1].decode("ascii", "ignore"))
+            return json.loads(bytes(buf[i:j + 1]).decode("ascii", "ignore"))
         except json.JSONDecodeError:
             pass
     return None
 
 
-def decode(raw: bytes) -> Optional[Tuple[np.ndarray, Optional[dict]]]:
+# ── Streaming reassembler ──────────────────────────────────────────
+class Reassembler:
     """
-    Decode a visible camera slice.
+    Linear-time JPEG reassembler.
+
+    Slices are appended into one preallocated buffer that only grows
+    (by doubling) for unusually large JPEGs, and only the newly appended
+    bytes – plus the last byte before them, in case FF D9 straddles two
+    slices – are searched for the End-of-Image marker.
+
+    Parameters
+    ----------
+    capacity : int
+        Initial buffer size in bytes (default: 256 KiB)
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        self._buf = bytearray(capacity)
+        self._len = 0
+        self._collecting = False
+
+    def reset(self) -> None:
+        """Discard any partially collected JPEG."""
+        self._len = 0
+        self._collecting = False
+
+    def _append(self, raw) -> None:
+        n   = len(raw)
+        end = self._len + n
+        if end > len(self._buf):
+            # fresh allocation instead of an in-place resize, so views
+            # handed out for the previous JPEG never block growth
+            grown = bytearray(max(end, 2 * len(self._buf)))
+            grown[:self._len] = memoryview(self._buf)[:self._len]
+            self._buf = grown
+        self._buf[self._len:end] = raw
+        self._len = end
+
+    def push(self, raw) -> Optional[Tuple[memoryview, Optional[dict]]]:
+        """
+        Add a visible slice.
+
+        Parameters
+        ----------
+        raw : bytes
+            Raw USB slice data (any buffer-protocol object)
+
+        Returns
+        -------
+        Optional[Tuple[memoryview, Optional[dict]]]
+            (JPEG view, telemetry dict) once the EOI marker arrives, else
+            None. The view points into the internal buffer and is only
+            valid until the next `push`; copy it to keep it longer.
+        """
+        # A new JPEG always starts with FF D8
+        if raw[:2] == _SOI:
+            self._len = 0
+            self._collecting = True
+
+        if not self._collecting:
+            return None                # not inside a JPEG
+
+        scan_from = max(self._len - 1, 0)
+        self._append(raw)
+        eoi = self._buf.find(_EOI, scan_from, self._len)
+        if eoi == -1:
+            return None                # need more data
+
+        # ── Carve out the payloads ─────────────────────────────────
+        end = self._len
+        tel = _extract_telemetry(self._buf, eoi + 2, end)
+        self._len = 0
+        self._collecting = False
+        return (memoryview(self._buf)[:eoi + 2], tel)
+
+
+# ── Module-level streaming state ───────────────────────────────────
+# shared default for single-stream callers; pass a Reassembler per stream
+# when several cameras or replays run in one process
+_state = Reassembler()
+
+
+def reset() -> None:
+    """Discard any partially collected JPEG."""
+    _state.reset()
+
+
+def reassemble(raw: bytes,
+               reassembler: Optional[Reassembler] = None,
+               ) -> Optional[Tuple[bytes, Optional[dict]]]:
+    """
+    Collect a visible camera slice without decoding the JPEG.
 
     Parameters
     ----------
     raw : bytes
-        Raw USB slice data (up to 32,768 bytes)
+        Raw USB slice data (up to 32,768 bytes, any buffer-protocol object)
+    reassembler : Optional[Reassembler]
+        Per-stream state (default: shared module-level instance)
 
     Returns
     -------
-    Optional[Tuple[np.ndarray, Optional[dict]]]
-        Tuple of (BGR image, telemetry dict) when complete JPEG is
-        received, or None if still accumulating data
+    Optional[Tuple[bytes, Optional[dict]]]
+        Tuple of (JPEG bytes, telemetry dict) when a complete JPEG is
+        received, or None if still accumulating data. The JPEG is the
+        only copy made.
     """
-    global _buf, _collecting
+    res = (reassembler or _state).push(raw)
+    if res is None:
+        return None
+    view, tel = res
+    return (bytes(view), tel)
 
-    # A new JPEG always starts with FF D8
-    if raw.startswith(b"\xFF\xD8"):
-        _buf.clear()
-        _collecting = True
 
-    if not _collecting:
-        return None                # not inside a JPEG
+def _read_flag(scale: int, gray: bool) -> int:
+    try:
+        return _READ_FLAGS[scale, bool(gray)]
+    except KeyError:
+        raise ValueError(f"scale must be one of {SCALES}, got {scale}") from None
 
-    _buf.extend(raw)
-    eoi = _buf.find(b"\xFF\xD9")   # first End-of-Image
-    if eoi == -1:
-        return None                # need more data
 
-    # ── Carve out the payloads ─────────────────────────────────────
-    jpeg_bytes = bytes(_buf[:eoi + 2])          # include FF D9
-    tail       = bytes(_buf[eoi + 2:])          # possible telemetry
+def decode_jpeg(jpeg: bytes, scale: int = 1, gray: bool = False) -> Optional[np.ndarray]:
+    """
+    Decode complete JPEG bytes into a BGR (or grayscale) image.
 
-    # reset for next JPEG
-    _buf.clear()
-    _collecting = False
+    Parameters
+    ----------
+    jpeg : bytes
+        Complete JPEG (FF D8 … FF D9), any buffer-protocol object
+    scale : int
+        Downscale factor: 1 (full size), 2, 4 or 8
+    gray : bool
+        If True, decode luminance only into a single-channel image
 
-    # decode JPEG
-    arr = np.frombuffer(jpeg_bytes, dtype=np.uint8)
-    img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-    if img is None:
+    Returns
+    -------
+    Optional[np.ndarray]
+        BGR (H×W×3) or grayscale (H×W) image, or None if the JPEG is corrupt
+
+    Raises
+    ------
+    ValueError
+        If `scale` is not supported
+    """
+    return cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8),
+                        _read_flag(scale, gray))
+
+
+def decode(raw: bytes,
+           scale: int = 1,
+           gray: bool = False,
+           reassembler: Optional[Reassembler] = None,
+           ) -> Optional[Tuple[np.ndarray, Optional[dict]]]:
+    """
+    Decode a visible camera slice.
+
+    Parameters
+    ----------
+    raw : bytes
+        Raw USB slice data (up to 32,768 bytes, any buffer-protocol object)
+    scale : int
+        Downscale factor: 1 (full size), 2, 4 or 8
+    gray : bool
+        If True, decode luminance only
+    reassembler : Optional[Reassembler]
+        Per-stream state (default: shared module-level instance)
+
+    Returns
+    -------
+    Optional[Tuple[np.ndarray, Optional[dict]]]
+        Tuple of (BGR image, telemetry dict) when complete JPEG is
+        received, or None if still accumulating data
+    """
+    res = (reassembler or _state).push(raw)
+    if res is None:
         return None
 
-    tel = _extract_telemetry(tail)
+    view, tel = res
+    img = decode_jpeg(view, scale, gray)           # zero-copy
+    view.release()
+    if img is None:
+        return None
     return (img, tel)
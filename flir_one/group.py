@@ -0,0 +1,217 @@
+"""
+Multi-camera capture for FLIR One Pro.
+
+Runs several `Camera` streams side by side – one capture thread per
+device – and yields time-aligned tuples with one frame from each camera.
+
+Example
+-------
+>>> from flir_one import CameraGroup
+>>>
+>>> group = CameraGroup(capture_thread=True)      # every attached unit
+>>> for frames in group:
+>>>     for dev, frame in zip(group.devices, frames):
+>>>         print(dev, frame.idx, frame.thermal.shape)
+>>> print(group.dropped, group.unmatched)
+
+Alignment
+---------
+Each frame is stamped with its arrival time (`time.monotonic()`) when its
+capture thread receives it. A tuple is emitted once every camera has a
+queued frame and all queued heads lie within `tolerance` seconds of the
+newest one; heads older than that have no partner and are discarded
+(`unmatched`). Each camera queues at most `max_queued` frames; when the
+consumer falls behind the oldest queued frame is dropped (`dropped`).
+"""
+from __future__ import annotations
+
+import collections, sys, threading, time
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple
+
+from .camera import Camera, CameraFrame
+from .usb import io as usb_io
+from .usb.devices import DeviceInfo
+
+__all__ = ["CameraGroup"]
+
+_WAIT_S = 0.1                           # consumer wake-up interval
+
+
+class CameraGroup:
+    """
+    Time-aligned capture from several cameras.
+
+    Parameters
+    ----------
+    cameras : Optional[Sequence[Camera]]
+        Cameras to run. Default: one live `Camera` per attached device,
+        built with `camera_kwargs`.
+    tolerance : float
+        Maximum arrival-time spread within one tuple, in seconds
+        (default: 0.05, under half a thermal frame period)
+    max_queued : int
+        Frames buffered per camera before the oldest is dropped (default: 8)
+    **camera_kwargs
+        Passed to every `Camera` when `cameras` is None. With
+        `save_chunks`, each camera records into its own sub-directory of
+        `chunk_save_dir` named after its serial number or location.
+
+    Attributes
+    ----------
+    devices : List[Optional[DeviceInfo | str]]
+        Device of each camera (None for offline cameras)
+    dropped : List[int]
+        Per camera: frames discarded because its queue was full
+    unmatched : List[int]
+        Per camera: frames discarded for lack of partners within `tolerance`
+
+    Raises
+    ------
+    RuntimeError
+        If `cameras` is None and no camera is attached
+    ValueError
+        If `cameras` is empty, or `device` is given in `camera_kwargs`
+        (pass `cameras` to choose devices)
+    """
+
+    def __init__(self,
+                 cameras: Optional[Sequence[Camera]] = None,
+                 *,
+                 tolerance: float = 0.05,
+                 max_queued: int = 8,
+                 **camera_kwargs) -> None:
+        if cameras is None:
+            cameras = self._open_attached(**camera_kwargs)
+        if not cameras:
+            raise ValueError("CameraGroup needs at least one camera")
+
+        self.cameras   = list(cameras)
+        self.devices: List[Optional[DeviceInfo | str]] = [
+            cam.device for cam in self.cameras]
+        self.tolerance = tolerance
+
+        n = len(self.cameras)
+        self._queues: List[Deque[Tuple[float, CameraFrame]]] = [
+            collections.deque(maxlen=max_queued) for _ in range(n)]
+        self._done   = [False] * n
+        self._cond   = threading.Condition()
+        self._stop   = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._threads = [
+            threading.Thread(target=self._run, args=(i,),
+                             name=f"flir-group-{i}", daemon=True)
+            for i in range(n)]
+
+        self.dropped   = [0] * n
+        self.unmatched = [0] * n
+
+    @staticmethod
+    def _open_attached(**camera_kwargs) -> List[Camera]:
+        if "device" in camera_kwargs:
+            raise ValueError("CameraGroup opens every attached camera; pass "
+                             "cameras=[Camera(device=...), ...] to choose")
+        vid = camera_kwargs.get("vid", usb_io.VID)
+        pid = camera_kwargs.get("pid", usb_io.PID)
+        found = usb_io.list_devices(vid, pid)
+        if not found:
+            raise RuntimeError("no FLIR One camera attached")
+
+        base = Path(camera_kwargs.pop("chunk_save_dir", None) or "./chunks")
+        return [Camera(device=dev,
+                       chunk_save_dir=base / (dev.serial or dev.location),
+                       **camera_kwargs)
+                for dev in found]
+
+    # ── Producers ──────────────────────────────────────────────────
+    def _run(self, i: int) -> None:
+        stream = self.cameras[i].stream()
+        queue  = self._queues[i]
+        try:
+            for frame in stream:
+                if self._stop.is_set():
+                    break
+                with self._cond:
+                    if len(queue) == queue.maxlen:
+                        self.dropped[i] += 1     # deque drops the oldest
+                    queue.append((time.monotonic(), frame))
+                    self._cond.notify()
+        except BaseException as e:               # surfaced in the consumer
+            self._error = e
+        finally:
+            stream.close()
+            with self._cond:
+                self._done[i] = True
+                self._cond.notify()
+
+    # ── Control ────────────────────────────────────────────────────
+    def start(self) -> "CameraGroup":
+        """Start every capture thread (idempotent)."""
+        for t in self._threads:
+            if t.ident is None and not self._stop.is_set():
+                t.start()
+        return self
+
+    def stop(self, timeout: float = 3.0) -> bool:
+        """
+        Ask every capture thread to finish and wait for them.
+
+        Live streams are interrupted with `Camera.stop()`, so blocked USB
+        reads return within one read timeout.
+
+        Returns
+        -------
+        bool
+            False (with a warning) if a thread is still running after
+            `timeout` seconds
+        """
+        self._stop.set()
+        for cam in self.cameras:
+            cam.stop()
+        deadline = time.monotonic() + timeout
+        for t in self._threads:
+            if t.is_alive():
+                t.join(max(0.0, deadline - time.monotonic()))
+        alive = sum(t.is_alive() for t in self._threads)
+        if alive:
+            print(f"[WARN] {alive} camera thread(s) still running after "
+                  f"{timeout} s", file=sys.stderr)
+        return not alive
+
+    # ── Consumer ───────────────────────────────────────────────────
+    def _aligned(self) -> Optional[Tuple[CameraFrame, ...]]:
+        """Pop one aligned tuple if the queue heads allow it (lock held)."""
+        while all(self._queues):
+            heads  = [q[0][0] for q in self._queues]
+            newest = max(heads)
+            stale  = [i for i, t in enumerate(heads)
+                      if newest - t > self.tolerance]
+            if not stale:
+                return tuple(q.popleft()[1] for q in self._queues)
+            for i in stale:
+                self._queues[i].popleft()
+                self.unmatched[i] += 1
+        return None
+
+    def __iter__(self) -> Iterator[Tuple[CameraFrame, ...]]:
+        """
+        Yield tuples of frames, one per camera, in `cameras` order.
+
+        Stops when any camera's stream ends; re-raises capture errors.
+        """
+        self.start()
+        try:
+            while True:
+                with self._cond:
+                    frames = self._aligned()
+                    while frames is None:
+                        if self._error is not None:
+                            raise self._error
+                        if any(done and not q for done, q in
+                               zip(self._done, self._queues)):
+                            return
+                        self._cond.wait(_WAIT_S)
+                        frames = self._aligned()
+                yield frames
+        finally:
+            self.stop()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Regenerate the bundled palette LUT files.
+
+Each palette is defined by a few colour stops (position 0-1, RGB) and
+interpolated linearly to 256 entries. The result is saved as a (256, 3)
+uint8 BGR array in `<name>.npy` next to this script, which is what
+`flir_one.utils.palettes` loads.
+
+The stops are hand-picked to approximate the look of the FLIR camera
+palettes of the same name; they are not the vendor tables. Edit them and
+re-run to tune a palette.
+
+Usage:
+    python -m flir_one.palettes.generate
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+__all__ = ["STOPS", "build", "main"]
+
+Stop = Tuple[float, Tuple[int, int, int]]
+
+STOPS: Dict[str, List[Stop]] = {
+    "iron": [
+        (0.00, (  0,   0,   0)),
+        (0.15, ( 36,   0, 105)),
+        (0.35, (150,   0, 150)),
+        (0.55, (230,  60,  20)),
+        (0.75, (255, 160,   0)),
+        (0.90, (255, 230,  60)),
+        (1.00, (255, 255, 255)),
+    ],
+    "rainbow_hc": [
+        (0.00, (  0,   0,   0)),
+        (0.10, ( 60,   0, 120)),
+        (0.22, (  0,   0, 255)),
+        (0.36, (  0, 255, 255)),
+        (0.50, (  0, 255,   0)),
+        (0.64, (255, 255,   0)),
+        (0.78, (255,   0,   0)),
+        (0.90, (255,   0, 255)),
+        (1.00, (255, 255, 255)),
+    ],
+    "arctic": [
+        (0.00, (  0,   0,  40)),
+        (0.30, (  0,  60, 160)),
+        (0.55, ( 60, 170, 230)),
+        (0.70, (200, 240, 255)),
+        (0.85, (255, 200,  80)),
+        (1.00, (255, 255, 220)),
+    ],
+    "lava": [
+        (0.00, (  0,   0,   0)),
+        (0.20, (  0,  50,  80)),
+        (0.40, (120,  20,  30)),
+        (0.60, (220,  60,   0)),
+        (0.80, (255, 180,  30)),
+        (1.00, (255, 255, 255)),
+    ],
+    "glowbow": [
+        (0.00, (  0,   0,   0)),
+        (0.35, (160,   0,   0)),
+        (0.65, (255, 120,   0)),
+        (0.85, (255, 220,  40)),
+        (1.00, (255, 255, 255)),
+    ],
+}
+
+
+def build(stops: List[Stop]) -> np.ndarray:
+    """
+    Interpolate colour stops to a palette table.
+
+    Parameters
+    ----------
+    stops : List[Stop]
+        (position, (r, g, b)) pairs, positions ascending from 0 to 1
+
+    Returns
+    -------
+    np.ndarray
+        (256, 3) uint8 BGR table
+    """
+    pos = np.array([p for p, _ in stops])
+    rgb = np.array([c for _, c in stops], dtype=np.float64)
+    x   = np.linspace(0.0, 1.0, 256)
+    table = np.stack([np.interp(x, pos, rgb[:, ch]) for ch in (2, 1, 0)], axis=1)
+    return np.rint(table).astype(np.uint8)
+
+
+def main() -> int:
+    out_dir = Path(__file__).parent
+    for name, stops in STOPS.items():
+        path = out_dir / f"{name}.npy"
+        np.save(path, build(stops), allow_pickle=False)
+        print(f"wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
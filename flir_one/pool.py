@@ -0,0 +1,96 @@
+"""
+Recycled frame buffers for FLIR One Pro.
+
+Long-running capture allocates the same arrays for every frame: a 60×80
+thermal image and a 1.5 MB edge mask. A `FramePool` keeps released buffer
+sets and hands them out again, so once the working set has been allocated
+a stream decodes into existing memory only. Buffer sets hold only the
+arrays of the channels being decoded.
+
+Used through `Camera.stream(reuse_buffers=True)`; call
+`CameraFrame.release()` when done with a frame to return its buffers.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .decoders.packets import IMAGE_ROWS, ROW_WORDS
+from .decoders import edge_rle
+
+__all__ = ["FrameBuffers", "FramePool"]
+
+
+class FrameBuffers:
+    """
+    One set of per-frame decode targets.
+
+    Attributes
+    ----------
+    thermal : Optional[np.ndarray]
+        (60, 80) uint16, or None if the pool has no thermal buffers
+    edge_mask : Optional[np.ndarray]
+        Boolean edge mask of the pool's `edge_mask_shape`, or None
+    """
+
+    __slots__ = ("thermal", "edge_mask")
+
+    def __init__(self, edge_mask_shape: Optional[Tuple[int, int]],
+                 thermal: bool = True) -> None:
+        self.thermal = (np.empty((IMAGE_ROWS, ROW_WORDS), np.uint16)
+                        if thermal else None)
+        self.edge_mask = (None if edge_mask_shape is None else
+                          np.empty(edge_mask_shape, np.bool_))
+
+
+class FramePool:
+    """
+    Free list of `FrameBuffers`.
+
+    When the free list is empty a new set is allocated, so frames that are
+    never released are simply garbage-collected; the pool settles at the
+    number of frames the consumer holds at once.
+
+    Parameters
+    ----------
+    size : int
+        Buffer sets allocated up front (default: 4)
+    edge_mask_shape : Optional[Tuple[int, int]]
+        Edge mask resolution (default: full 1080×1440); None allocates no
+        edge masks, e.g. when the edge channel is not decoded
+    thermal : bool
+        Allocate thermal images (default: True)
+
+    Attributes
+    ----------
+    allocated : int
+        Buffer sets created so far; constant in steady state
+    """
+
+    def __init__(self,
+                 size: int = 4,
+                 edge_mask_shape: Optional[Tuple[int, int]] = (edge_rle.H, edge_rle.W),
+                 thermal: bool = True) -> None:
+        self.edge_mask_shape = None if edge_mask_shape is None else tuple(edge_mask_shape)
+        self.thermal = thermal
+        self._free: List[FrameBuffers] = [
+            FrameBuffers(self.edge_mask_shape, thermal) for _ in range(size)]
+        self.allocated = size
+
+    def acquire(self) -> FrameBuffers:
+        """Take a buffer set, allocating one if none is free."""
+        try:
+            return self._free.pop()
+        except IndexError:
+            self.allocated += 1
+            return FrameBuffers(self.edge_mask_shape, self.thermal)
+
+    def release(self, buffers: FrameBuffers) -> None:
+        """Return a buffer set (may be called from any thread)."""
+        self._free.append(buffers)
+
+    @property
+    def available(self) -> int:
+        """Buffer sets ready to be handed out."""
+        return len(self._free)
@@ -0,0 +1,402 @@
+"""
+Shared-memory frame transport for FLIR One Pro.
+
+One capture process publishes frames into a fixed ring of slots in a
+`multiprocessing.shared_memory` block; any number of local processes
+attach by name and read thermal / visible pixels as zero-copy NumPy views.
+
+Example
+-------
+>>> # capture process
+>>> pub = FramePublisher("flir0", slots=8)
+>>> for frame in Camera().stream():
+>>>     pub.publish(frame)
+>>>
+>>> # consumer process(es)
+>>> sub = FrameSubscriber("flir0")
+>>> for shared in sub:
+>>>     analyse(shared.thermal)           # view into shared memory
+
+Layout
+------
+    ┌──────────────── header (64 B) ────────────────┐
+    │ magic │ version │ slots │ visible h, w, c │ telemetry bytes │ latest seq │
+    └───────────────────────────────────────────────┘
+    ┌── slot header (64 B) ──┬─ thermal 60×80 u2 ─┬─ visible h×w×c u1 ─┬─ telemetry ─┐ × slots
+    │ seq │ idx │ ts │ shape │                    │                     │ (JSON)      │
+    └────────────────────────┴────────────────────┴─────────────────────┴─────────────┘
+
+Consistency
+-----------
+Each slot is guarded by a sequence lock: the writer stores an odd value
+while copying and `2 × frame_seq` once the slot is complete. Readers only
+accept a slot whose lock equals `2 × frame_seq`, and `SharedFrame.valid()`
+re-checks it. A view stays intact until the writer wraps around the ring,
+i.e. for `slots - 1` further frames; copy the arrays to keep them longer.
+
+Telemetry is stored as JSON, never pickled, so a process that can write
+to the block cannot run code in its subscribers.
+"""
+from __future__ import annotations
+
+import dataclasses, json, os, struct, time
+from contextlib import suppress
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from .decoders.packets import IMAGE_ROWS, ROW_WORDS
+from .decoders.telemetry import Telemetry
+
+__all__ = ["FramePublisher", "FrameSubscriber", "SharedFrame"]
+
+MAGIC   = b"FLSH"
+VERSION = 2                                      # 2: JSON telemetry
+
+THERMAL_SHAPE = (IMAGE_ROWS, ROW_WORDS)          # 60×80
+_THERMAL_BYTES = IMAGE_ROWS * ROW_WORDS * 2
+
+_HEADER = struct.Struct("<4sHHIIIIQ")            # padded to 64 B
+_SLOT   = struct.Struct("<QIqIIII")              # padded to 64 B
+_HEADER_BYTES = 64
+_SLOT_HEADER  = 64
+_LATEST_OFF   = _HEADER.size - 8                 # latest seq (u64)
+_POLL_S       = 0.002                            # subscriber poll interval
+
+_HAS_THERMAL = 1
+
+_published: set = set()                          # blocks created by this process
+
+
+def _align(n: int, to: int = 64) -> int:
+    return (n + to - 1) // to * to
+
+
+class _Geometry:
+    """Byte offsets of every slot field for one ring configuration."""
+
+    def __init__(self, slots: int, visible_shape: Tuple[int, int, int],
+                 telemetry_bytes: int) -> None:
+        self.slots           = slots
+        self.visible_shape   = visible_shape
+        self.telemetry_bytes = telemetry_bytes
+        self.visible_bytes   = int(np.prod(visible_shape))
+        self.thermal_off     = _SLOT_HEADER
+        self.visible_off     = _align(self.thermal_off + _THERMAL_BYTES)
+        self.telemetry_off   = _align(self.visible_off + self.visible_bytes)
+        self.slot_bytes      = _align(self.telemetry_off + telemetry_bytes)
+        self.size            = _HEADER_BYTES + slots * self.slot_bytes
+
+    def slot(self, seq: int) -> int:
+        """Byte offset of the slot holding frame `seq` (1-based)."""
+        return _HEADER_BYTES + ((seq - 1) % self.slots) * self.slot_bytes
+
+
+def _tracker_name(shm: shared_memory.SharedMemory) -> str:
+    """Name `resource_tracker` knows the block by (leading "/" on POSIX)."""
+    return "/" + shm.name if os.name == "posix" else shm.name
+
+
+def _dump_telemetry(tel) -> bytes:
+    """Encode a `Telemetry` (or JPEG-trailer dict) as JSON."""
+    if isinstance(tel, Telemetry):
+        obj = {"telemetry": dataclasses.asdict(tel)}
+    else:
+        obj = {"trailer": tel}
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _load_telemetry(raw: bytes):
+    """Inverse of `_dump_telemetry`; unknown fields are ignored."""
+    obj = json.loads(raw)
+    if "telemetry" in obj:
+        names = {f.name for f in dataclasses.fields(Telemetry)}
+        return Telemetry(**{k: v for k, v in obj["telemetry"].items()
+                            if k in names})
+    return obj.get("trailer")
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        # older Pythons would unlink the publisher's block at our exit;
+        # a block published by this very process stays registered once
+        if shm.name not in _published:
+            with suppress(Exception):
+                resource_tracker.unregister(_tracker_name(shm), "shared_memory")
+        return shm
+
+
+# ── Publisher ──────────────────────────────────────────────────────
+class FramePublisher:
+    """
+    Writes frames into a shared-memory ring.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        Shared-memory block name (default: generated, see `name`)
+    slots : int
+        Ring size in frames (default: 8)
+    visible_shape : Tuple[int, int, int]
+        Largest visible image to carry (default: 1080×1440×3). Reduced or
+        grayscale images fit in the same slot.
+    telemetry_bytes : int
+        Space for the JSON-encoded telemetry of one frame (default: 4096)
+
+    Raises
+    ------
+    ValueError
+        If `slots` < 2
+    """
+
+    def __init__(self,
+                 name: Optional[str] = None,
+                 slots: int = 8,
+                 visible_shape: Tuple[int, int, int] = (1080, 1440, 3),
+                 telemetry_bytes: int = 4096) -> None:
+        if slots < 2:
+            raise ValueError("ring needs at least 2 slots")
+
+        self._geo = _Geometry(slots, tuple(visible_shape), telemetry_bytes)
+        self._shm = shared_memory.SharedMemory(name=name, create=True,
+                                               size=self._geo.size)
+        self._buf = self._shm.buf
+        _published.add(self._shm.name)
+        _HEADER.pack_into(self._buf, 0, MAGIC, VERSION, slots,
+                          *self._geo.visible_shape, telemetry_bytes, 0)
+        self.seq = 0                                    # frames published
+
+    @property
+    def name(self) -> str:
+        """Block name to pass to `FrameSubscriber`."""
+        return self._shm.name
+
+    def publish(self, frame) -> int:
+        """
+        Copy one frame into the next slot.
+
+        Parameters
+        ----------
+        frame : CameraFrame
+            Frame to publish; pending lazy decodes are resolved
+
+        Returns
+        -------
+        int
+            Sequence number of the published frame (1-based)
+
+        Raises
+        ------
+        ValueError
+            If the visible image or telemetry does not fit in a slot
+        """
+        geo, buf = self._geo, self._buf
+        seq = self.seq + 1
+        off = geo.slot(seq)
+
+        vis = frame.visible
+        vis_shape = (0, 0, 0)
+        if vis is not None:
+            vis_shape = (vis.shape + (1,))[:3]
+            if vis.nbytes > geo.visible_bytes:
+                raise ValueError(f"visible image {vis.shape} exceeds slot "
+                                 f"capacity {geo.visible_shape}")
+        tel = b"" if frame.telemetry is None else _dump_telemetry(frame.telemetry)
+        if len(tel) > geo.telemetry_bytes:
+            raise ValueError(f"telemetry needs {len(tel)} bytes, slot holds "
+                             f"{geo.telemetry_bytes}")
+
+        struct.pack_into("<Q", buf, off, 2 * seq - 1)   # lock: writing
+        flags = 0
+        if frame.thermal is not None:
+            flags |= _HAS_THERMAL
+            dst = np.ndarray(THERMAL_SHAPE, np.uint16, buf, off + geo.thermal_off)
+            np.copyto(dst, frame.thermal, casting="unsafe")
+        if vis is not None:
+            dst = np.ndarray(vis.shape, np.uint8, buf, off + geo.visible_off)
+            np.copyto(dst, vis)
+        buf[off + geo.telemetry_off:off + geo.telemetry_off + len(tel)] = tel
+        ts = -1 if frame.timestamp is None else frame.timestamp
+        _SLOT.pack_into(buf, off, 2 * seq - 1, frame.idx, ts, *vis_shape,
+                        len(tel) | flags << 31)
+        struct.pack_into("<Q", buf, off, 2 * seq)       # unlock: complete
+
+        struct.pack_into("<Q", buf, _LATEST_OFF, seq)
+        self.seq = seq
+        return seq
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach from the block and (by default) remove it."""
+        self._buf = None
+        with suppress(BufferError):
+            self._shm.close()
+        if unlink:
+            with suppress(FileNotFoundError):
+                self._shm.unlink()
+            _published.discard(self._shm.name)
+
+    def __enter__(self) -> "FramePublisher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ── Subscriber ─────────────────────────────────────────────────────
+class SharedFrame:
+    """
+    One frame read from the ring.
+
+    Attributes
+    ----------
+    seq : int
+        Publisher sequence number
+    idx : int
+        `CameraFrame.idx`
+    timestamp : Optional[int]
+        `CameraFrame.timestamp`
+    thermal : Optional[np.ndarray]
+        60×80 uint16 view into shared memory
+    visible : Optional[np.ndarray]
+        Visible image view into shared memory
+    telemetry : Any
+        `CameraFrame.telemetry` (decoded copy)
+    """
+
+    __slots__ = ("seq", "idx", "timestamp", "thermal", "visible",
+                 "telemetry", "_sub")
+
+    def __init__(self, sub: "FrameSubscriber", seq: int, idx: int,
+                 timestamp: Optional[int], thermal, visible, telemetry) -> None:
+        self._sub      = sub
+        self.seq       = seq
+        self.idx       = idx
+        self.timestamp = timestamp
+        self.thermal   = thermal
+        self.visible   = visible
+        self.telemetry = telemetry
+
+    def valid(self) -> bool:
+        """True while the slot has not been overwritten by a newer frame."""
+        return self._sub._lock(self.seq) == 2 * self.seq
+
+    def copy(self) -> "SharedFrame":
+        """Detach the arrays from shared memory."""
+        return SharedFrame(self._sub, self.seq, self.idx, self.timestamp,
+                           None if self.thermal is None else self.thermal.copy(),
+                           None if self.visible is None else self.visible.copy(),
+                           self.telemetry)
+
+
+class FrameSubscriber:
+    """
+    Reads frames published by a `FramePublisher` in another process.
+
+    Parameters
+    ----------
+    name : str
+        Block name (`FramePublisher.name`)
+
+    Attributes
+    ----------
+    missed : int
+        Frames skipped while iterating because they were overwritten
+        before this subscriber got to them
+
+    Raises
+    ------
+    FileNotFoundError
+        If no block with that name exists
+    ValueError
+        If the block is not a frame ring
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        magic, version, slots, h, w, c, tel_bytes, _ = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{name}: not a FLIR frame ring")
+        self._geo = _Geometry(slots, (h, w, c), tel_bytes)
+        self.missed = 0
+
+    @property
+    def latest(self) -> int:
+        """Sequence number of the newest complete frame (0 = none yet)."""
+        return struct.unpack_from("<Q", self._buf, _LATEST_OFF)[0]
+
+    def _lock(self, seq: int) -> int:
+        return struct.unpack_from("<Q", self._buf, self._geo.slot(seq))[0]
+
+    def read(self, seq: int) -> Optional[SharedFrame]:
+        """
+        Return frame `seq`, or None if it is not (or no longer) in the ring.
+        """
+        if seq < 1:
+            return None
+        geo, buf = self._geo, self._buf
+        off = geo.slot(seq)
+
+        lock, idx, ts, h, w, c, tel_word = _SLOT.unpack_from(buf, off)
+        if lock != 2 * seq:
+            return None
+        tel_len = tel_word & 0x7FFFFFFF
+
+        thermal = None
+        if tel_word >> 31 & _HAS_THERMAL:
+            thermal = np.ndarray(THERMAL_SHAPE, np.uint16, buf, off + geo.thermal_off)
+        visible = None
+        if h:
+            shape = (h, w, c) if c > 1 else (h, w)
+            visible = np.ndarray(shape, np.uint8, buf, off + geo.visible_off)
+        telemetry = None
+        if tel_len:
+            start = off + geo.telemetry_off
+            telemetry = _load_telemetry(bytes(buf[start:start + tel_len]))
+
+        if self._lock(seq) != lock:                     # overwritten meanwhile
+            return None
+        return SharedFrame(self, seq, idx, None if ts < 0 else ts,
+                           thermal, visible, telemetry)
+
+    def __iter__(self) -> Iterator[SharedFrame]:
+        """
+        Yield every frame published from now on, in order.
+
+        Frames overwritten before they could be read are skipped and
+        counted in `missed`. Runs until the loop is broken.
+        """
+        seq = self.latest + 1
+        while True:
+            latest = self.latest
+            if seq > latest:
+                time.sleep(_POLL_S)
+                continue
+            oldest = latest - self._geo.slots + 2          # one slot margin
+            if seq < oldest:
+                self.missed += oldest - seq
+                seq = oldest
+            frame = self.read(seq)
+            if frame is None:
+                self.missed += 1
+            else:
+                yield frame
+            seq += 1
+
+    def close(self) -> None:
+        """Detach from the block (views handed out become invalid)."""
+        self._buf = None
+        with suppress(BufferError):
+            self._shm.close()
+
+    def __enter__(self) -> "FrameSubscriber":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
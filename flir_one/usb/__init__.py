@@ -1,5 +1,9 @@
 """USB communication and protocol handling for FLIR One Pro."""
 
-from . import io, handshake, slice_types, assembler
+from . import (io, handshake, slice_types, assembler, transfers, capture,
+               recording, index, devices)
 
-__all__ = ["io", "handshake", "slice_types", "assembler"]
+__all__ = [
+    "io", "handshake", "slice_types", "assembler",
+    "transfers", "capture", "recording", "index", "devices",
+]
@@ -21,15 +21,20 @@ class FrameAssembler:
     telemetry, etc.) and emits a complete Frame object when a frame
     boundary is detected (indicated by receiving a new sync marker).
 
+    Parameters
+    ----------
+    start_idx : int
+        Index given to the first emitted frame (default: 1)
+
     Attributes
     ----------
     idx : int
         Current frame index (increments with each complete frame)
     """
 
-    def __init__(self):
+    def __init__(self, start_idx: int = 1):
         self._cur = {}
-        self._idx = 0
+        self._idx = start_idx - 1
 
     def _flush_frame(self):
         """
@@ -0,0 +1,176 @@
+"""
+Background capture thread for FLIR One Pro camera.
+
+Decouples USB pacing from the application: a daemon thread owns the slice
+iterator (normally `live_chunks`) and copies every slice into a ring of
+preallocated 32 KiB slots, while the consumer drains the ring at its own
+pace.
+
+Behavior
+--------
+- Single producer / single consumer: the producer only advances `head`,
+  the consumer only advances `tail`, so no lock is taken on the data path
+- When every slot is full the incoming slice is discarded and `overruns`
+  increments instead of stalling the USB reads
+- An exception raised by the source is re-raised in the consumer
+- `stop()` sets the stop event; a source that shares it (see
+  `live_chunks(stop=...)`) returns within one read timeout, releasing
+  the USB device before `stop()` returns
+"""
+from __future__ import annotations
+
+import sys, threading
+from typing import Iterator, Optional
+
+__all__ = ["CaptureThread"]
+
+SLOT_BYTES = 32_768                     # one USB slice
+_WAIT_S    = 0.1                        # consumer wake-up interval
+
+
+class CaptureThread:
+    """
+    Ring-buffered capture of USB slices on a background thread.
+
+    Parameters
+    ----------
+    source : Iterator[bytes]
+        Slice iterator to drain, e.g. `live_chunks()`
+    slots : int
+        Number of 32 KiB slots in the ring (default: 64)
+    slot_bytes : int
+        Size of each slot (default: 32,768)
+    stop : Optional[threading.Event]
+        Stop event, shared with `source` so that a blocked source can be
+        interrupted (default: a private event)
+
+    Attributes
+    ----------
+    captured : int
+        Slices written into the ring
+    overruns : int
+        Slices dropped because the ring was full
+    truncated : int
+        Slices longer than `slot_bytes` (stored truncated)
+
+    Examples
+    --------
+    >>> stop = threading.Event()
+    >>> cap = CaptureThread(usb_io.live_chunks(stop=stop), slots=128, stop=stop)
+    >>> for raw in cap:
+    >>>     ...
+    >>> cap.stop()
+    """
+
+    def __init__(self,
+                 source: Iterator[bytes],
+                 slots: int = 64,
+                 slot_bytes: int = SLOT_BYTES,
+                 stop: Optional[threading.Event] = None) -> None:
+        if slots < 2:
+            raise ValueError("ring needs at least 2 slots")
+
+        self._source     = source
+        self._slots      = slots
+        self._slot_bytes = slot_bytes
+        self._ring       = memoryview(bytearray(slots * slot_bytes))
+        self._lengths    = [0] * slots
+        self._head       = 0            # total slices written
+        self._tail       = 0            # total slices consumed
+
+        self._ready  = threading.Event()
+        self._stop   = stop or threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run,
+                                        name="flir-capture", daemon=True)
+
+        self.captured  = 0
+        self.overruns  = 0
+        self.truncated = 0
+
+    # ── Producer ───────────────────────────────────────────────────
+    def _run(self) -> None:
+        try:
+            for chunk in self._source:
+                if self._stop.is_set():
+                    break
+
+                if self._head - self._tail >= self._slots:
+                    self.overruns += 1
+                    continue
+
+                n = len(chunk)
+                if n > self._slot_bytes:
+                    n = self._slot_bytes
+                    self.truncated += 1
+
+                slot = self._head % self._slots
+                off  = slot * self._slot_bytes
+                self._ring[off:off + n] = chunk[:n]
+                self._lengths[slot] = n
+
+                self._head += 1           # publish only after the copy
+                self.captured += 1
+                self._ready.set()
+        except BaseException as e:        # surfaced in the consumer
+            self._error = e
+        finally:
+            close = getattr(self._source, "close", None)
+            if close is not None:
+                close()
+            self._ready.set()
+
+    # ── Control ────────────────────────────────────────────────────
+    def start(self) -> "CaptureThread":
+        """Start the capture thread (idempotent)."""
+        if self._thread.ident is None and not self._stop.is_set():
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 3.0) -> bool:
+        """
+        Ask the capture thread to finish and wait for it.
+
+        Returns
+        -------
+        bool
+            False (with a warning) if the thread is still running after
+            `timeout` seconds, e.g. because its source ignores the stop event
+        """
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        if self._thread.is_alive():
+            print(f"[WARN] capture thread still running after {timeout} s",
+                  file=sys.stderr)
+            return False
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Slices captured but not yet consumed."""
+        return self._head - self._tail
+
+    # ── Consumer ───────────────────────────────────────────────────
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Yield captured slices in order.
+
+        Stops when the source is exhausted or `stop()` is called.
+        """
+        self.start()
+        while True:
+            while self._tail == self._head:
+                if self._error is not None:
+                    raise self._error
+                if not self._thread.is_alive():
+                    return
+                self._ready.clear()
+                if self._tail == self._head:
+                    self._ready.wait(_WAIT_S)
+
+            slot = self._tail % self._slots
+            off  = slot * self._slot_bytes
+            chunk = bytes(self._ring[off:off + self._lengths[slot]])
+            self._tail += 1               # slot may now be reused
+            yield chunk
@@ -0,0 +1,138 @@
+"""
+Device enumeration for FLIR One Pro cameras.
+
+`openByVendorIDAndProductID` always opens the first matching unit. With
+several cameras on one host each one is instead addressed by its serial
+number or by its physical location (bus number and port path), both of
+which survive the reset/re-enumeration done on every reconnect – unlike
+the device address.
+
+Selectors
+---------
+Wherever a device can be chosen, accept either a `DeviceInfo` or a string:
+
+- `"1-2.3"`  – bus 1, port path 2 → 3 (same notation as Linux sysfs)
+- anything else – serial number
+"""
+from __future__ import annotations
+
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+import usb1
+
+__all__ = ["DeviceInfo", "list_devices", "find_device", "open_device"]
+
+
+@dataclass(frozen=True)
+class DeviceInfo:
+    """
+    Identity of one attached camera.
+
+    Attributes
+    ----------
+    bus : int
+        USB bus number
+    ports : Tuple[int, ...]
+        Port numbers from the root hub down to the device
+    address : int
+        Current device address (changes on every reconnect)
+    serial : Optional[str]
+        Serial number, or None if it could not be read (e.g. permissions)
+    """
+
+    bus: int
+    ports: Tuple[int, ...]
+    address: int
+    serial: Optional[str] = None
+
+    @property
+    def location(self) -> str:
+        """Bus/port path as `"<bus>-<port>.<port>..."`."""
+        return f"{self.bus}-" + ".".join(map(str, self.ports))
+
+    def matches(self, selector: Union["DeviceInfo", str]) -> bool:
+        """
+        Return True if this device is the one `selector` refers to.
+
+        A `DeviceInfo` matches by serial when both have one, otherwise by
+        location.
+        """
+        if isinstance(selector, DeviceInfo):
+            if selector.serial and self.serial:
+                return selector.serial == self.serial
+            return selector.location == self.location
+        return selector in (self.location, self.serial)
+
+    def __str__(self) -> str:
+        return f"{self.location} (serial {self.serial or '?'})"
+
+
+def _info(device: usb1.USBDevice) -> DeviceInfo:
+    serial = None
+    with suppress(usb1.USBError):
+        serial = device.getSerialNumber()
+    return DeviceInfo(
+        bus=device.getBusNumber(),
+        ports=tuple(device.getPortNumberList() or ()),
+        address=device.getDeviceAddress(),
+        serial=serial,
+    )
+
+
+def _matching(ctx: usb1.USBContext, vid: int, pid: int):
+    for device in ctx.getDeviceIterator(skip_on_error=True):
+        if device.getVendorID() == vid and device.getProductID() == pid:
+            yield device
+
+
+def list_devices(vid: int, pid: int,
+                 ctx: Optional[usb1.USBContext] = None) -> List[DeviceInfo]:
+    """
+    List all attached cameras with the given IDs.
+
+    Parameters
+    ----------
+    vid : int
+        USB Vendor ID
+    pid : int
+        USB Product ID
+    ctx : Optional[usb1.USBContext]
+        Context to enumerate with (default: a temporary one)
+
+    Returns
+    -------
+    List[DeviceInfo]
+        Attached devices, sorted by location
+    """
+    if ctx is None:
+        with usb1.USBContext() as own:
+            return list_devices(vid, pid, own)
+    return sorted((_info(d) for d in _matching(ctx, vid, pid)),
+                  key=lambda d: (d.bus, d.ports))
+
+
+def find_device(ctx: usb1.USBContext, vid: int, pid: int,
+                selector: Union[DeviceInfo, str]) -> Optional[usb1.USBDevice]:
+    """Return the attached device matching `selector`, or None."""
+    for device in _matching(ctx, vid, pid):
+        if _info(device).matches(selector):
+            return device
+    return None
+
+
+def open_device(ctx: usb1.USBContext, vid: int, pid: int,
+                selector: Union[DeviceInfo, str]) -> usb1.USBDeviceHandle:
+    """
+    Open the camera matching `selector`.
+
+    Raises
+    ------
+    usb1.USBErrorNoDevice
+        If no such camera is attached (so reconnect loops keep retrying)
+    """
+    device = find_device(ctx, vid, pid, selector)
+    if device is None:
+        raise usb1.USBErrorNoDevice()
+    return device.open()
@@ -1,9 +1,10 @@
 """USB handshake protocol for FLIR One Pro Gen-3 thermal camera."""
 import os, sys, time, struct, pathlib, usb1
 from contextlib import suppress
+from .devices import open_device
 
 
-def attempt_handshake(ctx, VID, PID) -> usb1.USBDeviceHandle:
+def attempt_handshake(ctx, VID, PID, device=None) -> usb1.USBDeviceHandle:
     """
     Performs the exact FLIR handshake sequence to initialize the camera.
 
@@ -15,13 +16,19 @@ def attempt_handshake(ctx, VID, PID) -> usb1.USBDeviceHandle:
         Vendor ID (0x09CB for FLIR)
     PID : int
         Product ID (0x1996 for FLIR One Pro Gen-3)
+    device : Optional[DeviceInfo | str]
+        Camera to open when several are attached: a `DeviceInfo`, a
+        serial number or a `"bus-port.port"` location (default: first one)
 
     Returns
     -------
     usb1.USBDeviceHandle
         Configured device handle ready for bulk streaming
     """
-    dev = ctx.openByVendorIDAndProductID(VID, PID, skip_on_error=False)
+    if device is None:
+        dev = ctx.openByVendorIDAndProductID(VID, PID, skip_on_error=False)
+    else:
+        dev = open_device(ctx, VID, PID, device)
 
     if hasattr(dev, "setAutoDetachKernelDriver"):
         dev.setAutoDetachKernelDriver(True)
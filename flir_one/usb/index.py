@@ -0,0 +1,224 @@
+"""
+Seekable index for binary recordings.
+
+Scans a recording once and stores, per slice, its offset, length,
+classification label and sync fields, and per frame the slice range that
+`FrameAssembler` turns into that frame. The index is saved next to the
+recording (`<name>.flrec.idx`) and rebuilt automatically when the
+recording grows.
+
+Seeking
+-------
+Frames are flushed when a second sync marker arrives, and every sync
+marker is classified outside a JPEG, so classifier, JPEG reassembler and
+assembler are all idle at a frame's first slice. Decoding from there with
+fresh state therefore reproduces the frame exactly without touching any
+earlier slice.
+"""
+from __future__ import annotations
+
+import pathlib
+from typing import Optional, Tuple
+
+import numpy as np
+
+from . import slice_types
+from .assembler import FrameAssembler
+from .recording import RECORD_HEADER, MappedRecording
+from ..decoders import sync
+
+__all__ = ["LABELS", "RecordingIndex"]
+
+VERSION = 1
+
+LABELS = ("unknown", "keep_alive", "sync", "packets", "visible",
+          "telemetry", "agc", "edge_rle")
+_LABEL_ID = {name: i for i, name in enumerate(LABELS)}
+
+SLICE_DTYPE = np.dtype([
+    ("offset",  "<u8"),     # payload offset in the recording
+    ("length",  "<u4"),
+    ("label",   "u1"),      # index into LABELS
+    ("ts_low",  "<u4"),     # sync fields (0 for non-sync slices)
+    ("ts_high", "<u4"),
+    ("t_ns",    "<u8"),     # capture time
+])
+
+FRAME_DTYPE = np.dtype([
+    ("idx",     "<u4"),     # CameraFrame.idx
+    ("start",   "<u4"),     # first slice fed to the assembler
+    ("end",     "<u4"),     # flushing sync slice (inclusive)
+    ("ts",      "<u4"),     # Frame.ts (sync ts_low)
+    ("t_ns",    "<u8"),     # capture time of the first slice
+])
+
+
+class RecordingIndex:
+    """
+    Slice and frame tables for one recording.
+
+    Attributes
+    ----------
+    slices : np.ndarray
+        Structured array (`SLICE_DTYPE`), one row per slice
+    frames : np.ndarray
+        Structured array (`FRAME_DTYPE`), one row per emitted frame
+    rec_size : int
+        Size of the recording file the index was built from
+    """
+
+    def __init__(self, slices: np.ndarray, frames: np.ndarray, rec_size: int):
+        self.slices   = slices
+        self.frames   = frames
+        self.rec_size = rec_size
+
+    # ── Construction ───────────────────────────────────────────────
+    @classmethod
+    def build(cls, rec: MappedRecording) -> "RecordingIndex":
+        """
+        Scan a mapped recording and build its index.
+
+        Only sync slices are decoded; everything else is just classified.
+        """
+        slices = np.zeros(len(rec), SLICE_DTYPE)
+        slices["offset"] = rec.offsets
+        slices["t_ns"]   = rec.timestamps
+
+        frames = []
+        clf    = slice_types.Classifier()
+        asm    = FrameAssembler()
+        start  = 0
+
+        for i, view in enumerate(rec):
+            label = clf.classify(view)
+            row   = slices[i]
+            row["length"] = len(view)
+            row["label"]  = _LABEL_ID[label]
+
+            if label in ("keep_alive", "unknown"):
+                continue
+
+            obj = True                           # payload irrelevant here
+            if label == "sync":
+                obj = sync.decode(view)
+                row["ts_low"], row["ts_high"] = obj.ts_low, obj.ts_high
+
+            frame = asm.push(label, obj)
+            if frame is not None:
+                frames.append((frame.idx, start, i, frame.ts or 0,
+                               rec.timestamps[start]))
+                start = i + 1
+
+        return cls(slices, np.array(frames, FRAME_DTYPE),
+                   rec.path.stat().st_size)
+
+    @staticmethod
+    def sidecar(path: pathlib.Path) -> pathlib.Path:
+        """Return the index path for a recording."""
+        return path.with_name(path.name + ".idx")
+
+    def save(self, path: pathlib.Path) -> None:
+        """Write the index to `path`."""
+        with open(path, "wb") as f:
+            np.savez(f, slices=self.slices, frames=self.frames,
+                     meta=np.array([VERSION, self.rec_size], np.uint64))
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> Optional["RecordingIndex"]:
+        """Read an index file, or return None if it is missing or stale."""
+        try:
+            with np.load(path) as data:
+                version, rec_size = (int(v) for v in data["meta"])
+                if version != VERSION:
+                    return None
+                return cls(data["slices"], data["frames"], rec_size)
+        except (OSError, KeyError, ValueError):
+            return None
+
+    @classmethod
+    def open(cls,
+             path: pathlib.Path,
+             rec: Optional[MappedRecording] = None) -> "RecordingIndex":
+        """
+        Load the sidecar index of a recording, building it if needed.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Recording file
+        rec : Optional[MappedRecording]
+            Already-mapped recording, to avoid mapping it twice
+
+        Returns
+        -------
+        RecordingIndex
+            Up-to-date index
+        """
+        path = pathlib.Path(path)
+        side = cls.sidecar(path)
+        idx  = cls.load(side) if side.exists() else None
+        if idx is not None and idx.rec_size == path.stat().st_size:
+            return idx
+
+        own = rec is None
+        rec = rec or MappedRecording(path)
+        try:
+            idx = cls.build(rec)
+        finally:
+            if own:
+                rec.close()
+        try:
+            idx.save(side)
+        except OSError:
+            pass                                 # read-only media
+        return idx
+
+    # ── Lookup ─────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def _row(self, frame_idx: int) -> int:
+        if not len(self.frames):
+            raise IndexError("recording contains no frames")
+        row = frame_idx - int(self.frames["idx"][0])
+        if not 0 <= row < len(self.frames):
+            raise IndexError(f"frame {frame_idx} out of range "
+                             f"1..{len(self.frames)}")
+        return row
+
+    def frame_start(self, frame_idx: int) -> int:
+        """Return the first slice number of frame `frame_idx` (1-based)."""
+        return int(self.frames["start"][self._row(frame_idx)])
+
+    def frame_offset(self, frame_idx: int) -> int:
+        """
+        Return the file offset of the record holding the first slice of
+        frame `frame_idx`, for `MappedRecording(path, start=...)`.
+        """
+        start = self.frame_start(frame_idx)
+        return int(self.slices["offset"][start]) - RECORD_HEADER
+
+    def frame_span(self, frame_idx: int, count: int) -> Tuple[int, int]:
+        """
+        Return the (start, stop) file offsets of the records that decode to
+        frames `frame_idx` … `frame_idx + count - 1`, up to and including
+        the sync slice that flushes the last one.
+        """
+        row  = self._row(frame_idx)
+        last = min(row + count, len(self.frames)) - 1
+        end  = int(self.frames["end"][last])
+        stop = int(self.slices["offset"][end]) + int(self.slices["length"][end])
+        return self.frame_offset(frame_idx), stop
+
+    def frame_at_time(self, seconds: float) -> int:
+        """
+        Return the first frame captured at or after `seconds` into the
+        recording (clamped to the last frame).
+        """
+        if not len(self.frames):
+            raise IndexError("recording contains no frames")
+        t0     = int(self.slices["t_ns"][0])
+        target = t0 + int(seconds * 1e9)
+        row    = int(np.searchsorted(self.frames["t_ns"], target, side="left"))
+        row    = min(row, len(self.frames) - 1)
+        return int(self.frames["idx"][row])
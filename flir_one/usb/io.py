@@ -6,20 +6,28 @@ Provides generators that yield raw USB slices either from saved chunks
 
 Functions
 ---------
-load_chunks(dir_path, repeat=1) -> Iterator[bytes]
-    Load saved chunks from disk for offline playback
+load_chunks(path, repeat=1, start=0, offset=0) -> Iterator[bytes]
+    Load a saved recording or chunk directory for offline playback
 
-live_chunks(save_dir=None, vid=VID, pid=PID) -> Iterator[bytes]
+live_chunks(save_dir=None, vid=VID, pid=PID, transfers=0,
+            save_format="binary", device=None, stop=None) -> Iterator[bytes]
     Stream live data from connected FLIR camera
+
+list_devices(vid=VID, pid=PID) -> List[DeviceInfo]
+    Enumerate attached cameras
 """
 from __future__ import annotations
 
-import pathlib, binascii, time, sys
+import pathlib, binascii, threading, time, sys
 from contextlib import suppress
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Union
 
 import usb1
 from .handshake import attempt_handshake
+from .devices import DeviceInfo
+from . import devices
+from .transfers import AsyncReader
+from . import recording
 
 
 # ── Constants ──────────────────────────────────────────────────────
@@ -29,134 +37,273 @@ NOISY_EPS     = (0x81, 0x83)            # zero-length chatter endpoints
 SLICE_BYTES   = 32_768                  # size of every bulk read
 
 
+def list_devices(vid: int = VID, pid: int = PID) -> List[DeviceInfo]:
+    """
+    List attached FLIR One Pro cameras.
+
+    Returns
+    -------
+    List[DeviceInfo]
+        One entry per camera (bus, port path, serial), sorted by location
+    """
+    return devices.list_devices(vid, pid)
+
+
 # ── Offline Loader ─────────────────────────────────────────────────
-def load_chunks(path: pathlib.Path, repeat: int = 1) -> Iterator[bytes]:
+def _hex_slices(files: List[pathlib.Path]) -> Iterator[bytes]:
+    """Yield slices from hex-encoded chunk files."""
+    for fp in files:
+        yield binascii.unhexlify(fp.read_text().strip())
+
+
+def load_chunks(path: pathlib.Path,
+                repeat: int = 1,
+                start: int = 0,
+                offset: int = 0) -> Iterator[bytes]:
     """
-    Read `*.txt` files containing hex-encoded USB slices.
+    Replay saved USB slices.
+
+    `path` may be a binary recording (`*.flrec`), a directory of
+    recordings (played in name order), or a directory of `*.txt` files
+    each holding one hex-encoded slice, named numerically (1.txt, 2.txt,
+    etc.).
 
-    Each file contains one USB slice in hexadecimal format.
-    Files should be named numerically (1.txt, 2.txt, etc.).
+    Recordings are memory-mapped once and yielded as zero-copy
+    `memoryview`s, so repeated replay costs nothing beyond decoding.
 
     Parameters
     ----------
     path : pathlib.Path
-        Directory containing numbered .txt chunk files
+        Recording file or chunk directory
     repeat : int
         Number of times to replay the chunks (use -1 for infinite loop)
+    start : int
+        Slice number to begin the first pass at (later passes start at 0)
+    offset : int
+        For a single recording file: file offset of the record to begin
+        the first pass at (see `RecordingIndex.frame_offset`). Only the
+        file from there on is mapped and scanned, unlike `start`.
 
     Yields
     ------
-    bytes
-        One 32,768-byte USB slice per iteration
+    bytes | memoryview
+        One USB slice (up to 32,768 bytes) per iteration
 
     Raises
     ------
     FileNotFoundError
         If the path does not exist
     ValueError
-        If the path is not a directory
+        If the path is neither a recording nor a directory of chunks
     """
     if not path.exists():
         raise FileNotFoundError(path)
 
-    if not path.is_dir():
+    if path.is_file():
+        if not recording.is_recording(path):
+            raise ValueError(f"{path} is not a FLIR recording")
+        rec_files = [path]
+    elif path.is_dir():
+        rec_files = sorted(path.glob(f"*{recording.SUFFIX}"))
+    else:
         raise ValueError(f"{path} is not a directory of chunks")
 
+    if offset and rec_files != [path]:
+        raise ValueError("offset requires a single recording file")
+
+    if rec_files:
+        # map once; every pass just walks the cached views
+        views: list = []
+
+        def reader(first=0, at=0):
+            if at:                               # seeked first pass
+                return iter(recording.MappedRecording(path, start=at))
+            if not views:
+                views.extend(v for fp in rec_files
+                             for v in recording.MappedRecording(fp))
+            return iter(views[first:])
+    else:
+        files  = sorted(path.glob("*.txt"), key=lambda p: int(p.stem))
+
+        def reader(first=0, at=0):
+            return _hex_slices(files[first:])
+
     if repeat == -1:
         # Infinite loop
         print(f"[INFO] Replaying {path} indefinitely", file=sys.stderr)
         counter = 1
         while True:
             print(f"[INFO] Replaying {path} (iteration {counter})", file=sys.stderr)
-            for fp in sorted(path.iterdir(), key=lambda p: int(p.stem)):
-                yield binascii.unhexlify(fp.read_text().strip())
+            yield from reader(start, offset)
+            start = offset = 0
             counter += 1
     else:
         # Finite repeats
         while repeat > 0:
             print(f"[INFO] Replaying {path} ({repeat} times left)", file=sys.stderr)
-            for fp in sorted(path.iterdir(), key=lambda p: int(p.stem)):
-                yield binascii.unhexlify(fp.read_text().strip())
+            yield from reader(start, offset)
+            start = offset = 0
             repeat -= 1
 
 
 # ── Live Camera Generator ──────────────────────────────────────────
+def _stopped(stop: Optional[threading.Event]) -> bool:
+    return stop is not None and stop.is_set()
+
+
+def _sync_slices(dev: usb1.USBDeviceHandle,
+                 stop: Optional[threading.Event] = None) -> Iterator[bytes]:
+    """Yield slices using one blocking bulk read at a time."""
+    usb_buf = bytearray()
+
+    while not _stopped(stop):               # checked on every read timeout
+        # read one full 32 kB slice
+        try:
+            usb_buf.extend(dev.bulkRead(THERM_EP, SLICE_BYTES, timeout=100))
+        except usb1.USBErrorTimeout:
+            pass                            # benign – nothing ready
+        except usb1.USBErrorIO:             # endpoint stalled
+            with suppress(usb1.USBError):
+                dev.clearHalt(THERM_EP)
+            continue
+
+        # drain dummy endpoints quickly
+        for ep in NOISY_EPS:
+            with suppress(usb1.USBErrorTimeout):
+                dev.bulkRead(ep, 4096, timeout=1)
+
+        if not usb_buf:
+            continue
+
+        chunk = bytes(usb_buf)
+        usb_buf.clear()
+        yield chunk
+
+
+def _async_slices(ctx: usb1.USBContext,
+                  dev: usb1.USBDeviceHandle,
+                  transfers: int,
+                  stop: Optional[threading.Event] = None) -> Iterator[bytes]:
+    """Yield slices from an `AsyncReader` with `transfers` reads in flight."""
+    reader = AsyncReader(ctx, dev, THERM_EP, NOISY_EPS, transfers=transfers,
+                         slice_bytes=SLICE_BYTES, stop=stop)
+    try:
+        yield from reader
+    finally:
+        reader.close()
+        if reader.dropped:
+            print(f"[WARN] async reader dropped {reader.dropped} slices",
+                  file=sys.stderr)
+        if reader.errors:
+            print(f"[WARN] async reader resubmitted {reader.errors} failed "
+                  "transfers", file=sys.stderr)
+
+
 def live_chunks(
     save_dir: Optional[pathlib.Path] = None,
     vid: int = VID,
     pid: int = PID,
+    transfers: int = 0,
+    save_format: str = "binary",
+    device: Optional[Union[DeviceInfo, str]] = None,
+    stop: Optional[threading.Event] = None,
 ) -> Iterator[bytes]:
     """
     Stream raw slices from a connected FLIR One Pro camera.
 
     Automatically handles USB errors and reconnection. Each slice is
-    exactly 32,768 bytes of raw data from the camera's bulk endpoint.
+    at most 32,768 bytes of raw data from the camera's bulk endpoint.
 
     Parameters
     ----------
     save_dir : Optional[pathlib.Path]
-        If provided, each slice is saved as hex text (1.txt, 2.txt, ...)
-        for later offline playback
+        If provided, slices are saved for later offline playback
     vid : int
         USB Vendor ID (default: 0x09CB for FLIR)
     pid : int
         USB Product ID (default: 0x1996 for FLIR One Pro Gen-3)
+    transfers : int
+        Number of asynchronous bulk transfers kept in flight on EP 0x85.
+        0 (default) uses one synchronous read at a time.
+    save_format : str
+        "binary" (default) appends every slice to a single
+        `<timestamp>.flrec` recording in `save_dir`; "hex" writes one
+        hex-text file per slice (1.txt, 2.txt, ...)
+    device : Optional[DeviceInfo | str]
+        Camera to stream from when several are attached (a `DeviceInfo`,
+        serial number or `"bus-port.port"` location). Default: the first
+    stop : Optional[threading.Event]
+        When set (e.g. from another thread), the stream ends within one
+        read timeout (~0.1 s) and the device is released
 
     Yields
     ------
     bytes
-        One 32,768-byte USB bulk slice on every iteration
+        One USB bulk slice on every iteration
 
     Notes
     -----
-    This function runs indefinitely and automatically reconnects if the
-    USB connection is lost. Press Ctrl+C to stop.
+    This function runs until `stop` is set and automatically reconnects
+    if the USB connection is lost. Press Ctrl+C to stop.
     """
+    if save_format not in ("binary", "hex"):
+        raise ValueError(f"unknown save_format: {save_format}")
+
     ctx = usb1.USBContext()
-    file_idx = 1
+    writer = None
 
     if save_dir:
         save_dir.mkdir(parents=True, exist_ok=True)
+        if save_format == "binary":
+            name = time.strftime("%Y%m%d-%H%M%S") + recording.SUFFIX
+            writer = recording.RecordingWriter(save_dir / name)
 
-    while True:                                 # reconnect loop
-        dev = None
-        try:
-            dev = attempt_handshake(ctx, vid, pid)
-            usb_buf = bytearray()
-
-            while True:                         # stream loop
-                # read one full 32 kB slice
-                try:
-                    usb_buf.extend(dev.bulkRead(THERM_EP, SLICE_BYTES, timeout=100))
-                except usb1.USBErrorTimeout:
-                    pass                        # benign – nothing ready
-                except usb1.USBErrorIO:         # endpoint stalled
-                    with suppress(usb1.USBError):
-                        dev.clearHalt(THERM_EP)
-                    continue
+    try:
+        yield from _stream(ctx, vid, pid, transfers, save_dir, writer, device,
+                           stop)
+    finally:
+        if writer:
+            writer.close()
 
-                # drain dummy endpoints quickly
-                for ep in NOISY_EPS:
-                    with suppress(usb1.USBErrorTimeout):
-                        dev.bulkRead(ep, 4096, timeout=1)
 
-                if not usb_buf:
-                    continue
+def _stream(ctx: usb1.USBContext,
+            vid: int,
+            pid: int,
+            transfers: int,
+            save_dir: Optional[pathlib.Path],
+            writer: Optional[recording.RecordingWriter],
+            device: Optional[Union[DeviceInfo, str]] = None,
+            stop: Optional[threading.Event] = None) -> Iterator[bytes]:
+    """Reconnect loop behind `live_chunks`."""
+    file_idx = 1
+    pause = stop.wait if stop is not None else time.sleep
 
-                chunk = bytes(usb_buf)
-                usb_buf.clear()
+    while not _stopped(stop):                   # reconnect loop
+        dev = None
+        try:
+            dev = attempt_handshake(ctx, vid, pid, device)
+            if transfers > 0:
+                slices = _async_slices(ctx, dev, transfers, stop)
+            else:
+                slices = _sync_slices(dev, stop)
 
-                # optional dump to disk
-                if save_dir:
-                    (save_dir / f"{file_idx}.txt").write_text(chunk.hex())
-                    file_idx += 1
+            try:
+                for chunk in slices:            # stream loop
+                    # optional dump to disk
+                    if writer:
+                        writer.write(chunk)
+                    elif save_dir:
+                        (save_dir / f"{file_idx}.txt").write_text(chunk.hex())
+                        file_idx += 1
 
-                yield chunk
+                    yield chunk
+            finally:
+                slices.close()                  # retire async transfers
 
         except usb1.USBError as e:
             print(f"[WARN] USB error: {e} – reconnect in 2 s",
                   file=sys.stderr)
-            time.sleep(2)
+            pause(2)
         finally:
             if dev:
                 for i in (0, 1, 2):
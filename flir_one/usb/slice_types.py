@@ -18,12 +18,28 @@ This guarantees:
 - JPEG parts never get mis-labeled as AGC/PACKETS/EDGE
 - Telemetry immediately following a JPEG is associated with that image
   instead of the next frame
+
+Slices may be any buffer-protocol object (`bytes`, `memoryview` into a
+mapped recording, ...); they are never copied except for the few hundred
+bytes of a telemetry candidate.
+
+State
+-----
+The lock state lives in a `Classifier` instance, one per slice stream, so
+several cameras or replays can be classified concurrently. The module-level
+`classify` / `reset` use a shared default instance.
 """
+import re
+
+__all__ = ["Classifier", "classify", "reset", "MAGIC_EFBE"]
 
 MAGIC_EFBE = b"\xEF\xBE\x00\x00"
+_EOI       = re.compile(b"\xFF\xD9")          # searches memoryviews in place
+
 
-_collecting_jpeg = False
-_waiting_tel     = False
+def _has_eoi(buf) -> bool:
+    """Check if buffer contains a JPEG EOI marker."""
+    return _EOI.search(buf) is not None
 
 
 def _looks_like_jpeg_start(buf: bytes) -> bool:
@@ -38,60 +54,98 @@ def _looks_like_jpeg_start(buf: bytes) -> bool:
 def _looks_like_telemetry(buf: bytes) -> bool:
     """Check if buffer appears to be JSON telemetry data."""
     ln = len(buf)
-    return (
-        120 <= ln <= 512 and
-        b'{' in buf and
-        buf.rstrip(b"\0")[-1:] == b'}'
-    )
+    if not 120 <= ln <= 512:
+        return False
+    buf = bytes(buf)
+    return b'{' in buf and buf.rstrip(b"\0")[-1:] == b'}'
 
 
-def classify(buf: bytes) -> str:
+# ── Stateful classifier ────────────────────────────────────────────
+class Classifier:
     """
-    Classify a USB slice based on its content.
-
-    Parameters
-    ----------
-    buf : bytes
-        Raw USB slice data (typically 32,768 bytes or less)
-
-    Returns
-    -------
-    str
-        Slice type: 'visible', 'telemetry', 'packets', 'agc', 'edge_rle',
-        'sync', 'keep_alive', or 'unknown'
+    Classifier state for one slice stream.
+
+    Examples
+    --------
+    >>> clf = Classifier()
+    >>> for raw in live_chunks():
+    >>>     label = clf.classify(raw)
     """
-    global _collecting_jpeg, _waiting_tel
-
-    # ── Locked States ──────────────────────────────────────────────
-    if _collecting_jpeg:
-        if b"\xFF\xD9" in buf:             # end-of-image reached
-            _collecting_jpeg = False
-            _waiting_tel     = True        # expect telemetry next
-        return "visible"
-
-    if _waiting_tel:
-        if _looks_like_telemetry(buf):
-            _waiting_tel = False
-            return "telemetry"
-        # even if telemetry missing, unlock after one non-JPEG slice
-        _waiting_tel = False
-
-    # ── Normal Detection ───────────────────────────────────────────
-    if _looks_like_jpeg_start(buf):
-        _collecting_jpeg = True
-        # immediate SOI+EOI in same slice?
-        if b"\xFF\xD9" in buf:
-            _collecting_jpeg = False
-            _waiting_tel     = True
-        return "visible"
 
-    ln = len(buf)
-    if ln == 0:                          return "keep_alive"
-    if ln == 28 and buf.startswith(MAGIC_EFBE): return "sync"
-    if 10_000 <= ln <= 11_000:           return "packets"
-    if _looks_like_telemetry(buf):       return "telemetry"
-    if 7_000 <= ln <= 25_000             \
-       and buf[:2] != b"\xFF\xD8":       return "edge_rle"
-    if ln == 32_768:                     return "agc"   # legacy / rarely used
-
-    return "unknown"
+    def __init__(self) -> None:
+        self._collecting_jpeg = False
+        self._waiting_tel     = False
+
+    def reset(self) -> None:
+        """Forget any JPEG/telemetry lock, e.g. before seeking in a recording."""
+        self._collecting_jpeg = False
+        self._waiting_tel     = False
+
+    def classify(self, buf: bytes) -> str:
+        """
+        Classify a USB slice based on its content.
+
+        Parameters
+        ----------
+        buf : bytes
+            Raw USB slice data (typically 32,768 bytes or less); any
+            buffer-protocol object is accepted
+
+        Returns
+        -------
+        str
+            Slice type: 'visible', 'telemetry', 'packets', 'agc', 'edge_rle',
+            'sync', 'keep_alive', or 'unknown'
+        """
+        # ── Locked States ──────────────────────────────────────────
+        if self._collecting_jpeg:
+            if _has_eoi(buf):                  # end-of-image reached
+                self._collecting_jpeg = False
+                self._waiting_tel     = True   # expect telemetry next
+            return "visible"
+
+        if self._waiting_tel:
+            if _looks_like_telemetry(buf):
+                self._waiting_tel = False
+                return "telemetry"
+            # even if telemetry missing, unlock after one non-JPEG slice
+            self._waiting_tel = False
+
+        # ── Normal Detection ───────────────────────────────────────
+        if _looks_like_jpeg_start(buf):
+            self._collecting_jpeg = True
+            # immediate SOI+EOI in same slice?
+            if _has_eoi(buf):
+                self._collecting_jpeg = False
+                self._waiting_tel     = True
+            return "visible"
+
+        ln = len(buf)
+        if ln == 0:                          return "keep_alive"
+        if ln == 28 and buf[:4] == MAGIC_EFBE: return "sync"
+        if 10_000 <= ln <= 11_000:           return "packets"
+        if _looks_like_telemetry(buf):       return "telemetry"
+        if 7_000 <= ln <= 25_000             \
+           and buf[:2] != b"\xFF\xD8":       return "edge_rle"
+        if ln == 32_768:                     return "agc"   # legacy / rarely used
+
+        return "unknown"
+
+
+# ── Module-level default instance ──────────────────────────────────
+_default = Classifier()
+
+
+def reset() -> None:
+    """Forget any JPEG/telemetry lock of the shared default classifier."""
+    _default.reset()
+
+
+def classify(buf: bytes) -> str:
+    """
+    Classify a USB slice using the shared default classifier.
+
+    Single-stream convenience wrapper around `Classifier.classify`; use a
+    `Classifier` per stream when several streams run in one process.
+    """
+    return _default.classify(buf)
@@ -0,0 +1,207 @@
+"""
+Asynchronous bulk reader for FLIR One Pro camera.
+
+Keeps several bulk transfers queued on the thermal endpoint so the host
+controller always has a buffer ready when the camera sends a slice, instead
+of issuing one synchronous `bulkRead` at a time.
+
+Behavior
+--------
+- `transfers` reads of `slice_bytes` each stay in flight on the main endpoint
+- Each noisy endpoint (0x81/0x83) gets its own queued transfer whose data is
+  discarded, so draining them no longer costs two 1 ms polls per slice
+- Completed slices are copied out of the transfer buffer into a bounded
+  FIFO and the transfer is resubmitted straight from the callback
+- When the FIFO is full the newest slice is dropped and `dropped` increments
+- Only `TRANSFER_NO_DEVICE` ends the stream; stalls clear the halt, and
+  overflows / other errors just resubmit (counted in `errors`)
+
+libusb events are pumped from the consuming thread each time it takes a
+slice (blocking only while the FIFO is empty), so no extra thread is
+needed and a slow consumer fills the FIFO rather than stalling the
+transfers.
+"""
+from __future__ import annotations
+
+import collections, threading
+from contextlib import suppress
+from typing import Deque, Iterator, List, Optional, Sequence
+
+import usb1
+
+__all__ = ["AsyncReader"]
+
+_NOISE_BYTES = 4096                     # same size the sync path drains
+_POLL_S      = 0.1                      # event-loop wait when FIFO empty
+
+
+class AsyncReader:
+    """
+    Bulk reader with several transfers in flight.
+
+    Parameters
+    ----------
+    ctx : usb1.USBContext
+        Context the device handle belongs to
+    dev : usb1.USBDeviceHandle
+        Handle returned by `attempt_handshake`
+    endpoint : int
+        Main bulk endpoint (0x85)
+    noisy_eps : Sequence[int]
+        Chatter endpoints to drain and discard
+    transfers : int
+        Number of transfers kept queued on `endpoint` (default: 8)
+    slice_bytes : int
+        Buffer size of every transfer (default: 32,768)
+    max_queued : int
+        Capacity of the slice FIFO (default: 64)
+    stop : Optional[threading.Event]
+        Ends iteration, checked on every event-loop wake-up
+
+    Attributes
+    ----------
+    dropped : int
+        Slices discarded because the FIFO was full
+    errors : int
+        Transfers that failed (overflow, I/O error) and were resubmitted
+    """
+
+    def __init__(
+        self,
+        ctx: usb1.USBContext,
+        dev: usb1.USBDeviceHandle,
+        endpoint: int,
+        noisy_eps: Sequence[int] = (),
+        *,
+        transfers: int = 8,
+        slice_bytes: int = 32_768,
+        max_queued: int = 64,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        if transfers < 1:
+            raise ValueError("transfers must be >= 1")
+
+        self._ctx         = ctx
+        self._dev         = dev
+        self._endpoint    = endpoint
+        self._noisy_eps   = tuple(noisy_eps)
+        self._n_transfers = transfers
+        self._slice_bytes = slice_bytes
+        self._max_queued  = max_queued
+        self._stop        = stop or threading.Event()
+
+        self._queue: Deque[bytes] = collections.deque()
+        self._transfers: List[usb1.USBTransfer] = []
+        self._stalled: List[usb1.USBTransfer] = []
+        self._no_device = False
+        self._closing   = False
+
+        self.dropped = 0
+        self.errors  = 0
+
+    # ── Callbacks (run inside handleEvents) ────────────────────────
+    def _on_slice(self, transfer: usb1.USBTransfer) -> bool:
+        n = transfer.getActualLength()
+        if n:
+            if len(self._queue) >= self._max_queued:
+                self.dropped += 1
+            else:
+                self._queue.append(bytes(memoryview(transfer.getBuffer())[:n]))
+        return not self._closing
+
+    def _on_timeout(self, transfer: usb1.USBTransfer) -> bool:
+        return not self._closing               # benign – nothing ready
+
+    def _on_noise(self, transfer: usb1.USBTransfer) -> bool:
+        return not self._closing
+
+    def _on_stall(self, transfer: usb1.USBTransfer) -> bool:
+        if not self._closing:
+            self._stalled.append(transfer)     # clearHalt outside callback
+        return False
+
+    def _on_error(self, transfer: usb1.USBTransfer) -> bool:
+        self.errors += 1                       # overflow etc. – data lost
+        return not self._closing
+
+    def _on_no_device(self, transfer: usb1.USBTransfer) -> bool:
+        self._no_device = True
+        return False
+
+    def _on_cancelled(self, transfer: usb1.USBTransfer) -> bool:
+        return False
+
+    # ── Setup / teardown ───────────────────────────────────────────
+    def _make_transfer(self, endpoint: int, size: int, on_data) -> None:
+        helper = usb1.USBTransferHelper()
+        helper.setEventCallback(usb1.TRANSFER_COMPLETED, on_data)
+        helper.setEventCallback(usb1.TRANSFER_TIMED_OUT, self._on_timeout)
+        helper.setEventCallback(usb1.TRANSFER_STALL,     self._on_stall)
+        helper.setEventCallback(usb1.TRANSFER_NO_DEVICE, self._on_no_device)
+        helper.setEventCallback(usb1.TRANSFER_CANCELLED, self._on_cancelled)
+        helper.setDefaultCallback(self._on_error)      # error, overflow
+
+        transfer = self._dev.getTransfer()
+        transfer.setBulk(endpoint, size, callback=helper)
+        transfer.submit()
+        self._transfers.append(transfer)
+
+    def start(self) -> None:
+        """Allocate and submit all transfers."""
+        if self._transfers:
+            return
+        for _ in range(self._n_transfers):
+            self._make_transfer(self._endpoint, self._slice_bytes, self._on_slice)
+        for ep in self._noisy_eps:
+            self._make_transfer(ep, _NOISE_BYTES, self._on_noise)
+
+    def close(self) -> None:
+        """Cancel outstanding transfers and wait for them to retire."""
+        self._closing = True
+        for transfer in self._transfers:
+            with suppress(usb1.USBError):
+                if transfer.isSubmitted():
+                    transfer.cancel()
+
+        # cancelled transfers must complete before their buffers are freed
+        for _ in range(50):
+            if not any(t.isSubmitted() for t in self._transfers):
+                break
+            with suppress(usb1.USBError):
+                self._ctx.handleEventsTimeout(_POLL_S)
+
+        for transfer in self._transfers:
+            with suppress(usb1.USBError):
+                transfer.close()
+        self._transfers.clear()
+        self._queue.clear()
+
+    # ── Event loop ─────────────────────────────────────────────────
+    def _recover(self) -> None:
+        """Raise on device loss, clear halts and resubmit stalled transfers."""
+        if self._no_device:
+            raise usb1.USBErrorNoDevice()
+
+        while self._stalled:
+            transfer = self._stalled.pop()
+            with suppress(usb1.USBError):
+                self._dev.clearHalt(transfer.getEndpoint())
+            transfer.submit()
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Yield slices in arrival order until `stop` is set.
+
+        Raises
+        ------
+        usb1.USBError
+            If the device disappears; the caller is expected to reconnect
+        """
+        self.start()
+        while not self._stop.is_set():
+            # pump on every slice so completions keep being resubmitted
+            # (or dropped) while the consumer is busy
+            self._ctx.handleEventsTimeout(0 if self._queue else _POLL_S)
+            self._recover()
+            if self._queue:
+                yield self._queue.popleft()
@@ -1,5 +1,5 @@
 """Utility functions for display, fusion, and image processing."""
 
-from . import display, fuse, msx, palettes, fps
+from . import display, fuse, gain, msx, palettes, registration, fps
 
-__all__ = ["display", "fuse", "msx", "palettes", "fps"]
+__all__ = ["display", "fuse", "gain", "msx", "palettes", "registration", "fps"]
@@ -7,8 +7,11 @@ metrics.
 """
 from __future__ import annotations
 import cv2, numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from .fuse import fuse_visible_and_thermal, overlay_metrics
+from .gain import AutoGain, bounds
+from .palettes import colorize_raw
+from .registration import Registration
 
 __all__ = ["prepare_displays"]
 
@@ -28,6 +31,8 @@ def _build_thermal(
         fps: float | None,
         opts: Dict[str, Any],
         *,
+        agc: Optional[AutoGain] = None,
+        palette: str = "inferno",
         cold_clip_pct: float = 2.0,   # ignore the darkest N %
         hot_clip_pct:  float = 99.5   # ignore the brightest N %
 ) -> np.ndarray:
@@ -37,9 +42,12 @@ def _build_thermal(
 
     Features
     --------
-    - Per-frame auto-gain: stretch current min→max (or percentiles) to 0-255
+    - Per-frame auto-gain: stretch current min→max (or percentiles) to 0-255,
+      via a value histogram and a uint8 LUT (see `gain.auto_gain`)
     - Optional percentile clipping suppresses noise & very cold background
-    - Uses OpenCV's built-in INFERNO LUT
+    - Palette (INFERNO by default), stretch and cold cutoff applied as one
+      raw→BGR LUT (see `palettes.colour_lut`), cached when `agc` keeps
+      the bounds stable
 
     Parameters
     ----------
@@ -51,6 +59,11 @@ def _build_thermal(
         Frame rate to display
     opts : Dict[str, Any]
         Additional overlay options
+    agc : Optional[AutoGain]
+        Shared stateful AGC; its current bounds replace the per-frame
+        percentiles below
+    palette : str
+        Palette name from the `palettes` registry (default: "inferno")
     cold_clip_pct : float
         Percentile for cold clipping (default: 2.0)
     hot_clip_pct : float
@@ -61,23 +74,18 @@ def _build_thermal(
     np.ndarray
         Colorized BGR thermal image (160×120)
     """
-    # work in 32-bit to avoid precision loss
-    frame = raw.astype(np.float32)
-
     # Robust min/max – clip a few % of extremes so background goes to black
-    v_min = np.percentile(frame, cold_clip_pct)
-    v_max = np.percentile(frame, hot_clip_pct)
-    if v_max <= v_min:                         # degenerate scene (all same)
-        v_max = v_min + 1.0
-
-    # Linear stretch → 8-bit
-    grey = ((frame - v_min) * 255.0 / (v_max - v_min)).clip(0, 255).astype(np.uint8)
-
-    # Colorize – INFERNO starts almost black and ends white-hot
-    colour = cv2.applyColorMap(grey, cv2.COLORMAP_INFERNO)
-
-    # Optional: force very cold (≤5) to pure black so they disappear completely
-    colour[grey <= 5] = (0, 0, 0)
+    if agc is not None:
+        lo, hi = agc.bounds if agc.bounds is not None else agc.update(raw)
+    else:
+        lo, hi = bounds(raw, cold_clip_pct, hot_clip_pct)
+
+    # Linear stretch → palette (INFERNO: almost black to white-hot), very
+    # cold (≤5) forced to pure black so they disappear completely – one
+    # LUT gather. Per-frame percentiles change every frame: caching their
+    # LUTs would only evict useful ones
+    colour = colorize_raw(raw, palette, lo, hi, cold_cutoff=5,
+                          cache=agc is not None)
 
     # Resize to exactly 160×120 px (even height for display pipeline)
     colour = cv2.resize(colour, (160, 120), interpolation=cv2.INTER_LINEAR)
@@ -94,6 +102,9 @@ def prepare_displays(
     fps            : Dict[str, float] | None     = None,
     telemetry_data : Dict[str, Any] | None       = None,
     telemetry_show : Dict[str, Dict[str, Any]] | None = None,
+    agc            : AutoGain | None             = None,
+    registration   : Registration | None         = None,
+    fused_size     : Tuple[int, int] | None      = None,
 ) -> Dict[str, np.ndarray]:
     """
     Prepare display images from an assembled frame.
@@ -108,7 +119,8 @@ def prepare_displays(
     alpha : float
         Blending factor for thermal overlay (0.0-1.0)
     palette : str
-        Color palette name ('inferno', 'turbo', 'hot', 'jet')
+        Color palette for the thermal and fused views (any name from
+        `palettes.available()`, e.g. 'inferno', 'iron', 'arctic')
     fps : Optional[Dict[str, float]]
         FPS values for each view
     telemetry_data : Optional[Dict[str, Any]]
@@ -120,6 +132,15 @@ def prepare_displays(
           "thermal":  {"keys": ["BattPct"], "single_line": True},
           "fused":    {"single_line": False},
         }
+    agc : Optional[AutoGain]
+        Stateful AGC shared by the thermal and fused views. Advanced once
+        per call with the frame's telemetry (FFC freeze); keep the same
+        instance across frames. Default: per-frame percentile stretch for
+        thermal, min/max normalisation for fused.
+    registration : Optional[Registration]
+        Thermal → visible alignment for the fused view
+    fused_size : Optional[Tuple[int, int]]
+        (width, height) to blend the fused view at (default: visible size)
 
     Returns
     -------
@@ -131,6 +152,11 @@ def prepare_displays(
 
     outputs: Dict[str, np.ndarray] = {}
 
+    has_thermal = frame.packet_img is not None and frame.packet_img.size
+    if agc is not None and has_thermal:
+        agc.update(frame.packet_img,
+                   getattr(frame, "telemetry", None) or telemetry_data)
+
     if frame.visible_img is not None:
         outputs["visible"] = _build_visible(
             frame.visible_img,
@@ -139,19 +165,24 @@ def prepare_displays(
             telemetry_show.get("visible", {})
         )
 
-    if frame.packet_img is not None and frame.packet_img.size:
+    if has_thermal:
         outputs["thermal"] = _build_thermal(
             frame.packet_img,
             telemetry_data,
             fps.get("thermal"),
-            telemetry_show.get("thermal", {})
+            telemetry_show.get("thermal", {}),
+            agc=agc,
+            palette=palette,
         )
 
     if ("visible" in outputs) and ("thermal" in outputs):
         fused = fuse_visible_and_thermal(frame.visible_img,
                                          frame.packet_img,
                                          alpha=alpha,
-                                         palette=palette)
+                                         palette=palette,
+                                         agc=agc,
+                                         registration=registration,
+                                         output_size=fused_size)
         outputs["fused"] = overlay_metrics(
             fused,
             metrics=telemetry_data,
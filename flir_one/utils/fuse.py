@@ -5,39 +5,63 @@ Provides functions to fuse visible and thermal images, and overlay
 telemetry metrics on images.
 """
 from __future__ import annotations
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 import cv2, numpy as np
 
-__all__ = ["fuse_visible_and_thermal", "overlay_metrics"]
+from .gain import AutoGain
+from .palettes import colorize_raw
+from .registration import Registration, warp
 
-# Color palettes available in OpenCV
-_PALETTES = {
-    "inferno": cv2.COLORMAP_INFERNO,
-    "turbo":   cv2.COLORMAP_TURBO,
-    "hot":     cv2.COLORMAP_HOT,
-    "jet":     cv2.COLORMAP_JET,
-}
+__all__ = ["fuse_visible_and_thermal", "overlay_metrics"]
 
 
-def _colorize_thermal(raw: np.ndarray, palette: str) -> np.ndarray:
+def _colorize_thermal(raw: np.ndarray, palette: str,
+                      agc: Optional[AutoGain] = None) -> np.ndarray:
     """
     Normalize and apply false-color palette to thermal data.
 
+    Stretch and palette are one raw→BGR LUT, so this is a single gather
+    per frame; the LUT is cached when `agc` keeps the bounds stable.
+    Unknown palette names fall back to INFERNO.
+
     Parameters
     ----------
     raw : np.ndarray
         Raw thermal data
     palette : str
-        Palette name
+        Palette name (see `palettes.available`)
+    agc : Optional[AutoGain]
+        Stretch with this AGC's current bounds instead of per-frame min/max
 
     Returns
     -------
     np.ndarray
         Colorized BGR uint8 image
     """
-    norm = cv2.normalize(raw, None, 0, 255, cv2.NORM_MINMAX)
-    lut  = _PALETTES.get(palette.lower(), cv2.COLORMAP_INFERNO)
-    return cv2.applyColorMap(norm.astype(np.uint8), lut)
+    if agc is not None:
+        lo, hi = agc.bounds if agc.bounds is not None else agc.update(raw)
+    else:
+        lo, hi = float(raw.min()), float(raw.max())
+        if hi <= lo:
+            hi = lo + 1.0
+    try:
+        return colorize_raw(raw, palette, lo, hi, cache=agc is not None)
+    except ValueError:                    # unknown palette
+        return colorize_raw(raw, "inferno", lo, hi, cache=agc is not None)
+
+
+def _shrink(img: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """
+    Downscale to (width, height): INTER_AREA halvings (OpenCV's fast exact
+    2× path), then a bilinear step for the remaining factor (< 2).
+    """
+    w, h = size
+    while img.shape[1] >= 2 * w and img.shape[0] >= 2 * h:
+        img = cv2.resize(img, (img.shape[1] // 2, img.shape[0] // 2),
+                         interpolation=cv2.INTER_AREA)
+    if (img.shape[1], img.shape[0]) != (w, h):
+        img = cv2.resize(img, (w, h), interpolation=cv2.INTER_LINEAR)
+    return img
 
 
 def fuse_visible_and_thermal(
@@ -46,33 +70,75 @@ def fuse_visible_and_thermal(
     *,
     alpha   : float = 0.40,
     palette : str   = "inferno",
+    agc     : Optional[AutoGain] = None,
+    registration : Optional[Registration] = None,
+    output_size  : Optional[Tuple[int, int]] = None,
 ) -> np.ndarray:
     """
     Alpha-blend colorized thermal over visible frame.
 
+    The thermal image is resized to whatever size the visible image has,
+    so reduced decodes (`Camera(visible_scale=4)`, 360×270) fuse directly
+    and the blend itself runs on the smaller image. `output_size` shrinks
+    the visible frame first for the same saving on full-size decodes.
+
+    With a `registration` the thermal image is placed by that model
+    (field of view, offset, parallax) through cached `cv2.remap` maps;
+    outside the thermal field of view the visible image is left as is.
+    The remap costs roughly 3-6× the plain resize at full 1440×1080, so
+    pair a registration with an `output_size` such as (720, 540) where
+    frame time matters (see `benchmarks/bench_fuse.py`).
+
     Parameters
     ----------
     visible_bgr : np.ndarray
-        Visible camera image (BGR)
+        Visible camera image (BGR or grayscale, full size or reduced)
     thermal_raw : np.ndarray
         Raw thermal data (uint16)
     alpha : float
         Blending factor for thermal overlay (0.0-1.0)
     palette : str
-        Color palette for thermal ('inferno', 'turbo', 'hot', 'jet')
+        Color palette for thermal (any name from `palettes.available()`)
+    agc : Optional[AutoGain]
+        Shared stateful AGC (bounds as last updated; see `AutoGain`)
+    registration : Optional[Registration]
+        Thermal → visible alignment (default: None, same field of view)
+    output_size : Optional[Tuple[int, int]]
+        (width, height) to blend at (default: visible image size)
 
     Returns
     -------
     np.ndarray
-        Fused BGR image at visible camera resolution
+        Fused BGR image at visible camera resolution, or `output_size`
     """
     vis_h, vis_w = visible_bgr.shape[:2]
-
-    therm_colour = _colorize_thermal(thermal_raw, palette)
-    therm_up     = cv2.resize(therm_colour, (vis_w, vis_h),
+    owned = False                                 # visible_bgr is a new array
+    if output_size is not None and tuple(output_size) != (vis_w, vis_h):
+        vis_w, vis_h = output_size
+        visible_bgr  = _shrink(visible_bgr, (vis_w, vis_h))
+        owned = True
+    if visible_bgr.ndim == 2:                     # luminance-only decode
+        visible_bgr = cv2.cvtColor(visible_bgr, cv2.COLOR_GRAY2BGR)
+        owned = True
+
+    therm_colour = _colorize_thermal(thermal_raw, palette, agc)
+    if registration is None:
+        therm_up = cv2.resize(therm_colour, (vis_w, vis_h),
                               interpolation=cv2.INTER_LINEAR)
-
-    return cv2.addWeighted(visible_bgr, 1.0 - alpha, therm_up, alpha, 0)
+        return cv2.addWeighted(visible_bgr, 1.0 - alpha, therm_up, alpha, 0)
+
+    warped = warp(therm_colour, registration, (vis_w, vis_h))
+    if warped is None:                            # thermal entirely out of view
+        return visible_bgr if owned else visible_bgr.copy()
+    therm_roi, (x0, y0, x1, y1) = warped
+    if (x0, y0, x1, y1) == (0, 0, vis_w, vis_h):
+        return cv2.addWeighted(visible_bgr, 1.0 - alpha, therm_roi, alpha, 0)
+
+    # blend only the rectangle the thermal image covers, in place
+    fused = visible_bgr if owned else visible_bgr.copy()
+    roi   = fused[y0:y1, x0:x1]
+    cv2.addWeighted(roi, 1.0 - alpha, therm_roi, alpha, 0, dst=roi)
+    return fused
 
 
 def overlay_metrics(
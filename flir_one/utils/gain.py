@@ -0,0 +1,318 @@
+"""
+Histogram-based automatic gain control for 14-bit thermal frames.
+
+Percentile stretching with `np.percentile` sorts the frame once per
+percentile and then runs a float multiply / clip / cast over every pixel.
+Here one `np.bincount` gives the histogram, both percentiles are read off
+its cumulative sum, and the stretch becomes a uint8 lookup table over the
+occupied value range, applied with a single gather.
+
+The result is bit-identical to
+
+    frame = raw.astype(np.float32)
+    lo, hi = np.percentile(frame, cold_pct), np.percentile(frame, hot_pct)
+    grey = ((frame - lo) * 255.0 / (hi - lo)).clip(0, 255).astype(np.uint8)
+
+because the percentiles replay numpy's linear interpolation on the same
+two order statistics and the LUT evaluates the same float32 expression
+once per possible pixel value.
+
+`AutoGain` adds temporal state on top: an exponential moving average of
+the bounds (no palette flicker), optional recomputation only every N
+frames, and frozen bounds while the camera runs a flat-field correction
+(the closed shutter would otherwise collapse the stretch). Its LUT is
+rebuilt only when the bounds change.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["LEVELS", "histogram", "percentiles", "stretch_lut", "bounds",
+           "auto_gain", "AutoGain"]
+
+LEVELS   = 1 << 14                      # 14-bit Lepton data
+FFC_BUSY = ("PROGRESS", "IMMINENT")     # ffcState substrings while running
+
+
+def histogram(raw: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Count pixel values of an unsigned-integer frame.
+
+    Only the occupied value range is returned, so the later cumulative
+    sum and LUT cover a few hundred bins instead of all 16,384.
+
+    Parameters
+    ----------
+    raw : np.ndarray
+        Thermal frame (uint16, normally 14-bit)
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        Counts for values `offset … raw.max()`, and `offset` (= `raw.min()`)
+
+    Raises
+    ------
+    TypeError
+        If `raw` is not an unsigned integer array
+    ValueError
+        If `raw` is empty
+    """
+    if raw.dtype.kind != "u":
+        raise TypeError("histogram AGC needs an unsigned integer frame")
+    if raw.size == 0:
+        raise ValueError("empty frame")
+    offset = int(raw.min())
+    return np.bincount(raw.ravel())[offset:], offset
+
+
+def _lerp(a, b, t: float):
+    """numpy's percentile interpolation, same operation order and rounding."""
+    diff = b - a
+    out  = np.array(np.add(a, diff * t))
+    if t >= 0.5:
+        np.subtract(b, diff * (1 - t), out=out, casting="unsafe")
+    return out[()]
+
+
+def percentiles(hist: np.ndarray, *q: float,
+                offset: int = 0, dtype=np.float32) -> Tuple:
+    """
+    `np.percentile(frame.astype(dtype), q)` for each `q`, from a histogram.
+
+    Parameters
+    ----------
+    hist : np.ndarray
+        Counts per value, as returned by `histogram`
+    *q : float
+        Percentiles in [0, 100]
+    offset : int
+        Value counted by `hist[0]` (default: 0)
+    dtype : np.dtype
+        Dtype the reference frame would have been cast to (default: float32)
+
+    Returns
+    -------
+    Tuple
+        One scalar per `q`, of the same type and value `np.percentile` returns
+    """
+    cum   = np.cumsum(hist)
+    n     = int(cum[-1])
+    scalar = np.dtype(dtype).type
+
+    out = []
+    for pct in q:
+        qf   = np.true_divide(pct, 100)
+        vi   = (n - 1) * qf          # numpy "linear": virtual index (n - 1)·q
+        prev = int(np.floor(vi))
+        t    = float(vi - prev)
+        nxt  = prev + 1
+        if vi >= n - 1:
+            prev = nxt = n - 1
+        elif vi < 0:
+            prev = nxt = 0
+        # k-th smallest pixel = first value whose cumulative count exceeds k
+        a, b = np.searchsorted(cum, (prev, nxt), side="right")
+        out.append(_lerp(scalar(offset + int(a)), scalar(offset + int(b)), t))
+    return tuple(out)
+
+
+def stretch_lut(lo, hi, stop: int = LEVELS, start: int = 0) -> np.ndarray:
+    """
+    uint8 LUT mapping each raw value to `(v - lo) · 255 / (hi - lo)`,
+    clipped to 0-255, evaluated in float32 like the per-pixel version.
+
+    Only entries `start … stop-1` are filled; the rest are left
+    uninitialised, so index it with values in that range only.
+    """
+    lut = np.empty(stop, np.uint8)
+    v   = np.arange(start, stop, dtype=np.float32)
+    lut[start:] = ((v - lo) * 255.0 / (hi - lo)).clip(0, 255)
+    return lut
+
+
+def bounds(raw: np.ndarray,
+           cold_pct: float = 2.0,
+           hot_pct: float = 99.5) -> Tuple[float, float]:
+    """
+    Percentile stretch bounds of a thermal frame.
+
+    Parameters
+    ----------
+    raw : np.ndarray
+        Thermal frame (uint16)
+    cold_pct : float
+        Percentile mapped to 0 (default: 2.0)
+    hot_pct : float
+        Percentile mapped to 255 (default: 99.5)
+
+    Returns
+    -------
+    Tuple[float, float]
+        (lo, hi), with hi > lo even for a flat scene
+    """
+    hist, offset = histogram(raw)
+    lo, hi = percentiles(hist, cold_pct, hot_pct, offset=offset)
+    if hi <= lo:                              # degenerate scene (all same)
+        hi = lo + 1.0
+    return lo, hi
+
+
+def auto_gain(raw: np.ndarray,
+              cold_pct: float = 2.0,
+              hot_pct: float = 99.5) -> Tuple[np.ndarray, float, float]:
+    """
+    Percentile-stretch a thermal frame to 8 bits.
+
+    Parameters
+    ----------
+    raw : np.ndarray
+        Thermal frame (uint16)
+    cold_pct : float
+        Percentile mapped to 0 (default: 2.0)
+    hot_pct : float
+        Percentile mapped to 255 (default: 99.5)
+
+    Returns
+    -------
+    Tuple[np.ndarray, float, float]
+        8-bit image and the (lo, hi) stretch bounds
+    """
+    lo, hi = bounds(raw, cold_pct, hot_pct)
+    start, stop = int(raw.min()), int(raw.max()) + 1
+    return np.take(stretch_lut(lo, hi, stop, start), raw), lo, hi
+
+
+def _ffc_state(telemetry: Any) -> Optional[str]:
+    """FFC state from a `Telemetry`, a raw JSON dict or a CLI overlay dict."""
+    if telemetry is None:
+        return None
+    if isinstance(telemetry, dict):
+        return telemetry.get("ffcState", telemetry.get("FFC"))
+    return getattr(telemetry, "ffc_state", None)
+
+
+class AutoGain:
+    """
+    Temporally smoothed percentile AGC, shared by display and fusion.
+
+    Parameters
+    ----------
+    cold_pct : float
+        Percentile mapped to 0 (default: 2.0)
+    hot_pct : float
+        Percentile mapped to 255 (default: 99.5)
+    smoothing : float
+        EMA weight of each new measurement, 1.0 = no smoothing (default: 0.2)
+    every : int
+        Recompute percentiles every N frames, reuse bounds in between
+        (default: 1)
+    deadband : float
+        Ignore bound changes smaller than this many raw counts, so the LUT
+        is not rebuilt for noise (default: 0.0)
+    freeze_on_ffc : bool
+        Keep the bounds while telemetry reports an FFC in progress
+        (default: True)
+
+    Attributes
+    ----------
+    bounds : Optional[Tuple[float, float]]
+        Current (lo, hi) stretch bounds, None before the first frame
+    frozen : bool
+        True while bounds are held for an FFC
+
+    Example
+    -------
+    >>> agc = AutoGain(smoothing=0.1, every=3)
+    >>> for frame in camera.stream():
+    >>>     grey = agc(frame.thermal, frame.telemetry)
+    """
+
+    def __init__(self,
+                 cold_pct: float = 2.0,
+                 hot_pct: float = 99.5,
+                 smoothing: float = 0.2,
+                 every: int = 1,
+                 deadband: float = 0.0,
+                 freeze_on_ffc: bool = True) -> None:
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be in (0, 1]")
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        self.cold_pct      = cold_pct
+        self.hot_pct       = hot_pct
+        self.smoothing     = smoothing
+        self.every         = every
+        self.deadband      = deadband
+        self.freeze_on_ffc = freeze_on_ffc
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the bounds; the next frame sets them directly."""
+        self.bounds: Optional[Tuple[float, float]] = None
+        self.frozen = False
+        self._count = 0
+        self._lut: Optional[np.ndarray] = None
+
+    def update(self, raw: np.ndarray, telemetry: Any = None) -> Tuple[float, float]:
+        """
+        Advance the AGC by one frame.
+
+        Parameters
+        ----------
+        raw : np.ndarray
+            Thermal frame (uint16)
+        telemetry : Any
+            `Telemetry` or telemetry dict of the same frame, for FFC detection
+
+        Returns
+        -------
+        Tuple[float, float]
+            (lo, hi) bounds to stretch this frame with
+        """
+        state = _ffc_state(telemetry) if self.freeze_on_ffc else None
+        self.frozen = bool(state) and any(s in state for s in FFC_BUSY)
+
+        count = self._count
+        self._count += 1
+        if self.bounds is not None and (self.frozen or count % self.every):
+            return self.bounds
+
+        hist, offset = histogram(raw)
+        lo, hi = (float(v) for v in percentiles(
+            hist, self.cold_pct, self.hot_pct, offset=offset))
+        if self.bounds is not None:
+            old_lo, old_hi = self.bounds
+            if (abs(lo - old_lo) < self.deadband and
+                    abs(hi - old_hi) < self.deadband):
+                return self.bounds
+            k  = self.smoothing
+            lo = old_lo + k * (lo - old_lo)
+            hi = old_hi + k * (hi - old_hi)
+        if hi <= lo:                              # degenerate scene (all same)
+            hi = lo + 1.0
+
+        if (lo, hi) != self.bounds:
+            self.bounds = (lo, hi)
+            self._lut   = None
+        return self.bounds
+
+    def apply(self, raw: np.ndarray) -> np.ndarray:
+        """
+        Stretch a frame to 8 bits with the current bounds (no update).
+
+        Updates once first if no bounds have been set yet.
+        """
+        if self.bounds is None:
+            self.update(raw)
+        if self._lut is None:
+            self._lut = stretch_lut(*self.bounds)
+        # values above the 14-bit range clamp to the last (hot) entry
+        return np.take(self._lut, raw, mode="clip")
+
+    def __call__(self, raw: np.ndarray, telemetry: Any = None) -> np.ndarray:
+        """`update` then `apply`: the 8-bit image for this frame."""
+        self.update(raw, telemetry)
+        return self.apply(raw)
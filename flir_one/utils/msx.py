@@ -59,6 +59,10 @@ def overlay(bgr: np.ndarray,
     - Thermal  60×160 ↔ Mask 120×160  (mask down-samples 2× vertically)
     - Thermal 120×160 ↔ Mask 1080×1440 (mask down-samples 9× both directions)
 
+    Prefer `edge_rle.decode(buf, shape=(120, 160))` (or
+    `Camera(edge_mask_shape=(120, 160))`), which builds the small mask
+    directly and skips the full-HD array and the 9×9 reduction.
+
     Parameters
     ----------
     bgr : np.ndarray
@@ -3,20 +3,168 @@ False-color palettes for FLIR thermal images.
 
 Provides functions to colorize grayscale thermal data using
 various color schemes.
+
+Every palette is a 256×3 BGR table, so colorizing an 8-bit image is one
+gather. Tables come from a registry: OpenCV's colormaps, the `.npy` LUT
+files bundled in `flir_one/palettes` (iron, rainbow_hc, arctic, lava, …),
+and any table added with `register` or `load`. Each is validated once
+and cached as a read-only contiguous array.
+
+The bundled files are approximations of the FLIR camera palettes of the
+same names, interpolated from hand-picked colour stops (see
+`flir_one/palettes/generate.py`); they are not the vendor tables.
+
+For raw 14-bit frames `colour_lut` goes one step further and composes
+the gain stretch, the palette and the cold cutoff into a single
+16384-entry BGR table per (palette, lo, hi), kept in an LRU cache when
+the bounds are stable (e.g. from `AutoGain`); `colorize_raw` then turns
+a raw frame into colour with one fancy-index.
+Both accept `out=` to colorize into a preallocated image.
 """
 
 from __future__ import annotations
+import functools, threading
 import numpy as np
 import cv2
-from typing import Literal
+from pathlib import Path
+from typing import Dict, List, Literal, Optional
+
+from .gain import LEVELS, stretch_lut
+
+__all__ = ["Palette", "CACHE_SIZE", "PALETTE_DIR", "available", "register",
+           "load", "palette_table", "colorize", "colour_lut", "colorize_raw"]
+
+Palette = Literal["iron", "rainbow_hc", "arctic", "lava", "glowbow", "rainbow",
+                  "whitehot", "blackhot", "inferno", "turbo", "hot", "jet"]
+
+CACHE_SIZE  = 64                        # raw→BGR LUTs kept (48 KiB each)
+PALETTE_DIR = Path(__file__).resolve().parent.parent / "palettes"
+
+_COLORMAPS = {
+    "inferno": cv2.COLORMAP_INFERNO,
+    "rainbow": cv2.COLORMAP_RAINBOW,
+    "turbo":   cv2.COLORMAP_TURBO,
+    "hot":     cv2.COLORMAP_HOT,
+    "jet":     cv2.COLORMAP_JET,
+}
+
+
+_registry: Dict[str, np.ndarray] = {}
+_lock = threading.Lock()
+
 
-__all__ = ["Palette", "colorize"]
+def _validate(table: np.ndarray, name: str) -> np.ndarray:
+    """Check a palette table and return it as a read-only (256, 3) uint8."""
+    table = np.asarray(table)
+    if table.dtype != np.uint8 or table.size != 256 * 3 or table.shape[-1] != 3:
+        raise ValueError(f"palette {name!r}: expected 256×3 uint8 BGR table, "
+                         f"got {table.shape} {table.dtype}")
+    table = np.array(table.reshape(256, 3), order="C")   # own, contiguous copy
+    table.flags.writeable = False
+    return table
 
-Palette = Literal["iron", "rainbow", "whitehot", "blackhot", "inferno", "turbo", "hot", "jet"]
+
+def _builtin(name: str) -> Optional[np.ndarray]:
+    """Build a built-in palette table, or None if `name` is not one."""
+    ramp = np.arange(256, dtype=np.uint8).reshape(256, 1)
+    if name in _COLORMAPS:
+        return cv2.applyColorMap(ramp, _COLORMAPS[name])
+    if name == "whitehot":
+        return cv2.cvtColor(ramp, cv2.COLOR_GRAY2BGR)
+    if name == "blackhot":
+        return cv2.cvtColor(255 - ramp, cv2.COLOR_GRAY2BGR)
+    path = PALETTE_DIR / f"{name}.npy"
+    if path.is_file():
+        return np.load(path, allow_pickle=False)
+    return None
+
+
+def available() -> List[str]:
+    """Names of all palettes: built-in, bundled files and registered."""
+    names = set(_COLORMAPS) | {"whitehot", "blackhot"} | set(_registry)
+    names.update(p.stem for p in PALETTE_DIR.glob("*.npy"))
+    return sorted(names)
+
+
+def register(name: str, table: np.ndarray) -> None:
+    """
+    Add or replace a palette.
+
+    Parameters
+    ----------
+    name : str
+        Palette name (case-insensitive)
+    table : np.ndarray
+        256×3 uint8 BGR table (a 256×1×3 OpenCV LUT is accepted too)
+
+    Raises
+    ------
+    ValueError
+        If the table has the wrong shape or dtype
+    """
+    name  = name.lower()
+    table = _validate(table, name)
+    with _lock:
+        _registry[name] = table
+        _cut_table.cache_clear()             # drop LUTs built from the old one
+        _colour_lut.cache_clear()
+
+
+def load(path: str | Path, name: Optional[str] = None) -> str:
+    """
+    Register a palette from a `.npy` file.
+
+    Parameters
+    ----------
+    path : str | Path
+        File holding a 256×3 uint8 BGR array
+    name : Optional[str]
+        Palette name (default: the file stem)
+
+    Returns
+    -------
+    str
+        Name the palette was registered under
+    """
+    path = Path(path)
+    name = (name or path.stem).lower()
+    register(name, np.load(path, allow_pickle=False))
+    return name
+
+
+def palette_table(palette: Palette) -> np.ndarray:
+    """
+    256-entry BGR table of a palette.
+
+    Parameters
+    ----------
+    palette : Palette
+        Color palette name (case-insensitive, see `available`)
+
+    Returns
+    -------
+    np.ndarray
+        (256, 3) uint8, read-only
+
+    Raises
+    ------
+    ValueError
+        If palette name is unknown or its data file is invalid
+    """
+    name  = palette.lower()
+    table = _registry.get(name)
+    if table is None:
+        raw = _builtin(name)
+        if raw is None:
+            raise ValueError(f"unknown palette: {palette}")
+        with _lock:
+            table = _registry.setdefault(name, _validate(raw, name))
+    return table
 
 
 def colorize(gray8: np.ndarray,
-             palette: Palette = "iron") -> np.ndarray:
+             palette: Palette = "iron",
+             out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Apply false-color palette to grayscale thermal image.
 
@@ -26,11 +174,13 @@ def colorize(gray8: np.ndarray,
         Grayscale thermal image (uint8)
     palette : Palette
         Color palette name
+    out : Optional[np.ndarray]
+        Preallocated uint8 BGR image of shape `gray8.shape + (3,)`
 
     Returns
     -------
     np.ndarray
-        Colorized BGR image
+        Colorized BGR image (`out` if given)
 
     Raises
     ------
@@ -39,20 +189,101 @@ def colorize(gray8: np.ndarray,
     """
     if gray8.dtype != np.uint8:
         gray8 = gray8.astype(np.uint8)
+    return np.take(palette_table(palette), gray8, axis=0, out=out)
+
+
+@functools.lru_cache(maxsize=64)
+def _cut_table(palette: str, cold_cutoff: int) -> np.ndarray:
+    """Palette table with entries 0…cold_cutoff blacked out."""
+    table = palette_table(palette).copy()
+    table[:cold_cutoff + 1] = 0
+    return table
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _colour_lut(palette: str, lo: float, hi: float, cold_cutoff: int) -> np.ndarray:
+    table = _cut_table(palette, cold_cutoff)
+    # below floor(lo) the stretch clips to 0, above ceil(hi) to 255: only
+    # the span in between needs evaluating
+    a, b = 0, LEVELS
+    if hi > lo:
+        a = min(max(int(np.floor(lo)), 0), LEVELS)
+        b = min(max(int(np.ceil(hi)) + 1, a), LEVELS)
+    lut = np.empty((LEVELS, 3), np.uint8)
+    lut[:a] = table[0]
+    lut[b:] = table[255]
+    np.take(table, stretch_lut(lo, hi, b, a)[a:], axis=0, out=lut[a:b])
+    lut.flags.writeable = False
+    return lut
+
+
+def colour_lut(palette: Palette,
+               lo: float,
+               hi: float,
+               cold_cutoff: Optional[int] = None,
+               cache: bool = True) -> np.ndarray:
+    """
+    Raw 14-bit value → BGR table for one palette and stretch.
+
+    Entry `v` equals `palette[stretch(v)]`, or black where the stretched
+    value is at most `cold_cutoff`, exactly as stretching, colorizing and
+    masking each frame would give. Tables are LRU-cached on
+    (palette, lo, hi, cold_cutoff); stable bounds (e.g. `AutoGain` with
+    `every` or `deadband`) make almost every frame a cache hit. Bounds
+    that change every frame (per-frame percentiles) would only miss and
+    evict useful tables: pass `cache=False` for those.
+
+    Parameters
+    ----------
+    palette : Palette
+        Color palette name
+    lo, hi : float
+        Stretch bounds in raw counts (see `gain.bounds`)
+    cold_cutoff : Optional[int]
+        Stretched values ≤ this are drawn black (default: None, no cutoff)
+    cache : bool
+        Look up / store the table in the LRU cache (default: True)
+
+    Returns
+    -------
+    np.ndarray
+        (16384, 3) uint8, read-only (shared between callers if cached)
+    """
+    build = _colour_lut if cache else _colour_lut.__wrapped__
+    return build(palette.lower(), float(lo), float(hi),
+                 -1 if cold_cutoff is None else int(cold_cutoff))
+
+
+def colorize_raw(raw: np.ndarray,
+                 palette: Palette,
+                 lo: float,
+                 hi: float,
+                 cold_cutoff: Optional[int] = None,
+                 out: Optional[np.ndarray] = None,
+                 cache: bool = True) -> np.ndarray:
+    """
+    Stretch and colorize a raw thermal frame in one gather.
+
+    Parameters
+    ----------
+    raw : np.ndarray
+        Thermal frame (uint16)
+    palette : Palette
+        Color palette name
+    lo, hi : float
+        Stretch bounds in raw counts
+    cold_cutoff : Optional[int]
+        Stretched values ≤ this are drawn black (default: None)
+    out : Optional[np.ndarray]
+        Preallocated uint8 BGR image of shape `raw.shape + (3,)`
+    cache : bool
+        Cache the LUT (default: True; see `colour_lut`)
 
-    if palette == "iron" or palette == "inferno":
-        return cv2.applyColorMap(gray8, cv2.COLORMAP_INFERNO)
-    elif palette == "rainbow":
-        return cv2.applyColorMap(gray8, cv2.COLORMAP_RAINBOW)
-    elif palette == "turbo":
-        return cv2.applyColorMap(gray8, cv2.COLORMAP_TURBO)
-    elif palette == "hot":
-        return cv2.applyColorMap(gray8, cv2.COLORMAP_HOT)
-    elif palette == "jet":
-        return cv2.applyColorMap(gray8, cv2.COLORMAP_JET)
-    elif palette == "whitehot":
-        return cv2.cvtColor(gray8, cv2.COLOR_GRAY2BGR)
-    elif palette == "blackhot":
-        return cv2.cvtColor(255 - gray8, cv2.COLOR_GRAY2BGR)
-    else:
-        raise ValueError(f"unknown palette: {palette}")
+    Returns
+    -------
+    np.ndarray
+        Colorized BGR image, shape `raw.shape + (3,)` (`out` if given)
+    """
+    lut = colour_lut(palette, lo, hi, cold_cutoff, cache)
+    # values above the 14-bit range clamp to the last (hot) entry
+    return np.take(lut, raw, axis=0, mode="clip", out=out)
@@ -0,0 +1,153 @@
+"""
+Thermal → visible registration for FLIR One Pro fusion.
+
+The thermal and visible sensors have different fields of view and sit a
+short distance apart, so the thermal image is not simply the visible frame
+at lower resolution. A `Registration` places the thermal image inside the
+visible frame:
+
+- `scale`     – thermal image size relative to the visible frame
+                (1.0 = same field of view, > 1 = thermal sees more)
+- `offset`    – shift of the thermal centre at infinity, as a fraction of
+                the visible width / height
+- `parallax`  – extra shift at 1 m, in the same units; it falls off as
+                1 / `distance`, the distance of the subject in metres
+
+Calibrate `scale` and `offset` on a distant scene, then `parallax` on a
+near one. The `cv2.remap` maps for a given thermal size and output size are
+computed once and cached, together with the output rectangle the thermal
+image covers, so registering a frame costs one remap of that rectangle.
+That remap is still several times slower than the plain `cv2.resize` it
+replaces: at full 1440×1080 a registered fusion takes roughly 3-6× as
+long as the unregistered one. Blend at a reduced `output_size` (e.g.
+720×540) to bring it back to about the unregistered full-size cost.
+
+Example
+-------
+>>> reg = Registration(scale=1.1, offset=(0.01, -0.02), parallax=(0.015, 0.0))
+>>> near = reg.at(0.5)                       # subject at 50 cm
+>>> fused = fuse_visible_and_thermal(vis, raw, registration=near)
+"""
+from __future__ import annotations
+
+import dataclasses, functools, math
+from typing import Optional, Tuple
+
+import cv2, numpy as np
+
+__all__ = ["Registration", "ROI", "remap_maps", "warp"]
+
+ROI = Tuple[int, int, int, int]         # x0, y0, x1, y1 (exclusive)
+
+
+@dataclasses.dataclass(frozen=True)
+class Registration:
+    """
+    Geometric model mapping the thermal image onto the visible frame.
+
+    Attributes
+    ----------
+    scale : float
+        Thermal image size relative to the visible frame (default: 1.0)
+    offset : Tuple[float, float]
+        (x, y) shift of the thermal centre at infinity, in fractions of the
+        visible width / height (default: (0, 0))
+    parallax : Tuple[float, float]
+        (x, y) additional shift at 1 m, same units (default: (0, 0))
+    distance : float
+        Subject distance in metres used for parallax (default: inf)
+    """
+
+    scale: float = 1.0
+    offset: Tuple[float, float] = (0.0, 0.0)
+    parallax: Tuple[float, float] = (0.0, 0.0)
+    distance: float = math.inf
+
+    def at(self, distance: float) -> "Registration":
+        """Same model for a subject at `distance` metres."""
+        return dataclasses.replace(self, distance=float(distance))
+
+    @property
+    def shift(self) -> Tuple[float, float]:
+        """Total (x, y) shift at the current distance."""
+        k = 0.0 if math.isinf(self.distance) else 1.0 / self.distance
+        return (self.offset[0] + self.parallax[0] * k,
+                self.offset[1] + self.parallax[1] * k)
+
+
+@functools.lru_cache(maxsize=16)
+def remap_maps(reg: Registration,
+               thermal_size: Tuple[int, int],
+               out_size: Tuple[int, int]
+               ) -> Optional[Tuple[np.ndarray, np.ndarray, ROI]]:
+    """
+    `cv2.remap` maps sampling the thermal image for each in-view pixel.
+
+    Parameters
+    ----------
+    reg : Registration
+        Registration model
+    thermal_size : Tuple[int, int]
+        (width, height) of the thermal image
+    out_size : Tuple[int, int]
+        (width, height) of the output (visible) image
+
+    Returns
+    -------
+    Optional[Tuple[np.ndarray, np.ndarray, ROI]]
+        Fixed-point maps for `cv2.remap` covering only the output rectangle
+        inside the thermal field of view, and that rectangle. None if the
+        thermal image misses the output entirely. Cached: do not modify.
+    """
+    tw, th = thermal_size
+    ow, oh = out_size
+    dx, dy = reg.shift
+
+    # output pixel centre → normalised visible coords → thermal pixel coords
+    u  = (np.arange(ow, dtype=np.float32) + 0.5) / ow
+    v  = (np.arange(oh, dtype=np.float32) + 0.5) / oh
+    tx = ((u - 0.5 - dx) / reg.scale + 0.5) * tw - 0.5
+    ty = ((v - 0.5 - dy) / reg.scale + 0.5) * th - 0.5
+
+    # the model is axis-aligned, so the in-view area is a rectangle
+    in_x = np.flatnonzero((tx >= -0.5) & (tx <= tw - 0.5))
+    in_y = np.flatnonzero((ty >= -0.5) & (ty <= th - 0.5))
+    if not in_x.size or not in_y.size:
+        return None
+    x0, x1 = int(in_x[0]), int(in_x[-1]) + 1
+    y0, y1 = int(in_y[0]), int(in_y[-1]) + 1
+
+    map_x, map_y = np.meshgrid(tx[x0:x1], ty[y0:y1])
+    m1, m2 = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+    return m1, m2, (x0, y0, x1, y1)
+
+
+def warp(img: np.ndarray, reg: Registration,
+         out_size: Tuple[int, int]) -> Optional[Tuple[np.ndarray, ROI]]:
+    """
+    Register a (colorized) thermal image onto an output grid.
+
+    Parameters
+    ----------
+    img : np.ndarray
+        Thermal image (any dtype / channels `cv2.remap` accepts)
+    reg : Registration
+        Registration model
+    out_size : Tuple[int, int]
+        (width, height) of the output
+
+    Returns
+    -------
+    Optional[Tuple[np.ndarray, ROI]]
+        Registered image of the in-view rectangle only (edges repeated for
+        the half-pixel border, like `cv2.resize`) and that rectangle within
+        `out_size`; None if the thermal image is entirely out of view
+    """
+    h, w = img.shape[:2]
+    maps = remap_maps(reg, (w, h), tuple(out_size))
+    if maps is None:
+        return None
+    m1, m2, roi = maps
+    out = cv2.remap(img, m1, m2, cv2.INTER_LINEAR,
+                    borderMode=cv2.BORDER_REPLICATE)
+    return out, roi
@@ -54,7 +54,7 @@ setup(
     },
     package_data={
         "flir_one": [
-            "palettes/*.raw",
+            "palettes/*.npy",
         ],
     },
     include_package_data=True,
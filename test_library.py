@@ -73,7 +73,7 @@ def test_display_utils():
     try:
         import numpy as np
         import cv2
-        from flir_one.utils.palettes import colorize
+        from flir_one.utils.palettes import available, colorize
 
         # Create dummy thermal data
         thermal = np.random.randint(0, 255, (60, 80), dtype=np.uint8)
@@ -82,6 +82,12 @@ def test_display_utils():
         colored = colorize(thermal, "inferno")
         assert colored.shape == (60, 80, 3), "Unexpected output shape"
 
+        # Bundled LUT files are registered and colorize in place
+        assert {"iron", "arctic", "lava"} <= set(available()), \
+            "Bundled palettes missing"
+        out = np.empty((60, 80, 3), np.uint8)
+        assert colorize(thermal, "iron", out=out) is out, "out= not used"
+
         print("✓ Display utilities working")
         return True
 
@@ -90,6 +96,225 @@ def test_display_utils():
         return False
 
 
+def test_recording_roundtrip():
+    """Test hex chunk conversion to a binary recording and playback."""
+    print("\nTesting binary recording...")
+    try:
+        import tempfile
+        from flir_one.usb import io, recording
+
+        test_dir = Path("test_chunks")
+        with tempfile.TemporaryDirectory() as tmp:
+            rec_path = Path(tmp) / f"test{recording.SUFFIX}"
+            count = recording.convert_hex_dir(test_dir, rec_path)
+
+            hex_slices = list(io.load_chunks(test_dir))
+            rec_slices = list(io.load_chunks(rec_path))
+            assert count == len(hex_slices), "Slice count mismatch"
+            assert rec_slices == hex_slices, "Slice contents differ"
+
+        print(f"✓ Recording round-trip OK ({count} slices)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Recording test failed: {e}")
+        return False
+
+
+def test_recording_append():
+    """Test appending to a recording whose last record was cut off."""
+    print("\nTesting append after a truncated tail...")
+    try:
+        import tempfile
+        from flir_one.usb import recording
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rec_path = Path(tmp) / f"test{recording.SUFFIX}"
+            with recording.RecordingWriter(rec_path) as rec:
+                rec.write(b"first", 1)
+                rec.write(b"second", 2)
+            with open(rec_path, "r+b") as f:      # crash mid-record
+                f.truncate(rec_path.stat().st_size - 3)
+
+            with recording.RecordingWriter(rec_path) as rec:
+                rec.write(b"third", 3)
+
+            records = list(recording.iter_records(rec_path))
+            assert records == [(1, b"first"), (3, b"third")], \
+                f"Unexpected records after append: {records}"
+
+        print("✓ Append after truncated tail OK")
+        return True
+
+    except Exception as e:
+        print(f"✗ Recording append test failed: {e}")
+        return False
+
+
+def test_recording_seek():
+    """Test that seeking reproduces frames from sequential playback."""
+    print("\nTesting recording seek...")
+    try:
+        import tempfile
+        import numpy as np
+        from flir_one import Camera
+        from flir_one.usb import recording
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rec_path = Path(tmp) / f"test{recording.SUFFIX}"
+            recording.convert_hex_dir(Path("test_chunks"), rec_path)
+
+            frames = list(Camera(offline_dir=rec_path).stream())
+            target = frames[len(frames) // 2]
+
+            camera = Camera(offline_dir=rec_path)
+            camera.seek(target.idx)
+            frame = next(iter(camera.stream()))
+
+            assert frame.idx == target.idx, "Wrong frame index after seek"
+            assert np.array_equal(frame.thermal, target.thermal), \
+                "Thermal data differs after seek"
+
+        print(f"✓ Seek to frame {target.idx} OK")
+        return True
+
+    except Exception as e:
+        print(f"✗ Seek test failed: {e}")
+        return False
+
+
+def test_parallel_decode():
+    """Test that process-pool decoding matches sequential playback."""
+    print("\nTesting parallel offline decode...")
+    try:
+        import tempfile
+        import numpy as np
+        from flir_one import Camera
+        from flir_one.usb import recording
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rec_path = Path(tmp) / f"test{recording.SUFFIX}"
+            recording.convert_hex_dir(Path("test_chunks"), rec_path)
+
+            frames = list(Camera(offline_dir=rec_path).stream())
+            parallel = list(Camera(offline_dir=rec_path).stream_parallel(
+                workers=2, segment_frames=2))
+
+            assert [f.idx for f in parallel] == [f.idx for f in frames], \
+                "Frame order differs"
+            for a, b in zip(frames, parallel):
+                assert np.array_equal(a.thermal, b.thermal), "Thermal data differs"
+
+        print(f"✓ Parallel decode OK ({len(parallel)} frames)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Parallel decode test failed: {e}")
+        return False
+
+
+def test_shared_memory():
+    """Test publishing frames through the shared-memory ring."""
+    print("\nTesting shared-memory transport...")
+    try:
+        import numpy as np
+        from flir_one import Camera
+        from flir_one.shm import FramePublisher, FrameSubscriber
+
+        frames = list(Camera(offline_dir="test_chunks", visible_scale=4).stream())
+        with FramePublisher(slots=4, visible_shape=(270, 360, 3)) as pub, \
+             FrameSubscriber(pub.name) as sub:
+            for frame in frames:
+                pub.publish(frame)
+
+            assert sub.read(1) is None, "Overwritten slot still readable"
+            shared = sub.read(pub.seq)
+            assert shared is not None and shared.valid(), "Latest frame missing"
+            assert shared.idx == frames[-1].idx, "Wrong frame index"
+            assert np.array_equal(shared.thermal, frames[-1].thermal), \
+                "Thermal data differs"
+            assert np.array_equal(shared.visible, frames[-1].visible), \
+                "Visible image differs"
+            assert shared.telemetry == frames[-1].telemetry, \
+                "Telemetry differs"
+            del shared
+
+        print(f"✓ Shared-memory transport OK ({len(frames)} frames)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Shared-memory test failed: {e}")
+        return False
+
+
+def test_auto_gain():
+    """Test temporal AGC smoothing, update interval and FFC freeze."""
+    print("\nTesting stateful auto-gain...")
+    try:
+        import numpy as np
+        from flir_one.utils.gain import AutoGain, auto_gain
+
+        rng = np.random.default_rng(0)
+        cool = rng.integers(3000, 4000, (60, 80)).astype(np.uint16)
+        warm = cool + 2000
+
+        # No smoothing reproduces the per-frame stretch
+        grey, _, _ = auto_gain(warm)
+        assert np.array_equal(AutoGain(smoothing=1.0)(warm), grey), \
+            "Unsmoothed AGC differs from auto_gain"
+
+        agc = AutoGain(smoothing=0.5)
+        lo0, hi0 = agc.update(cool)
+        lo1, hi1 = agc.update(warm)
+        _, lo, hi = auto_gain(warm)
+        assert lo0 < lo1 < lo and hi0 < hi1 < hi, "Bounds not smoothed"
+
+        # Bounds held during FFC and between recompute frames
+        held = agc.update(cool, {"ffcState": "FFC_IN_PROGRESS"})
+        assert held == (lo1, hi1) and agc.frozen, "Bounds not frozen on FFC"
+        agc = AutoGain(every=3)
+        first = agc.update(cool)
+        assert agc.update(warm) == first and agc.update(warm) == first, \
+            "Bounds recomputed between intervals"
+        assert agc.update(warm) != first, "Bounds not recomputed on interval"
+
+        print("✓ Auto-gain OK")
+        return True
+
+    except Exception as e:
+        print(f"✗ Auto-gain test failed: {e}")
+        return False
+
+
+def test_concurrent_cameras():
+    """Test that interleaved streams do not share decoder state."""
+    print("\nTesting interleaved cameras...")
+    try:
+        import numpy as np
+        from flir_one import Camera
+
+        reference = list(Camera(offline_dir="test_chunks", lazy=False).stream())
+
+        # Advance two replays in lock-step so their slices interleave
+        a = Camera(offline_dir="test_chunks", lazy=False).stream()
+        b = Camera(offline_dir="test_chunks", lazy=False).stream()
+        for ref, fa, fb in zip(reference, a, b):
+            for frame in (fa, fb):
+                assert frame.idx == ref.idx, "Frame index differs"
+                assert np.array_equal(frame.thermal, ref.thermal), \
+                    "Thermal data differs"
+                assert (frame.visible is None) == (ref.visible is None) and \
+                    (ref.visible is None or np.array_equal(frame.visible, ref.visible)), \
+                    "Visible image differs"
+
+        print(f"✓ Interleaved cameras OK ({len(reference)} frames each)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Interleaved camera test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -102,6 +327,13 @@ def main():
     results.append(("Imports", test_imports()))
     results.append(("Camera (offline)", test_camera_offline()))
     results.append(("Display utilities", test_display_utils()))
+    results.append(("Binary recording", test_recording_roundtrip()))
+    results.append(("Recording append", test_recording_append()))
+    results.append(("Recording seek", test_recording_seek()))
+    results.append(("Interleaved cameras", test_concurrent_cameras()))
+    results.append(("Parallel decode", test_parallel_decode()))
+    results.append(("Shared memory", test_shared_memory()))
+    results.append(("Auto-gain", test_auto_gain()))
 
     # Summary
     print("\n" + "=" * 60)